@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 import logging.handlers
 import os
@@ -15,12 +15,19 @@ from typing import TYPE_CHECKING, Any
 import voluptuous as vol
 import yarl
 
-from homeassistant import config as conf_util, config_entries, core, loader
+from homeassistant import (
+    config as conf_util,
+    config_entries,
+    core,
+    loader,
+    requirements,
+)
 from homeassistant.components import http
 from homeassistant.const import REQUIRED_NEXT_PYTHON_DATE, REQUIRED_NEXT_PYTHON_VER
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import area_registry, device_registry, entity_registry
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
     DATA_SETUP,
@@ -32,7 +39,11 @@ from homeassistant.setup import (
 from homeassistant.util.async_ import gather_with_concurrency
 import homeassistant.util.dt as dt_util
 from homeassistant.util.logging import async_activate_log_queue_handler
-from homeassistant.util.package import async_get_user_site, is_virtual_env
+from homeassistant.util.package import (
+    async_get_user_site,
+    get_installed_versions,
+    is_virtual_env,
+)
 
 if TYPE_CHECKING:
     from .runner import RuntimeConfig
@@ -48,6 +59,9 @@ LOG_SLOW_STARTUP_INTERVAL = 60
 SLOW_STARTUP_CHECK_INTERVAL = 1
 SIGNAL_BOOTSTRAP_INTEGRATONS = "bootstrap_integrations"
 
+STARTUP_REPORT_STORAGE_KEY = "core.startup_report"
+STARTUP_REPORT_STORAGE_VERSION = 1
+
 STAGE_1_TIMEOUT = 120
 STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
@@ -107,12 +121,19 @@ async def async_setup_hass(
 
     _LOGGER.info("Config directory: %s", runtime_config.config_dir)
 
+    await loader.async_load_manifest_index(hass)
+
     config_dict = None
     basic_setup_success = False
 
     if not (safe_mode := runtime_config.safe_mode):
         await hass.async_add_executor_job(conf_util.process_ha_config_upgrade, hass)
 
+        # Reuse the parsed files of the configuration that did not change
+        hass.data[conf_util.DATA_YAML_CACHE_DIR] = hass.config.path(
+            STORAGE_DIR, conf_util.YAML_CACHE_DIR
+        )
+
         try:
             config_dict = await conf_util.async_hass_config_yaml(hass)
         except HomeAssistantError as err:
@@ -369,6 +390,7 @@ async def async_mount_local_lib_path(config_dir: str) -> str:
     deps_dir = os.path.join(config_dir, "deps")
     if (lib_dir := await async_get_user_site(deps_dir)) not in sys.path:
         sys.path.insert(0, lib_dir)
+        get_installed_versions.cache_clear()
     return deps_dir
 
 
@@ -444,6 +466,7 @@ async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
     """Set up all the integrations."""
+    start = monotonic()
     hass.data[DATA_SETUP_STARTED] = {}
     setup_time = hass.data[DATA_SETUP_TIME] = {}
 
@@ -576,3 +599,41 @@ async def _async_set_up_integrations(
             )
         },
     )
+
+    requirements_timings = requirements.async_get_timings(hass)
+    _LOGGER.debug(
+        "Checked %d requirements in %.3fs, requirement install times: %s",
+        requirements_timings.checked,
+        requirements_timings.check_time,
+        requirements_timings.install_times,
+    )
+
+    hass.async_create_task(
+        _async_save_startup_report(hass, monotonic() - start, setup_time)
+    )
+
+
+async def _async_save_startup_report(
+    hass: core.HomeAssistant, total_time: float, setup_time: dict[str, timedelta]
+) -> None:
+    """Store how long the integrations took to import and set up."""
+    import_times: dict[str, float] = hass.data.get(loader.DATA_IMPORT_TIMES, {})
+    store = Store(hass, STARTUP_REPORT_STORAGE_VERSION, STARTUP_REPORT_STORAGE_KEY)
+    await store.async_save(
+        {
+            "created": dt_util.utcnow().isoformat(),
+            "total_time": total_time,
+            "setup_times": {
+                integration: time_taken.total_seconds()
+                for integration, time_taken in sorted(
+                    setup_time.items(), key=lambda item: item[1], reverse=True
+                )
+            },
+            "import_times": {
+                name: import_time
+                for name, import_time in sorted(
+                    import_times.items(), key=lambda item: item[1], reverse=True
+                )
+            },
+        }
+    )
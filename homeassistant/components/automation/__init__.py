@@ -62,6 +62,7 @@ from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_set,
     trace_append_element,
+    trace_enabled,
     trace_get,
     trace_path,
 )
@@ -732,6 +733,13 @@ async def _async_process_if(hass, name, config, p_config):
 
     def if_action(variables=None):
         """AND all conditions."""
+        if not trace_enabled():
+            try:
+                return all(check(hass, variables) for check in checks)
+            except ConditionError:
+                # Evaluate the conditions again to log the errors in full
+                pass
+
         errors = []
         for index, check in enumerate(checks):
             try:
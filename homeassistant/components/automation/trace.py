@@ -4,9 +4,14 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import Any
 
-from homeassistant.components.trace import ActionTrace, async_store_trace
+from homeassistant.components.trace import (
+    ActionTrace,
+    async_get_capture,
+    async_store_trace,
+)
 from homeassistant.components.trace.const import CONF_STORED_TRACES
 from homeassistant.core import Context
+from homeassistant.helpers.trace import TRACE_CAPTURE_OFF, trace_capture_cv
 
 # mypy: allow-untyped-calls, allow-untyped-defs
 # mypy: no-check-untyped-defs, no-warn-return-any
@@ -44,7 +49,10 @@ def trace_automation(
 ):
     """Trace action execution of automation with automation_id."""
     trace = AutomationTrace(automation_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    capture = async_get_capture(hass, trace_config)
+    if capture != TRACE_CAPTURE_OFF:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    token = trace_capture_cv.set(capture)
 
     try:
         yield trace
@@ -53,5 +61,6 @@ def trace_automation(
             trace.set_error(ex)
         raise ex
     finally:
+        trace_capture_cv.reset(token)
         if automation_id:
             trace.finished()
@@ -179,7 +179,10 @@ async def _async_get_image(
                     assert width is not None
                     assert height is not None
                     return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
+                        content_type,
+                        await camera.hass.async_add_process_job(
+                            scale_jpeg_camera_image, image, width, height
+                        ),
                     )
 
                 return image
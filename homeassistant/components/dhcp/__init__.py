@@ -3,9 +3,12 @@
 from abc import abstractmethod
 from datetime import timedelta
 import fnmatch
+from functools import lru_cache
 from ipaddress import ip_address as make_ip_address
+from itertools import chain
 import logging
 import os
+import re
 import threading
 
 from aiodiscover import DiscoverHosts
@@ -51,6 +54,11 @@ IP_ADDRESS = "ip"
 DHCP_REQUEST = 3
 SCAN_INTERVAL = timedelta(minutes=60)
 
+# Number of recently seen MAC address and hostname pairs whose matches are kept
+MATCH_CACHE_SIZE = 1024
+# MAC address patterns that only match on the OUI are indexed by it
+OUI_PATTERN = re.compile(r"[0-9A-F]{6}\*")
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -77,6 +85,55 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     return True
 
 
+def _compile_pattern(pattern):
+    """Compile a shell-style pattern of a matcher."""
+    if pattern is None:
+        return None
+    return re.compile(fnmatch.translate(pattern))
+
+
+class IntegrationMatchers:
+    """The dhcp matchers of all integrations, compiled for fast lookups.
+
+    Matchers on the OUI of the MAC address are indexed by it, the patterns of
+    all other matchers are compiled to regular expressions. The matches of
+    recently seen devices are cached, most of them match no integration.
+    """
+
+    def __init__(self, integration_matchers):
+        """Compile the matchers."""
+        self._by_oui = {}
+        self._unindexed = []
+
+        for index, entry in enumerate(integration_matchers):
+            mac_pattern = entry.get(MAC_ADDRESS)
+            hostname_re = _compile_pattern(entry.get(HOSTNAME))
+
+            if mac_pattern is not None and OUI_PATTERN.fullmatch(mac_pattern):
+                self._by_oui.setdefault(mac_pattern[:6], []).append(
+                    (index, entry, None, hostname_re)
+                )
+            else:
+                self._unindexed.append(
+                    (index, entry, _compile_pattern(mac_pattern), hostname_re)
+                )
+
+        self.match = lru_cache(maxsize=MATCH_CACHE_SIZE)(self._match)
+
+    def _match(self, uppercase_mac, lowercase_hostname):
+        """Return the matchers of a device in manifest order."""
+        matched = [
+            (index, entry)
+            for index, entry, mac_re, hostname_re in chain(
+                self._by_oui.get(uppercase_mac[:6], ()), self._unindexed
+            )
+            if (mac_re is None or mac_re.match(uppercase_mac))
+            and (hostname_re is None or hostname_re.match(lowercase_hostname))
+        ]
+        matched.sort(key=lambda item: item[0])
+        return tuple(entry for _, entry in matched)
+
+
 class WatcherBase:
     """Base class for dhcp and device tracker watching."""
 
@@ -85,7 +142,7 @@ class WatcherBase:
         super().__init__()
 
         self.hass = hass
-        self._integration_matchers = integration_matchers
+        self._integration_matchers = IntegrationMatchers(integration_matchers)
         self._address_data = address_data
 
     def process_client(self, ip_address, hostname, mac_address):
@@ -127,17 +184,9 @@ class WatcherBase:
             lowercase_hostname,
         )
 
-        for entry in self._integration_matchers:
-            if MAC_ADDRESS in entry and not fnmatch.fnmatch(
-                uppercase_mac, entry[MAC_ADDRESS]
-            ):
-                continue
-
-            if HOSTNAME in entry and not fnmatch.fnmatch(
-                lowercase_hostname, entry[HOSTNAME]
-            ):
-                continue
-
+        for entry in self._integration_matchers.match(
+            uppercase_mac, lowercase_hostname
+        ):
             _LOGGER.debug("Matched %s against %s", data, entry)
 
             self.create_task(
@@ -1,13 +1,16 @@
 """Allows the creation of a sensor that filters state property."""
 from __future__ import annotations
 
+from array import array
+import asyncio
+from bisect import bisect_left, bisect_right, insort
 from collections import Counter, deque
-from copy import copy
-from datetime import timedelta
+from collections.abc import Iterator
+from datetime import datetime, timedelta
 from functools import partial
 import logging
+import math
 from numbers import Number
-import statistics
 
 import voluptuous as vol
 
@@ -30,7 +33,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, State, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.reload import async_setup_reload_service
@@ -72,6 +75,11 @@ DEFAULT_FILTER_TIME_CONSTANT = 10
 NAME_TEMPLATE = "{} filter"
 ICON = "mdi:chart-line-variant"
 
+DATA_HISTORY_LOADER = "filter_history_loader"
+# Seconds the sensors set up together wait for each other to load their
+# history from the recorder in one batch
+HISTORY_BATCH_DELAY = 0.1
+
 FILTER_SCHEMA = vol.Schema(
     {vol.Optional(CONF_FILTER_PRECISION, default=DEFAULT_PRECISION): vol.Coerce(int)}
 )
@@ -214,21 +222,21 @@ class SensorFilter(SensorEntity):
             self.async_write_ha_state()
             return
 
-        temp_state = new_state
+        fstate = FilterState(new_state)
 
         try:
             for filt in self._filters:
-                filtered_state = filt.filter_state(copy(temp_state))
+                value = fstate.state
+                filt.filter(fstate)
                 _LOGGER.debug(
                     "%s(%s=%s) -> %s",
                     filt.name,
                     self._entity,
-                    temp_state.state,
-                    "skip" if filt.skip_processing else filtered_state.state,
+                    value,
+                    "skip" if filt.skip_processing else fstate.state,
                 )
                 if filt.skip_processing:
                     return
-                temp_state = filtered_state
         except ValueError:
             _LOGGER.error(
                 "Could not convert state: %s (%s) to number",
@@ -237,7 +245,7 @@ class SensorFilter(SensorEntity):
             )
             return
 
-        self._state = temp_state.state
+        self._state = fstate.state
 
         if self._icon is None:
             self._icon = new_state.attributes.get(ATTR_ICON, ICON)
@@ -260,7 +268,6 @@ class SensorFilter(SensorEntity):
         """Register callbacks."""
 
         if "recorder" in self.hass.config.components:
-            history_list = []
             largest_window_items = 0
             largest_window_time = timedelta(0)
 
@@ -277,48 +284,19 @@ class SensorFilter(SensorEntity):
                 ):
                     largest_window_time = filt.window_size
 
-            # Retrieve the largest window_size of each type
-            if largest_window_items > 0:
-                filter_history = await self.hass.async_add_executor_job(
-                    partial(
-                        history.get_last_state_changes,
-                        self.hass,
-                        largest_window_items,
-                        entity_id=self._entity,
-                    )
+            if largest_window_items > 0 or largest_window_time > timedelta(0):
+                history_list = await _async_get_history_loader(self.hass).async_load(
+                    self._entity, largest_window_items, largest_window_time
                 )
-                if self._entity in filter_history:
-                    history_list.extend(filter_history[self._entity])
-            if largest_window_time > timedelta(seconds=0):
-                start = dt_util.utcnow() - largest_window_time
-                filter_history = await self.hass.async_add_executor_job(
-                    partial(
-                        history.state_changes_during_period,
-                        self.hass,
-                        start,
-                        entity_id=self._entity,
-                    )
+                _LOGGER.debug(
+                    "Loading from history: %s",
+                    [(s.state, s.last_updated) for s in history_list],
                 )
-                if self._entity in filter_history:
-                    history_list.extend(
-                        [
-                            state
-                            for state in filter_history[self._entity]
-                            if state not in history_list
-                        ]
-                    )
-
-            # Sort the window states
-            history_list = sorted(history_list, key=lambda s: s.last_updated)
-            _LOGGER.debug(
-                "Loading from history: %s",
-                [(s.state, s.last_updated) for s in history_list],
-            )
 
-            # Replay history through the filter chain
-            for state in history_list:
-                if state.state not in [STATE_UNKNOWN, STATE_UNAVAILABLE, None]:
-                    self._update_filter_sensor_state(state, False)
+                # Replay history through the filter chain
+                for state in history_list:
+                    if state.state not in [STATE_UNKNOWN, STATE_UNAVAILABLE, None]:
+                        self._update_filter_sensor_state(state, False)
 
         self.async_on_remove(
             async_track_state_change_event(
@@ -362,6 +340,120 @@ class SensorFilter(SensorEntity):
         return self._device_class
 
 
+@callback
+def _async_get_history_loader(hass: HomeAssistant) -> HistoryLoader:
+    """Return the loader the filter sensors share."""
+    if (loader := hass.data.get(DATA_HISTORY_LOADER)) is None:
+        loader = hass.data[DATA_HISTORY_LOADER] = HistoryLoader(hass)
+    return loader
+
+
+class HistoryLoader:
+    """Load the history the filter sensors are primed with in batches.
+
+    The sensors set up together ask for their history within a short delay,
+    which is then read with one recorder job for all of them.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the loader."""
+        self.hass = hass
+        self._requests: list[tuple[str, int, timedelta, asyncio.Future]] = []
+        self._flush: asyncio.Task | None = None
+
+    async def async_load(
+        self, entity_id: str, window_items: int, window_time: timedelta
+    ) -> list[State]:
+        """Return the last window_items changes and the window_time of history."""
+        future = self.hass.loop.create_future()
+        self._requests.append((entity_id, window_items, window_time, future))
+        if self._flush is None:
+            self._flush = self.hass.async_create_task(self._async_flush())
+        return await future
+
+    async def _async_flush(self) -> None:
+        """Load the history of all the sensors that asked for it."""
+        await asyncio.sleep(HISTORY_BATCH_DELAY)
+        requests, self._requests = self._requests, []
+        self._flush = None
+
+        now = dt_util.utcnow()
+        entity_ids = list(dict.fromkeys(request[0] for request in requests))
+        largest_window_items = max(request[1] for request in requests)
+        largest_window_time = max(request[2] for request in requests)
+        start = now - largest_window_time if largest_window_time else None
+
+        try:
+            filter_history = await self.hass.async_add_executor_job(
+                partial(
+                    history.get_last_state_changes_for_entities,
+                    self.hass,
+                    largest_window_items,
+                    entity_ids,
+                    start_time=start,
+                )
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            for *_, future in requests:
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        for entity_id, window_items, window_time, future in requests:
+            if future.done():
+                continue
+            changes = sorted(
+                filter_history.get(entity_id, []), key=lambda s: s.last_updated
+            )
+            # The recorder adds the state at the start of the largest window
+            initial = None
+            for index, state in enumerate(changes):
+                if state.last_updated == start:
+                    initial = changes.pop(index)
+                    break
+            future.set_result(
+                _history_window(
+                    changes,
+                    initial,
+                    window_items,
+                    now - window_time if window_time else None,
+                )
+            )
+
+
+def _history_window(
+    changes: list[State],
+    initial: State | None,
+    window_items: int,
+    start: datetime | None,
+) -> list[State]:
+    """Return the last window_items changes and the changes since start.
+
+    The changes since start begin with the state at start, which is the last
+    change before start or the initial state if there was none.
+    """
+    first = max(len(changes) - window_items, 0)
+    if start is None:
+        return changes[first:]
+
+    since = bisect_right([state.last_updated for state in changes], start)
+    if since > first:
+        return changes[first:]
+
+    at_start = changes[since - 1] if since else initial
+    if at_start is None:
+        return changes[since:]
+    if at_start.last_updated != start:
+        at_start = State(
+            at_start.entity_id,
+            at_start.state,
+            at_start.attributes,
+            last_changed=start,
+            last_updated=start,
+        )
+    return [at_start, *changes[since:]]
+
+
 class FilterState:
     """State abstraction for filter usage."""
 
@@ -388,6 +480,52 @@ class FilterState:
         return f"{self.timestamp} : {self.state}"
 
 
+class RingBuffer:
+    """A window of the last maxlen numbers, stored in an array of doubles."""
+
+    def __init__(self, maxlen: int) -> None:
+        """Initialize the buffer."""
+        self.maxlen = maxlen
+        self._values = array("d", bytes(8 * maxlen))
+        self._start = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        """Return the number of values in the buffer."""
+        return self._len
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate over the values from oldest to newest."""
+        for index in range(self._len):
+            yield self._values[(self._start + index) % self.maxlen]
+
+    def __getitem__(self, index: int) -> float:
+        """Return a value of the buffer, the oldest one has index 0."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("RingBuffer index out of range")
+        return self._values[(self._start + index) % self.maxlen]
+
+    def append(self, value: float) -> float | None:
+        """Add a value and return the oldest one if it was pushed out."""
+        if not self.maxlen:
+            return None
+        if self._len < self.maxlen:
+            self._values[(self._start + self._len) % self.maxlen] = value
+            self._len += 1
+            return None
+        oldest = self._values[self._start]
+        self._values[self._start] = value
+        self._start = (self._start + 1) % self.maxlen
+        return oldest
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._start = 0
+        self._len = 0
+
+
 class Filter:
     """Filter skeleton."""
 
@@ -405,10 +543,10 @@ class Filter:
         :param entity: used for debugging only
         """
         if isinstance(window_size, int):
-            self.states: deque = deque(maxlen=window_size)
+            self.states = RingBuffer(window_size)
             self.window_unit = WINDOW_SIZE_UNIT_NUMBER_EVENTS
         else:
-            self.states = deque(maxlen=0)
+            self.states = RingBuffer(0)
             self.window_unit = WINDOW_SIZE_UNIT_TIME
         self.precision = precision
         self._name = name
@@ -437,19 +575,24 @@ class Filter:
         """Implement filter."""
         raise NotImplementedError()
 
-    def filter_state(self, new_state):
-        """Implement a common interface for filters."""
-        fstate = FilterState(new_state)
+    def _store(self, raw, filtered):
+        """Store a value in the window of the filter."""
+        self.states.append(raw if self._store_raw else filtered)
+
+    def filter(self, fstate):
+        """Filter a FilterState in place."""
         if self._only_numbers and not isinstance(fstate.state, Number):
             raise ValueError(f"State <{fstate.state}> is not a Number")
 
+        raw = fstate.state
         filtered = self._filter_state(fstate)
         filtered.set_precision(self.precision)
-        if self._store_raw:
-            self.states.append(copy(FilterState(new_state)))
-        else:
-            self.states.append(copy(filtered))
-        new_state.state = filtered.state
+        self._store(raw, filtered.state)
+        return filtered
+
+    def filter_state(self, new_state):
+        """Implement a common interface for filters."""
+        new_state.state = self.filter(FilterState(new_state)).state
         return new_state
 
 
@@ -524,11 +667,29 @@ class OutlierFilter(Filter, SensorEntity):
         self._radius = radius
         self._stats_internal: Counter = Counter()
         self._store_raw = True
+        self._sorted: list[float] = []
+
+    def _store(self, raw, filtered):
+        """Store a raw value in the window and keep the sorted window up to date."""
+        if (oldest := self.states.append(raw)) is not None:
+            del self._sorted[bisect_left(self._sorted, oldest)]
+        if self.states.maxlen:
+            insort(self._sorted, raw)
+
+    def _median(self):
+        """Return the median of the window."""
+        data = self._sorted
+        if not data:
+            return 0
+        middle = len(data) // 2
+        if len(data) % 2:
+            return data[middle]
+        return (data[middle - 1] + data[middle]) / 2
 
     def _filter_state(self, new_state):
         """Implement the outlier filter."""
 
-        median = statistics.median([s.state for s in self.states]) if self.states else 0
+        median = self._median()
         if (
             len(self.states) == self.states.maxlen
             and abs(new_state.state - median) > self._radius
@@ -563,9 +724,7 @@ class LowPassFilter(Filter, SensorEntity):
 
         new_weight = 1.0 / self._time_constant
         prev_weight = 1.0 - new_weight
-        new_state.state = (
-            prev_weight * self.states[-1].state + new_weight * new_state.state
-        )
+        new_state.state = prev_weight * self.states[-1] + new_weight * new_state.state
 
         return new_state
 
@@ -586,32 +745,55 @@ class TimeSMAFilter(Filter, SensorEntity):
         """
         super().__init__(FILTER_NAME_TIME_SMA, window_size, precision, entity)
         self._time_window = window_size
-        self.last_leak = None
-        self.queue = deque()
+        self.last_leak: tuple[datetime, float] | None = None
+        self.queue: deque[tuple[datetime, float]] = deque()
+        # The integral of the values between the first and the last timestamp
+        # of the queue, updated as values are queued and leak
+        self._inner_sum = 0.0
+        self._leaked = 0
 
     def _leak(self, left_boundary):
         """Remove timeouted elements."""
-        while self.queue:
-            if self.queue[0].timestamp + self._time_window <= left_boundary:
-                self.last_leak = self.queue.popleft()
-            else:
-                return
+        queue = self.queue
+        while queue and queue[0][0] + self._time_window <= left_boundary:
+            self.last_leak = queue.popleft()
+            if queue:
+                self._inner_sum -= (
+                    queue[0][0] - self.last_leak[0]
+                ).total_seconds() * self.last_leak[1]
+            self._leaked += 1
+
+        if not queue:
+            self._inner_sum = 0.0
+            self._leaked = 0
+        elif self._leaked >= len(queue):
+            # Recompute the integral so rounding errors can't build up
+            self._leaked = 0
+            self._inner_sum = math.fsum(
+                (queue[index][0] - queue[index - 1][0]).total_seconds()
+                * queue[index - 1][1]
+                for index in range(1, len(queue))
+            )
 
     def _filter_state(self, new_state):
         """Implement the Simple Moving Average filter."""
 
         self._leak(new_state.timestamp)
-        self.queue.append(copy(new_state))
-
-        moving_sum = 0
+        if self.queue:
+            last_timestamp, last_value = self.queue[-1]
+            self._inner_sum += (
+                new_state.timestamp - last_timestamp
+            ).total_seconds() * last_value
+        self.queue.append((new_state.timestamp, new_state.state))
+
+        first_timestamp, first_value = self.queue[0]
+        prev_value = self.last_leak[1] if self.last_leak else first_value
         start = new_state.timestamp - self._time_window
-        prev_state = self.last_leak or self.queue[0]
-        for state in self.queue:
-            moving_sum += (state.timestamp - start).total_seconds() * prev_state.state
-            start = state.timestamp
-            prev_state = state
+        moving_sum = (first_timestamp - start).total_seconds() * prev_value
 
-        new_state.state = moving_sum / self._time_window.total_seconds()
+        new_state.state = (
+            moving_sum + self._inner_sum
+        ) / self._time_window.total_seconds()
 
         return new_state
 
@@ -627,11 +809,17 @@ class ThrottleFilter(Filter, SensorEntity):
         """Initialize Filter."""
         super().__init__(FILTER_NAME_THROTTLE, window_size, precision, entity)
         self._only_numbers = False
+        # The number of states received in the current window
+        self._count = 0
+
+    def _store(self, raw, filtered):
+        """Count the state in the current window."""
+        self._count = min(self._count + 1, self._window_size)
 
     def _filter_state(self, new_state):
         """Implement the throttle filter."""
-        if not self.states or len(self.states) == self.states.maxlen:
-            self.states.clear()
+        if not self._count or self._count == self._window_size:
+            self._count = 0
             self._skip_processing = False
         else:
             self._skip_processing = True
@@ -440,7 +440,9 @@ class Group(Entity):
         self._icon = icon
         self._set_tracked(entity_ids)
         self._on_off = None
+        self._on_count = 0
         self._assumed = None
+        self._assumed_count = 0
         self._on_states = None
         self.user_defined = user_defined
         self.mode = any
@@ -673,7 +675,9 @@ class Group(Entity):
     def _reset_tracked_state(self):
         """Reset tracked state."""
         self._on_off = {}
+        self._on_count = 0
         self._assumed = {}
+        self._assumed_count = 0
         self._on_states = set()
 
         for entity_id in self.trackable:
@@ -683,12 +687,19 @@ class Group(Entity):
                 self._see_state(state)
 
     def _see_state(self, new_state):
-        """Keep track of the the state."""
+        """Keep track of the the state.
+
+        The number of members that are on or have an assumed state is updated
+        with the delta of the changed member only.
+        """
         entity_id = new_state.entity_id
         domain = new_state.domain
         state = new_state.state
         registry = self.hass.data[REG_KEY]
-        self._assumed[entity_id] = new_state.attributes.get(ATTR_ASSUMED_STATE)
+
+        assumed = bool(new_state.attributes.get(ATTR_ASSUMED_STATE))
+        self._assumed_count += assumed - self._assumed.get(entity_id, False)
+        self._assumed[entity_id] = assumed
 
         if domain not in registry.on_states_by_domain:
             # Handle the group of a group case
@@ -696,12 +707,20 @@ class Group(Entity):
                 self._on_states.add(state)
             elif state in registry.off_on_mapping:
                 self._on_states.add(registry.off_on_mapping[state])
-            self._on_off[entity_id] = state in registry.on_off_mapping
+            is_on = state in registry.on_off_mapping
         else:
             entity_on_state = registry.on_states_by_domain[domain]
-            if domain in self.hass.data[REG_KEY].on_states_by_domain:
-                self._on_states.update(entity_on_state)
-            self._on_off[entity_id] = state in entity_on_state
+            self._on_states.update(entity_on_state)
+            is_on = state in entity_on_state
+
+        self._on_count += is_on - self._on_off.get(entity_id, False)
+        self._on_off[entity_id] = is_on
+
+    def _async_mode_result(self, count, total):
+        """Apply the group mode to the number of members that match."""
+        if self.mode is all:
+            return count == total
+        return count > 0
 
     @callback
     def _async_update_group_state(self, tr_state=None):
@@ -724,7 +743,9 @@ class Group(Entity):
             or self._assumed_state
             and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
         ):
-            self._assumed_state = self.mode(self._assumed.values())
+            self._assumed_state = self._async_mode_result(
+                self._assumed_count, len(self._assumed)
+            )
 
         elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
             self._assumed_state = True
@@ -744,7 +765,7 @@ class Group(Entity):
         # on state, we use STATE_ON/STATE_OFF
         else:
             on_state = STATE_ON
-        group_is_on = self.mode(self._on_off.values())
+        group_is_on = self._async_mode_result(self._on_count, len(self._on_off))
         if group_is_on:
             self._state = on_state
         else:
@@ -120,6 +120,10 @@ class HistoryStatsSensor(SensorEntity):
         self._period = (datetime.datetime.now(), datetime.datetime.now())
         self.value = None
         self.count = None
+        # Timestamps from which on the changes of the entity are known, and
+        # whether the entity was in one of the measured states after each change
+        self._history_start = None
+        self._history = []
 
     async def async_added_to_hass(self):
         """Create listeners when the entity is added."""
@@ -133,10 +137,17 @@ class HistoryStatsSensor(SensorEntity):
                 """Force the component to refresh."""
                 self.async_schedule_update_ha_state(True)
 
+            @callback
+            def state_changed(event):
+                """Record the state change and refresh."""
+                if self._history_start is not None:
+                    self._async_add_state(event.data.get("new_state"))
+                force_refresh()
+
             force_refresh()
             self.async_on_remove(
                 async_track_state_change_event(
-                    self.hass, [self._entity_id], force_refresh
+                    self.hass, [self._entity_id], state_changed
                 )
             )
 
@@ -188,9 +199,6 @@ class HistoryStatsSensor(SensorEntity):
 
     async def async_update(self):
         """Get the latest data and updates the states."""
-        # Get previous values of start and end
-        p_start, p_end = self._period
-
         # Parse templates
         self.update_period()
         start, end = self._period
@@ -198,50 +206,81 @@ class HistoryStatsSensor(SensorEntity):
         # Convert times to UTC
         start = dt_util.as_utc(start)
         end = dt_util.as_utc(end)
-        p_start = dt_util.as_utc(p_start)
-        p_end = dt_util.as_utc(p_end)
-        now = datetime.datetime.now()
 
-        # Compute integer timestamps
+        # Compute the integer timestamp of the start
         start_timestamp = math.floor(dt_util.as_timestamp(start))
-        end_timestamp = math.floor(dt_util.as_timestamp(end))
-        p_start_timestamp = math.floor(dt_util.as_timestamp(p_start))
-        p_end_timestamp = math.floor(dt_util.as_timestamp(p_end))
-        now_timestamp = math.floor(dt_util.as_timestamp(now))
-
-        # If period has not changed and current time after the period end...
-        if (
-            start_timestamp == p_start_timestamp
-            and end_timestamp == p_end_timestamp
-            and end_timestamp <= now_timestamp
-        ):
-            # Don't compute anything as the value cannot have changed
-            return
 
-        await self.hass.async_add_executor_job(
-            self._update, start, end, now_timestamp, start_timestamp, end_timestamp
-        )
+        # The changes are read from the database once, and when the period moved
+        # back in time. Afterwards they are recorded as they happen.
+        if self._history_start is None or start_timestamp < self._history_start:
+            self._history = await self.hass.async_add_executor_job(
+                self._load_history, start, start_timestamp
+            )
+            self._history_start = start_timestamp
+            self._async_add_state(self.hass.states.get(self._entity_id))
+        self._async_trim_history(start_timestamp)
 
-    def _update(self, start, end, now_timestamp, start_timestamp, end_timestamp):
-        # Get history between start and end
+        # Changes of the current second count, so the end isn't rounded down
+        self._update(dt_util.utcnow().timestamp(), start_timestamp, end.timestamp())
+
+    def _load_history(self, start, start_timestamp):
+        """Read the changes of the entity since the start of the period."""
         history_list = history.state_changes_during_period(
-            self.hass, start, end, str(self._entity_id)
+            self.hass, start, None, str(self._entity_id)
         )
 
-        if self._entity_id not in history_list:
-            return
-
         # Get the first state
+        changes = []
         last_state = history.get_state(self.hass, start, self._entity_id)
-        last_state = last_state is not None and last_state in self._entity_states
+        if last_state is not None:
+            changes.append((start_timestamp, last_state.state in self._entity_states))
+
+        for item in history_list.get(self._entity_id, []):
+            changes.append(
+                (item.last_changed.timestamp(), item.state in self._entity_states)
+            )
+        return changes
+
+    @callback
+    def _async_add_state(self, state):
+        """Record a change of the entity which isn't known yet."""
+        if state is None:
+            return
+        changed = state.last_changed.timestamp()
+        if not self._history or self._history[-1][0] < changed:
+            self._history.append((changed, state.state in self._entity_states))
+
+    @callback
+    def _async_trim_history(self, start_timestamp):
+        """Forget the changes before the change the period starts with."""
+        first = 0
+        while (
+            first + 1 < len(self._history)
+            and self._history[first + 1][0] <= start_timestamp
+        ):
+            first += 1
+        if first:
+            del self._history[:first]
+        self._history_start = max(self._history_start, start_timestamp)
+
+    def _update(self, now_timestamp, start_timestamp, end_timestamp):
+        """Compute the time and count of the measured states during the period."""
+        if not self._history:
+            return
+
+        last_state = False
         last_time = start_timestamp
+        measure_end = min(end_timestamp, now_timestamp)
         elapsed = 0
         count = 0
 
         # Make calculations
-        for item in history_list.get(self._entity_id):
-            current_state = item.state in self._entity_states
-            current_time = item.last_changed.timestamp()
+        for current_time, current_state in self._history:
+            if current_time <= start_timestamp:
+                last_state = current_state
+                continue
+            if current_time > measure_end:
+                break
 
             if last_state:
                 elapsed += current_time - last_time
@@ -253,7 +292,6 @@ class HistoryStatsSensor(SensorEntity):
 
         # Count time elapsed between last history state and end of measure
         if last_state:
-            measure_end = min(end_timestamp, now_timestamp)
             elapsed += measure_end - last_time
 
         # Save value in hours
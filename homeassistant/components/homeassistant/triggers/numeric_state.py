@@ -1,5 +1,10 @@
 """Offer numeric state listening automation rules."""
+from __future__ import annotations
+
+from datetime import timedelta
+from functools import partial
 import logging
+from typing import Any
 
 import voluptuous as vol
 
@@ -19,6 +24,11 @@ from homeassistant.helpers.event import (
     async_track_same_state,
     async_track_state_change_event,
 )
+from homeassistant.helpers.trigger import (
+    SharedTrigger,
+    TriggerSubscriber,
+    async_get_shared_trigger,
+)
 
 # mypy: allow-incomplete-defs, allow-untyped-calls, allow-untyped-defs
 # mypy: no-check-untyped-defs
@@ -62,141 +72,226 @@ TRIGGER_SCHEMA = vol.All(
 _LOGGER = logging.getLogger(__name__)
 
 
-async def async_attach_trigger(
-    hass, config, action, automation_info, *, platform_type="numeric_state"
-) -> CALLBACK_TYPE:
-    """Listen for state changes based on configuration."""
-    entity_ids = config.get(CONF_ENTITY_ID)
-    below = config.get(CONF_BELOW)
-    above = config.get(CONF_ABOVE)
-    time_delta = config.get(CONF_FOR)
-    template.attach(hass, time_delta)
-    value_template = config.get(CONF_VALUE_TEMPLATE)
-    unsub_track_same = {}
-    armed_entities = set()
-    period: dict = {}
-    attribute = config.get(CONF_ATTRIBUTE)
-    job = HassJob(action)
+class NumericStateTrigger(SharedTrigger):
+    """Listen for the numeric state of an entity for all its subscribers."""
 
-    trigger_data = automation_info["trigger_data"]
-    _variables = automation_info["variables"] or {}
+    def __init__(self, hass, key, config, entity_id, variables) -> None:
+        """Initialize the trigger."""
+        super().__init__(hass, key)
+        self._entity_id = entity_id
+        self._below = config.get(CONF_BELOW)
+        self._above = config.get(CONF_ABOVE)
+        self._time_delta = config.get(CONF_FOR)
+        self._value_template = config.get(CONF_VALUE_TEMPLATE)
+        self._attribute = config.get(CONF_ATTRIBUTE)
+        # Only used to render the templates of a trigger that is not shared
+        self._variables = variables
+        # The subscribers that are ready to fire, each automation is armed
+        # once the entity is outside the range after it subscribed.
+        self._armed: set[TriggerSubscriber] = set()
 
-    if value_template is not None:
-        value_template.hass = hass
-
-    def variables(entity_id):
+    def variables(self):
         """Return a dict with trigger variables."""
         trigger_info = {
             "trigger": {
                 "platform": "numeric_state",
-                "entity_id": entity_id,
-                "below": below,
-                "above": above,
-                "attribute": attribute,
+                "entity_id": self._entity_id,
+                "below": self._below,
+                "above": self._above,
+                "attribute": self._attribute,
             }
         }
-        return {**_variables, **trigger_info}
+        return {**self._variables, **trigger_info}
 
     @callback
-    def check_numeric_state(entity_id, from_s, to_s):
+    def check_numeric_state(self, to_s):
         """Return whether the criteria are met, raise ConditionError if unknown."""
         return condition.async_numeric_state(
-            hass, to_s, below, above, value_template, variables(entity_id), attribute
+            self.hass,
+            to_s,
+            self._below,
+            self._above,
+            self._value_template,
+            self.variables(),
+            self._attribute,
         )
 
-    # Each entity that starts outside the range is already armed (ready to fire).
-    for entity_id in entity_ids:
+    @callback
+    def async_subscribe(self, subscriber: TriggerSubscriber) -> CALLBACK_TYPE:
+        """Subscribe to the trigger, armed if the entity starts outside the range."""
         try:
-            if not check_numeric_state(entity_id, None, entity_id):
-                armed_entities.add(entity_id)
+            if not self.check_numeric_state(self._entity_id):
+                self._armed.add(subscriber)
         except exceptions.ConditionError as ex:
-            _LOGGER.warning(
-                "Error initializing '%s' trigger: %s",
-                automation_info["name"],
-                ex,
-            )
+            _LOGGER.warning("Error initializing '%s' trigger: %s", subscriber.name, ex)
 
-    @callback
-    def state_automation_listener(event):
-        """Listen for state changes and calls action."""
-        entity_id = event.data.get("entity_id")
-        from_s = event.data.get("old_state")
-        to_s = event.data.get("new_state")
+        unsubscribe = super().async_subscribe(subscriber)
 
         @callback
-        def call_action():
-            """Call action with right context."""
-            hass.async_run_hass_job(
-                job,
-                {
-                    "trigger": {
-                        **trigger_data,
-                        "platform": platform_type,
-                        "entity_id": entity_id,
-                        "below": below,
-                        "above": above,
-                        "from_state": from_s,
-                        "to_state": to_s,
-                        "for": time_delta if not time_delta else period[entity_id],
-                        "description": f"numeric state of {entity_id}",
-                    }
-                },
-                to_s.context,
-            )
+        def async_unsubscribe():
+            """Unsubscribe from the trigger."""
+            self._armed.discard(subscriber)
+            unsubscribe()
+
+        return async_unsubscribe
+
+    @callback
+    def _async_attach(self) -> CALLBACK_TYPE:
+        """Start listening for state changes."""
+        hass = self.hass
+        entity_id = self._entity_id
+        time_delta = self._time_delta
+        below = self._below
+        above = self._above
+        unsub_track_same: list[CALLBACK_TYPE] = []
 
         @callback
         def check_numeric_state_no_raise(entity_id, from_s, to_s):
             """Return True if the criteria are now met, False otherwise."""
             try:
-                return check_numeric_state(entity_id, from_s, to_s)
+                return self.check_numeric_state(to_s)
             except exceptions.ConditionError:
                 # This is an internal same-state listener so we just drop the
                 # error. The same error will be reached and logged by the
                 # primary async_track_state_change_event() listener.
                 return False
 
-        try:
-            matching = check_numeric_state(entity_id, from_s, to_s)
-        except exceptions.ConditionError as ex:
-            _LOGGER.warning("Error in '%s' trigger: %s", automation_info["name"], ex)
-            return
-
-        if not matching:
-            armed_entities.add(entity_id)
-        elif entity_id in armed_entities:
-            armed_entities.discard(entity_id)
-
-            if time_delta:
-                try:
-                    period[entity_id] = cv.positive_time_period(
-                        template.render_complex(time_delta, variables(entity_id))
-                    )
-                except (exceptions.TemplateError, vol.Invalid) as ex:
+        @callback
+        def state_automation_listener(event):
+            """Listen for state changes and calls action."""
+            from_s = event.data.get("old_state")
+            to_s = event.data.get("new_state")
+
+            try:
+                matching = self.check_numeric_state(to_s)
+            except exceptions.ConditionError as ex:
+                for subscriber in self.subscribers:
+                    _LOGGER.warning("Error in '%s' trigger: %s", subscriber.name, ex)
+                return
+
+            if not matching:
+                self._armed.update(self.subscribers)
+                return
+
+            subscribers = [
+                subscriber
+                for subscriber in self.subscribers
+                if subscriber in self._armed
+            ]
+            if not subscribers:
+                return
+            self._armed.difference_update(subscribers)
+
+            @callback
+            def call_action(period=None):
+                """Call action with right context."""
+                self.async_fire(
+                    subscribers,
+                    {
+                        "entity_id": entity_id,
+                        "below": below,
+                        "above": above,
+                        "from_state": from_s,
+                        "to_state": to_s,
+                        "for": period,
+                        "description": f"numeric state of {entity_id}",
+                    },
+                    to_s.context,
+                )
+
+            if not time_delta:
+                call_action(time_delta)
+                return
+
+            try:
+                period = cv.positive_time_period(
+                    template.render_complex(time_delta, self.variables())
+                )
+            except (exceptions.TemplateError, vol.Invalid) as ex:
+                for subscriber in subscribers:
                     _LOGGER.error(
-                        "Error rendering '%s' for template: %s",
-                        automation_info["name"],
-                        ex,
+                        "Error rendering '%s' for template: %s", subscriber.name, ex
                     )
-                    return
+                return
 
-                unsub_track_same[entity_id] = async_track_same_state(
+            # A running period was cancelled when the entity left the range
+            # to arm these subscribers, unless an error interrupted it.
+            for async_remove in unsub_track_same:
+                async_remove()
+            unsub_track_same[:] = [
+                async_track_same_state(
                     hass,
-                    period[entity_id],
-                    call_action,
+                    period,
+                    partial(call_action, period),
                     entity_ids=entity_id,
                     async_check_same_func=check_numeric_state_no_raise,
                 )
-            else:
-                call_action()
+            ]
+
+        unsub = async_track_state_change_event(
+            hass, entity_id, state_automation_listener
+        )
+
+        @callback
+        def async_remove():
+            """Remove state listeners async."""
+            unsub()
+            for async_remove in unsub_track_same:
+                async_remove()
+            unsub_track_same.clear()
 
-    unsub = async_track_state_change_event(hass, entity_ids, state_automation_listener)
+        return async_remove
+
+
+async def async_attach_trigger(
+    hass, config, action, automation_info, *, platform_type="numeric_state"
+) -> CALLBACK_TYPE:
+    """Listen for state changes based on configuration."""
+    time_delta = config.get(CONF_FOR)
+    template.attach(hass, time_delta)
+    value_template = config.get(CONF_VALUE_TEMPLATE)
+    if value_template is not None:
+        value_template.hass = hass
+
+    subscriber = TriggerSubscriber(
+        HassJob(action),
+        automation_info["trigger_data"],
+        platform_type,
+        automation_info["name"],
+    )
+    # Automations with the same trigger share its listener, unless a template
+    # is rendered with the variables of the automation.
+    shared = value_template is None and (
+        time_delta is None or isinstance(time_delta, timedelta)
+    )
+    variables: dict[str, Any] = {} if shared else automation_info["variables"] or {}
+    unsubs = []
+
+    for entity_id in cv.entity_ids(config[CONF_ENTITY_ID]):
+
+        def factory(key, entity_id=entity_id):
+            """Create the trigger of an entity."""
+            return NumericStateTrigger(hass, key, config, entity_id, variables)
+
+        if shared:
+            key = (
+                "numeric_state",
+                entity_id,
+                config.get(CONF_BELOW),
+                config.get(CONF_ABOVE),
+                config.get(CONF_ATTRIBUTE),
+                time_delta,
+            )
+            trigger = async_get_shared_trigger(hass, key, factory)
+        else:
+            trigger = factory(None)
+        unsubs.append(trigger.async_subscribe(subscriber))
 
     @callback
     def async_remove():
         """Remove state listeners async."""
-        unsub()
-        for async_remove in unsub_track_same.values():
-            async_remove()
-        unsub_track_same.clear()
+        for unsub in unsubs:
+            unsub()
+        unsubs.clear()
 
     return async_remove
@@ -1,7 +1,9 @@
 """Offer state listening automation rules."""
 from __future__ import annotations
 
+from collections.abc import Hashable
 from datetime import timedelta
+from functools import partial
 import logging
 from typing import Any
 
@@ -17,6 +19,11 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
     process_state_match,
 )
+from homeassistant.helpers.trigger import (
+    SharedTrigger,
+    TriggerSubscriber,
+    async_get_shared_trigger,
+)
 
 # mypy: allow-incomplete-defs, allow-untyped-calls, allow-untyped-defs
 # mypy: no-check-untyped-defs
@@ -65,141 +72,217 @@ def TRIGGER_SCHEMA(value: Any) -> dict:  # pylint: disable=invalid-name
     return TRIGGER_STATE_SCHEMA(value)
 
 
-async def async_attach_trigger(
-    hass: HomeAssistant,
-    config,
-    action,
-    automation_info,
-    *,
-    platform_type: str = "state",
-) -> CALLBACK_TYPE:
-    """Listen for state changes based on configuration."""
-    entity_id = config.get(CONF_ENTITY_ID)
-    from_state = config.get(CONF_FROM, MATCH_ALL)
-    to_state = config.get(CONF_TO, MATCH_ALL)
-    time_delta = config.get(CONF_FOR)
-    template.attach(hass, time_delta)
-    match_all = from_state == MATCH_ALL and to_state == MATCH_ALL
-    unsub_track_same = {}
-    period: dict[str, timedelta] = {}
-    match_from_state = process_state_match(from_state)
-    match_to_state = process_state_match(to_state)
-    attribute = config.get(CONF_ATTRIBUTE)
-    job = HassJob(action)
-
-    trigger_data = automation_info["trigger_data"]
-    _variables = automation_info["variables"] or {}
+def _freeze(value: Any) -> Any:
+    """Return a hashable version of a from or to state."""
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+class StateTrigger(SharedTrigger):
+    """Listen for the state changes of an entity for all its subscribers."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: Hashable | None,
+        config: dict[str, Any],
+        entity_id: str,
+        variables: dict[str, Any],
+    ) -> None:
+        """Initialize the trigger."""
+        super().__init__(hass, key)
+        self._entity_id = entity_id
+        self._from_state = config.get(CONF_FROM, MATCH_ALL)
+        self._to_state = config.get(CONF_TO, MATCH_ALL)
+        self._has_from = CONF_FROM in config
+        self._has_to = CONF_TO in config
+        self._time_delta = config.get(CONF_FOR)
+        self._attribute = config.get(CONF_ATTRIBUTE)
+        # Only used to render the period of a trigger that is not shared
+        self._variables = variables
 
     @callback
-    def state_automation_listener(event: Event):
-        """Listen for state changes and calls action."""
-        entity: str = event.data["entity_id"]
-        from_s: State | None = event.data.get("old_state")
-        to_s: State | None = event.data.get("new_state")
-
-        if from_s is None:
-            old_value = None
-        elif attribute is None:
-            old_value = from_s.state
-        else:
-            old_value = from_s.attributes.get(attribute)
-
-        if to_s is None:
-            new_value = None
-        elif attribute is None:
-            new_value = to_s.state
-        else:
-            new_value = to_s.attributes.get(attribute)
-
-        # When we listen for state changes with `match_all`, we
-        # will trigger even if just an attribute changes. When
-        # we listen to just an attribute, we should ignore all
-        # other attribute changes.
-        if attribute is not None and old_value == new_value:
-            return
-
-        if (
-            not match_from_state(old_value)
-            or not match_to_state(new_value)
-            or (not match_all and old_value == new_value)
-        ):
-            return
+    def _async_attach(self) -> CALLBACK_TYPE:
+        """Start listening for state changes."""
+        hass = self.hass
+        from_state = self._from_state
+        to_state = self._to_state
+        time_delta = self._time_delta
+        attribute = self._attribute
+        match_all = from_state == MATCH_ALL and to_state == MATCH_ALL
+        match_from_state = process_state_match(from_state)
+        match_to_state = process_state_match(to_state)
+        unsub_track_same: dict[str, CALLBACK_TYPE] = {}
 
         @callback
-        def call_action():
-            """Call action with right context."""
-            hass.async_run_hass_job(
-                job,
-                {
-                    "trigger": {
-                        **trigger_data,
-                        "platform": platform_type,
+        def state_automation_listener(event: Event) -> None:
+            """Listen for state changes and calls action."""
+            entity: str = event.data["entity_id"]
+            from_s: State | None = event.data.get("old_state")
+            to_s: State | None = event.data.get("new_state")
+
+            if from_s is None:
+                old_value = None
+            elif attribute is None:
+                old_value = from_s.state
+            else:
+                old_value = from_s.attributes.get(attribute)
+
+            if to_s is None:
+                new_value = None
+            elif attribute is None:
+                new_value = to_s.state
+            else:
+                new_value = to_s.attributes.get(attribute)
+
+            # When we listen for state changes with `match_all`, we
+            # will trigger even if just an attribute changes. When
+            # we listen to just an attribute, we should ignore all
+            # other attribute changes.
+            if attribute is not None and old_value == new_value:
+                return
+
+            if (
+                not match_from_state(old_value)
+                or not match_to_state(new_value)
+                or (not match_all and old_value == new_value)
+            ):
+                return
+
+            # Automations that subscribe while waiting for the period did
+            # not see the state change, so only call the current subscribers.
+            subscribers = list(self.subscribers)
+
+            @callback
+            def call_action(period: timedelta | None = None) -> None:
+                """Call action with right context."""
+                self.async_fire(
+                    subscribers,
+                    {
                         "entity_id": entity,
                         "from_state": from_s,
                         "to_state": to_s,
-                        "for": time_delta if not time_delta else period[entity],
+                        "for": period,
                         "attribute": attribute,
                         "description": f"state of {entity}",
-                    }
-                },
-                event.context,
-            )
-
-        if not time_delta:
-            call_action()
-            return
-
-        trigger_info = {
-            "trigger": {
-                "platform": "state",
-                "entity_id": entity,
-                "from_state": from_s,
-                "to_state": to_s,
+                    },
+                    event.context,
+                )
+
+            if not time_delta:
+                call_action(time_delta)
+                return
+
+            trigger_info = {
+                "trigger": {
+                    "platform": "state",
+                    "entity_id": entity,
+                    "from_state": from_s,
+                    "to_state": to_s,
+                }
             }
-        }
-        variables = {**_variables, **trigger_info}
-
-        try:
-            period[entity] = cv.positive_time_period(
-                template.render_complex(time_delta, variables)
-            )
-        except (exceptions.TemplateError, vol.Invalid) as ex:
-            _LOGGER.error(
-                "Error rendering '%s' for template: %s", automation_info["name"], ex
+            variables = {**self._variables, **trigger_info}
+
+            try:
+                period: timedelta = cv.positive_time_period(
+                    template.render_complex(time_delta, variables)
+                )
+            except (exceptions.TemplateError, vol.Invalid) as ex:
+                for subscriber in subscribers:
+                    _LOGGER.error(
+                        "Error rendering '%s' for template: %s", subscriber.name, ex
+                    )
+                return
+
+            def _check_same_state(_, _2, new_st: State | None) -> bool:
+                if new_st is None:
+                    return False
+
+                cur_value: str | None
+                if attribute is None:
+                    cur_value = new_st.state
+                else:
+                    cur_value = new_st.attributes.get(attribute)
+
+                if self._has_from and not self._has_to:
+                    return cur_value != old_value
+
+                return cur_value == new_value
+
+            unsub_track_same[entity] = async_track_same_state(
+                hass,
+                period,
+                partial(call_action, period),
+                _check_same_state,
+                entity_ids=entity,
             )
-            return
 
-        def _check_same_state(_, _2, new_st: State | None) -> bool:
-            if new_st is None:
-                return False
-
-            cur_value: str | None
-            if attribute is None:
-                cur_value = new_st.state
-            else:
-                cur_value = new_st.attributes.get(attribute)
+        unsub = async_track_state_change_event(
+            hass, self._entity_id, state_automation_listener
+        )
 
-            if CONF_FROM in config and CONF_TO not in config:
-                return cur_value != old_value
+        @callback
+        def async_remove() -> None:
+            """Remove state listeners async."""
+            unsub()
+            for async_remove in unsub_track_same.values():
+                async_remove()
+            unsub_track_same.clear()
 
-            return cur_value == new_value
+        return async_remove
 
-        unsub_track_same[entity] = async_track_same_state(
-            hass,
-            period[entity],
-            call_action,
-            _check_same_state,
-            entity_ids=entity,
-        )
 
-    unsub = async_track_state_change_event(hass, entity_id, state_automation_listener)
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config,
+    action,
+    automation_info,
+    *,
+    platform_type: str = "state",
+) -> CALLBACK_TYPE:
+    """Listen for state changes based on configuration."""
+    time_delta = config.get(CONF_FOR)
+    template.attach(hass, time_delta)
+    subscriber = TriggerSubscriber(
+        HassJob(action),
+        automation_info["trigger_data"],
+        platform_type,
+        automation_info["name"],
+    )
+    # Automations with the same trigger share its listener, unless the period
+    # is a template which is rendered with the variables of the automation.
+    shared = time_delta is None or isinstance(time_delta, timedelta)
+    variables: dict[str, Any] = {} if shared else automation_info["variables"] or {}
+    unsubs = []
+
+    for entity_id in cv.entity_ids(config[CONF_ENTITY_ID]):
+
+        def factory(key, entity_id=entity_id):
+            """Create the trigger of an entity."""
+            return StateTrigger(hass, key, config, entity_id, variables)
+
+        if shared:
+            key = (
+                "state",
+                entity_id,
+                _freeze(config.get(CONF_FROM, MATCH_ALL)),
+                _freeze(config.get(CONF_TO, MATCH_ALL)),
+                CONF_FROM in config,
+                CONF_TO in config,
+                config.get(CONF_ATTRIBUTE),
+                time_delta,
+            )
+            trigger = async_get_shared_trigger(hass, key, factory)
+        else:
+            trigger = factory(None)
+        unsubs.append(trigger.async_subscribe(subscriber))
 
     @callback
     def async_remove():
         """Remove state listeners async."""
-        unsub()
-        for async_remove in unsub_track_same.values():
-            async_remove()
-        unsub_track_same.clear()
+        for unsub in unsubs:
+            unsub()
+        unsubs.clear()
 
     return async_remove
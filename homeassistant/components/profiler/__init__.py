@@ -14,14 +14,18 @@ import objgraph
 from pyprof2calltree import convert
 import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
+from homeassistant.helpers import polling
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.util.executor import MeteredThreadPoolExecutor
 
-from .const import DOMAIN
+from .const import DATA_SAMPLER, DOMAIN
+from .sampler import LoopSampler
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -48,6 +52,8 @@ CONF_SECONDS = "seconds"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
+PLATFORMS = ["sensor"]
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -56,6 +62,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     lock = asyncio.Lock()
     domain_data = hass.data[DOMAIN] = {}
 
+    sampler = domain_data[DATA_SAMPLER] = LoopSampler(hass, threading.get_ident())
+    sampler.start()
+
+    async def _async_stop_sampler(event: Event) -> None:
+        await sampler.async_stop()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_sampler)
+    )
+
     async def _async_run_profile(call: ServiceCall):
         async with lock:
             await _async_generate_profile(hass, call)
@@ -191,11 +207,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _async_dump_scheduled,
     )
 
+    websocket_api.async_register_command(hass, websocket_integration_load)
+    websocket_api.async_register_command(hass, websocket_executor_pools)
+    websocket_api.async_register_command(hass, websocket_polling)
+    hass.config_entries.async_setup_platforms(entry, PLATFORMS)
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    await hass.data[DOMAIN][DATA_SAMPLER].async_stop()
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
@@ -204,6 +227,57 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/integration_load"})
+@websocket_api.async_response
+async def websocket_integration_load(
+    hass: HomeAssistant,
+    connection: websocket_api.connection.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Return the sampled load of the event loop and the integrations."""
+    if DOMAIN not in hass.data:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Profiler is not loaded"
+        )
+        return
+
+    sampler: LoopSampler = hass.data[DOMAIN][DATA_SAMPLER]
+    connection.send_result(msg["id"], await sampler.async_get_statistics())
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/executor_pools"})
+@callback
+def websocket_executor_pools(
+    hass: HomeAssistant,
+    connection: websocket_api.connection.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Return the queue and job statistics of the executor pools."""
+    pools = []
+    # pylint: disable=protected-access
+    default_executor = getattr(hass.loop, "_default_executor", None)
+    if isinstance(default_executor, MeteredThreadPoolExecutor):
+        pools.append(default_executor.get_statistics())
+    pools.extend(pool.get_statistics() for pool in hass.executor_pools.pools.values())
+    connection.send_result(msg["id"], pools)
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "profiler/polling"})
+@callback
+def websocket_polling(
+    hass: HomeAssistant,
+    connection: websocket_api.connection.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Return the poll latency and overruns of the polling entity platforms."""
+    connection.send_result(
+        msg["id"], polling.async_get_scheduler(hass).async_get_statistics()
+    )
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     start_time = int(time.time() * 1000000)
     hass.components.persistent_notification.async_create(
@@ -2,3 +2,5 @@
 
 DOMAIN = "profiler"
 DEFAULT_NAME = "Profiler"
+
+DATA_SAMPLER = "sampler"
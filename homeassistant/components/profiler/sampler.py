@@ -0,0 +1,263 @@
+"""Sample the threads of Home Assistant to attribute their load to integrations."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+import inspect
+import sys
+import threading
+import time
+from types import FrameType
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity
+from homeassistant.util.executor import (
+    EXECUTOR_THREAD_NAME_PREFIX,
+    integration_of_module,
+)
+
+# Seconds between samples. The interval grows while sampling takes more than
+# MAX_OVERHEAD of the time and shrinks back once it takes much less.
+DEFAULT_INTERVAL = 0.01
+MAX_INTERVAL = 0.5
+MAX_OVERHEAD = 0.02
+# Seconds of samples the statistics are computed over
+WINDOW = 300
+# Number of estimated durations of blocking callbacks kept per integration
+DURATION_SAMPLES = 200
+
+KIND_CALLBACK = "callback"
+KIND_TASK = "task"
+KIND_STATE_WRITE = "state_write"
+KIND_EXECUTOR = "executor"
+
+# pylint: disable=protected-access
+_HANDLE_RUN_CODE = asyncio.Handle._run.__code__
+_STATE_WRITE_CODE = Entity._async_write_ha_state.__code__
+# pylint: enable=protected-access
+
+
+def _percentile(values: list[float], percentile: float) -> float | None:
+    """Return the percentile of a sorted list of values."""
+    if not values:
+        return None
+    return values[min(len(values) - 1, int(len(values) * percentile))]
+
+
+@dataclass
+class IntegrationLoad:
+    """Sampled load of an integration."""
+
+    # Time, kind and weight in seconds of each sample
+    samples: deque[tuple[float, str, float]] = field(default_factory=deque)
+    durations: deque[float] = field(
+        default_factory=lambda: deque(maxlen=DURATION_SAMPLES)
+    )
+
+
+class LoopSampler:
+    """Attribute the time spent in the event loop and executor to integrations.
+
+    The stacks of the event loop thread and the executor threads are sampled
+    from a background thread. Each sample is attributed to the outermost
+    integration on the stack, which is the integration whose job the loop or
+    executor is running. Consecutive samples of the same callback estimate how
+    long it blocked the event loop.
+    """
+
+    def __init__(self, hass: HomeAssistant, loop_thread_id: int) -> None:
+        """Initialize the sampler."""
+        self.hass = hass
+        self.interval = DEFAULT_INTERVAL
+        self.overhead = 0.0
+        self._loop_thread_id = loop_thread_id
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._file_domains: dict[str, str | None] = {}
+        self._integrations: dict[str, IntegrationLoad] = {}
+        # Time, weight and whether the loop was busy for each sample
+        self._loop_samples: deque[tuple[float, float, bool]] = deque()
+        self._last_sample = time.monotonic()
+        # The callback the loop was running at the previous sample
+        self._run_frame: FrameType | None = None
+        self._run_domain: str | None = None
+        self._run_duration = 0.0
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._last_sample = time.monotonic()
+        self._thread = threading.Thread(
+            target=self._run, name="ProfilerLoopSampler", daemon=True
+        )
+        self._thread.start()
+
+    async def async_stop(self) -> None:
+        """Stop sampling."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        await self.hass.async_add_executor_job(self._thread.join)
+        self._thread = None
+
+    def _run(self) -> None:
+        """Sample until stopped."""
+        while not self._stop_event.wait(self.interval):
+            start = time.perf_counter()
+            # pylint: disable=protected-access
+            self.sample(sys._current_frames(), time.monotonic())
+            elapsed = time.perf_counter() - start
+            self.overhead = elapsed / (elapsed + self.interval)
+
+            if self.overhead > MAX_OVERHEAD:
+                self.interval = min(self.interval * 2, MAX_INTERVAL)
+            elif self.overhead < MAX_OVERHEAD / 4:
+                self.interval = max(self.interval / 2, DEFAULT_INTERVAL)
+
+    def sample(self, frames: dict[int, FrameType], now: float) -> None:
+        """Attribute a sample of the stacks of the threads."""
+        weight = now - self._last_sample
+        self._last_sample = now
+        executor_thread_ids = [
+            thread.ident
+            for thread in threading.enumerate()
+            if thread.name.startswith(EXECUTOR_THREAD_NAME_PREFIX)
+        ]
+
+        with self._lock:
+            if (loop_frame := frames.get(self._loop_thread_id)) is not None:
+                self._sample_loop(loop_frame, now, weight)
+            else:
+                self._finish_run()
+                self._run_frame = None
+
+            for thread_id in executor_thread_ids:
+                if (frame := frames.get(thread_id)) is None:
+                    continue
+                if (domain := self._outermost_domain(frame)) is not None:
+                    self._add_sample(domain, now, KIND_EXECUTOR, weight)
+
+    def _sample_loop(self, frame: FrameType, now: float, weight: float) -> None:
+        """Attribute a sample of the stack of the event loop thread."""
+        # The loop waits for IO in the selector when it has nothing to run
+        busy = frame.f_globals.get("__name__") != "selectors"
+        self._loop_samples.append((now, weight, busy))
+        while self._loop_samples and self._loop_samples[0][0] < now - WINDOW:
+            self._loop_samples.popleft()
+
+        domain = None
+        kind = KIND_CALLBACK
+        run_frame = None
+
+        if busy:
+            current: FrameType | None = frame
+            while current is not None:
+                code = current.f_code
+                if code is _STATE_WRITE_CODE:
+                    kind = KIND_STATE_WRITE
+                elif kind == KIND_CALLBACK and code.co_flags & inspect.CO_COROUTINE:
+                    kind = KIND_TASK
+                elif code is _HANDLE_RUN_CODE:
+                    run_frame = current
+                if (code_domain := self._domain_of_code(current)) is not None:
+                    domain = code_domain
+                current = current.f_back
+
+        if run_frame is None or run_frame is not self._run_frame:
+            self._finish_run()
+            self._run_frame = run_frame
+
+        if domain is not None:
+            self._run_domain = domain
+            self._add_sample(domain, now, kind, weight)
+        if run_frame is not None:
+            self._run_duration += weight
+
+    def _finish_run(self) -> None:
+        """Record how long the previous callback blocked the event loop."""
+        if self._run_domain is not None:
+            self._integrations[self._run_domain].durations.append(self._run_duration)
+        self._run_domain = None
+        self._run_duration = 0.0
+
+    def _outermost_domain(self, frame: FrameType) -> str | None:
+        """Return the outermost integration on a stack."""
+        domain = None
+        current: FrameType | None = frame
+        while current is not None:
+            if (code_domain := self._domain_of_code(current)) is not None:
+                domain = code_domain
+            current = current.f_back
+        return domain
+
+    def _domain_of_code(self, frame: FrameType) -> str | None:
+        """Return the integration the code of a frame belongs to."""
+        filename = frame.f_code.co_filename
+        try:
+            return self._file_domains[filename]
+        except KeyError:
+            domain = self._file_domains[filename] = integration_of_module(
+                frame.f_globals.get("__name__", "")
+            )
+            return domain
+
+    def _add_sample(self, domain: str, now: float, kind: str, weight: float) -> None:
+        """Add a sample to the load of an integration."""
+        load = self._integrations.get(domain)
+        if load is None:
+            load = self._integrations[domain] = IntegrationLoad()
+        load.samples.append((now, kind, weight))
+        while load.samples[0][0] < now - WINDOW:
+            load.samples.popleft()
+
+    async def async_get_statistics(self) -> dict[str, Any]:
+        """Return the load of the event loop and the integrations.
+
+        The statistics are computed in the executor, so the event loop never
+        waits for the sampler thread to release the samples.
+        """
+        return await self.hass.async_add_executor_job(self.get_statistics)
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Return the load of the event loop and the integrations."""
+        with self._lock:
+            now = self._last_sample
+            total = sum(weight for _, weight, _ in self._loop_samples)
+            busy = sum(weight for _, weight, busy in self._loop_samples if busy)
+            integrations = []
+
+            for domain, load in self._integrations.items():
+                kinds: dict[str, float] = {}
+                for sampled, kind, weight in load.samples:
+                    if sampled >= now - WINDOW:
+                        kinds[kind] = kinds.get(kind, 0.0) + weight
+                durations = sorted(load.durations)
+                loop_time = sum(
+                    weight for kind, weight in kinds.items() if kind != KIND_EXECUTOR
+                )
+                integrations.append(
+                    {
+                        "domain": domain,
+                        "loop_share": loop_time / total if total else 0.0,
+                        "executor_share": kinds.get(KIND_EXECUTOR, 0.0) / total
+                        if total
+                        else 0.0,
+                        "kinds": {
+                            kind: weight / total if total else 0.0
+                            for kind, weight in kinds.items()
+                        },
+                        "duration_p50": _percentile(durations, 0.5),
+                        "duration_p95": _percentile(durations, 0.95),
+                        "duration_max": durations[-1] if durations else None,
+                    }
+                )
+
+        integrations.sort(key=lambda item: item["loop_share"], reverse=True)
+        return {
+            "interval": self.interval,
+            "overhead": self.overhead,
+            "loop_load": busy / total if total else None,
+            "integrations": integrations,
+        }
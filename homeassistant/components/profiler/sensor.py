@@ -0,0 +1,90 @@
+"""Sensors of the load the profiler sampled."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.components.sensor import STATE_CLASS_MEASUREMENT, SensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DATA_SAMPLER, DOMAIN
+from .sampler import LoopSampler
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+# Number of integrations listed in the attributes of the busiest integration
+TOP_INTEGRATIONS = 10
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the profiler sensors."""
+    sampler: LoopSampler = hass.data[DOMAIN][DATA_SAMPLER]
+    async_add_entities(
+        [
+            EventLoopLoadSensor(sampler, entry.entry_id),
+            BusiestIntegrationSensor(sampler, entry.entry_id),
+        ]
+    )
+
+
+class EventLoopLoadSensor(SensorEntity):
+    """Share of the time the event loop was busy."""
+
+    _attr_name = "Event loop load"
+    _attr_icon = "mdi:speedometer"
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = STATE_CLASS_MEASUREMENT
+
+    def __init__(self, sampler: LoopSampler, entry_id: str) -> None:
+        """Initialize the sensor."""
+        self._sampler = sampler
+        self._attr_unique_id = f"{entry_id}_event_loop_load"
+
+    async def async_update(self) -> None:
+        """Update the load from the samples."""
+        statistics = await self._sampler.async_get_statistics()
+        loop_load = statistics["loop_load"]
+        self._attr_native_value = (
+            round(loop_load * 100, 1) if loop_load is not None else None
+        )
+        self._attr_extra_state_attributes = {
+            "sample_interval": statistics["interval"],
+            "sampler_overhead": round(statistics["overhead"] * 100, 2),
+        }
+
+
+class BusiestIntegrationSensor(SensorEntity):
+    """The integration that kept the event loop busy the longest."""
+
+    _attr_name = "Busiest integration"
+    _attr_icon = "mdi:puzzle"
+
+    def __init__(self, sampler: LoopSampler, entry_id: str) -> None:
+        """Initialize the sensor."""
+        self._sampler = sampler
+        self._attr_unique_id = f"{entry_id}_busiest_integration"
+
+    async def async_update(self) -> None:
+        """Update the busiest integration from the samples."""
+        integrations = (await self._sampler.async_get_statistics())["integrations"]
+        if not integrations:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {}
+            return
+
+        busiest = integrations[0]
+        self._attr_native_value = busiest["domain"]
+        self._attr_extra_state_attributes = {
+            "loop_share": round(busiest["loop_share"] * 100, 2),
+            "duration_p50": busiest["duration_p50"],
+            "duration_p95": busiest["duration_p95"],
+            "duration_max": busiest["duration_max"],
+            "top_integrations": {
+                integration["domain"]: round(integration["loop_share"] * 100, 2)
+                for integration in integrations[:TOP_INTEGRATIONS]
+            },
+        }
@@ -347,6 +347,10 @@ class StatisticsTask(NamedTuple):
     start: datetime
 
 
+class StatisticsRollupBackfillTask:
+    """An object to insert into the recorder queue to roll up existing statistics."""
+
+
 class WaitTask:
     """An object to insert into the recorder queue to tell it set the _queue_watch event."""
 
@@ -394,6 +398,7 @@ class Recorder(threading.Thread):
         self._pending_expunge: list[States] = []
         self.event_session = None
         self.get_session = None
+        self.statistics_meta_cache = statistics.StatisticsMetaCache()
         self._completed_first_database_setup = None
         self._event_listener = None
         self.async_migration_event = asyncio.Event()
@@ -718,7 +723,12 @@ class Recorder(threading.Thread):
             _LOGGER.exception("Error during schema migration")
             return False
         else:
+            # The migration may have recreated the statistics metadata table
+            self.statistics_meta_cache.clear()
             self._setup_run()
+            if current_version < 23:
+                # Roll up the statistics compiled before there were rollups
+                self.queue.put(StatisticsRollupBackfillTask())
             return True
         finally:
             self.migration_in_progress = False
@@ -749,6 +759,13 @@ class Recorder(threading.Thread):
         # Schedule a new statistics task if this one didn't finish
         self.queue.put(StatisticsTask(start))
 
+    def _run_statistics_rollup_backfill(self):
+        """Run statistics rollup backfill task."""
+        if statistics.backfill_rollup_statistics(self):
+            return
+        # Schedule a new backfill task if this one didn't finish
+        self.queue.put(StatisticsRollupBackfillTask())
+
     def _process_one_event(self, event):
         """Process one event."""
         if isinstance(event, PurgeTask):
@@ -763,6 +780,9 @@ class Recorder(threading.Thread):
         if isinstance(event, StatisticsTask):
             self._run_statistics(event.start)
             return
+        if isinstance(event, StatisticsRollupBackfillTask):
+            self._run_statistics_rollup_backfill()
+            return
         if isinstance(event, WaitTask):
             self._queue_watch.set()
             return
@@ -936,6 +956,7 @@ class Recorder(threading.Thread):
         """Ensure database is ready to fly."""
         kwargs = {}
         self._completed_first_database_setup = False
+        self.statistics_meta_cache.clear()
 
         def setup_recorder_connection(dbapi_connection, connection_record):
             """Dbapi specific connection settings."""
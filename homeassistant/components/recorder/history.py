@@ -209,6 +209,67 @@ def get_last_state_changes(hass, number_of_states, entity_id):
         )
 
 
+def get_last_state_changes_for_entities(
+    hass, number_of_states, entity_ids, start_time=None
+):
+    """Return the last number_of_states of each entity in one session.
+
+    When a start_time is given, the state at start_time and all changes since
+    then are returned as well.
+    """
+    now = dt_util.utcnow()
+    entity_ids = [entity_id.lower() for entity_id in entity_ids]
+
+    with session_scope(hass=hass) as session:
+        states = {}
+
+        if start_time is not None:
+            baked_query = hass.data[HISTORY_BAKERY](
+                lambda session: session.query(*QUERY_STATES)
+            )
+            baked_query += lambda q: q.filter(
+                (States.last_changed == States.last_updated)
+                & (States.last_updated > bindparam("start_time"))
+                & States.entity_id.in_(bindparam("entity_ids", expanding=True))
+            )
+            for row in execute(
+                baked_query(session).params(
+                    start_time=start_time, entity_ids=entity_ids
+                )
+            ):
+                states[(row.entity_id, row.last_updated)] = row
+
+        if number_of_states:
+            # Limiting the number of rows per entity in a single statement would
+            # need a window function over every row of the entities, while a
+            # limited query per entity only reads the rows it returns
+            baked_query = hass.data[HISTORY_BAKERY](
+                lambda session: session.query(*QUERY_STATES)
+            )
+            baked_query += lambda q: q.filter(
+                (States.last_changed == States.last_updated)
+                & (States.entity_id == bindparam("entity_id"))
+            )
+            baked_query += lambda q: q.order_by(States.last_updated.desc())
+            baked_query += lambda q: q.limit(bindparam("number_of_states"))
+            for entity_id in entity_ids:
+                for row in execute(
+                    baked_query(session).params(
+                        number_of_states=number_of_states, entity_id=entity_id
+                    )
+                ):
+                    states[(row.entity_id, row.last_updated)] = row
+
+        return _sorted_states_to_dict(
+            hass,
+            session,
+            [states[key] for key in sorted(states)],
+            start_time or now,
+            entity_ids,
+            include_start_time_state=start_time is not None,
+        )
+
+
 def get_states(hass, utc_point_in_time, entity_ids=None, run=None, filters=None):
     """Return the states at a specific point in time."""
     if run is None:
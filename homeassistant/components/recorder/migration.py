@@ -19,7 +19,9 @@ from .models import (
     Base,
     SchemaChanges,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
     process_timestamp,
@@ -582,6 +584,12 @@ def _apply_update(instance, session, new_version, old_version):  # noqa: C901
                         sum_increase=last_statistic.sum_increase,
                     )
                 )
+    elif new_version == 23:
+        # Add the daily and monthly rollups of the long term statistics, existing
+        # statistics are rolled up by a backfill task once the migration is done
+        for table in (StatisticsDaily, StatisticsMonthly):
+            if not sqlalchemy.inspect(engine).has_table(table.__tablename__):
+                table.__table__.create(engine)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
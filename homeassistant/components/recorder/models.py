@@ -41,7 +41,7 @@ import homeassistant.util.dt as dt_util
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 22
+SCHEMA_VERSION = 23
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,6 +55,8 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAILY = "statistics_daily"
+TABLE_STATISTICS_MONTHLY = "statistics_monthly"
 
 ALL_TABLES = [
     TABLE_STATES,
@@ -65,6 +67,8 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAILY,
+    TABLE_STATISTICS_MONTHLY,
 ]
 
 DATETIME_TYPE = DateTime(timezone=True).with_variant(
@@ -309,6 +313,26 @@ class StatisticsShortTerm(Base, StatisticsBase):  # type: ignore
     __tablename__ = TABLE_STATISTICS_SHORT_TERM
 
 
+class StatisticsDaily(Base, StatisticsBase):  # type: ignore
+    """Long term statistics rolled up per local day."""
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index("ix_statistics_daily_statistic_id_start", "metadata_id", "start"),
+    )
+    __tablename__ = TABLE_STATISTICS_DAILY
+
+
+class StatisticsMonthly(Base, StatisticsBase):  # type: ignore
+    """Long term statistics rolled up per local month."""
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index("ix_statistics_monthly_statistic_id_start", "metadata_id", "start"),
+    )
+    __tablename__ = TABLE_STATISTICS_MONTHLY
+
+
 class StatisticMetaData(TypedDict):
     """Statistic meta data class."""
 
@@ -7,6 +7,7 @@ import dataclasses
 from datetime import datetime, timedelta
 from itertools import groupby
 import logging
+import threading
 from typing import TYPE_CHECKING, Any, Callable, Literal
 
 from sqlalchemy import bindparam, func
@@ -28,13 +29,16 @@ import homeassistant.util.temperature as temperature_util
 from homeassistant.util.unit_system import UnitSystem
 import homeassistant.util.volume as volume_util
 
-from .const import DOMAIN
+from .const import DATA_INSTANCE, DOMAIN
 from .models import (
     StatisticData,
     StatisticMetaData,
     StatisticResult,
     Statistics,
+    StatisticsBase,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
     process_timestamp,
@@ -69,6 +73,30 @@ QUERY_STATISTICS_SHORT_TERM = [
     StatisticsShortTerm.sum_increase,
 ]
 
+QUERY_STATISTICS_DAILY = [
+    StatisticsDaily.metadata_id,
+    StatisticsDaily.start,
+    StatisticsDaily.mean,
+    StatisticsDaily.min,
+    StatisticsDaily.max,
+    StatisticsDaily.last_reset,
+    StatisticsDaily.state,
+    StatisticsDaily.sum,
+    StatisticsDaily.sum_increase,
+]
+
+QUERY_STATISTICS_MONTHLY = [
+    StatisticsMonthly.metadata_id,
+    StatisticsMonthly.start,
+    StatisticsMonthly.mean,
+    StatisticsMonthly.min,
+    StatisticsMonthly.max,
+    StatisticsMonthly.last_reset,
+    StatisticsMonthly.state,
+    StatisticsMonthly.sum,
+    StatisticsMonthly.sum_increase,
+]
+
 QUERY_STATISTICS_SUMMARY_MEAN = [
     StatisticsShortTerm.metadata_id,
     func.avg(StatisticsShortTerm.mean),
@@ -99,14 +127,25 @@ QUERY_STATISTIC_META = [
     StatisticsMeta.has_sum,
 ]
 
-QUERY_STATISTIC_META_ID = [
-    StatisticsMeta.id,
-    StatisticsMeta.statistic_id,
-]
-
 STATISTICS_BAKERY = "recorder_statistics_bakery"
-STATISTICS_META_BAKERY = "recorder_statistics_meta_bakery"
 STATISTICS_SHORT_TERM_BAKERY = "recorder_statistics_short_term_bakery"
+STATISTICS_DAILY_BAKERY = "recorder_statistics_daily_bakery"
+STATISTICS_MONTHLY_BAKERY = "recorder_statistics_monthly_bakery"
+
+# The bakery, columns and table of the statistics of each period
+STATISTICS_PERIODS = {
+    "5minute": (
+        STATISTICS_SHORT_TERM_BAKERY,
+        QUERY_STATISTICS_SHORT_TERM,
+        StatisticsShortTerm,
+    ),
+    "hour": (STATISTICS_BAKERY, QUERY_STATISTICS, Statistics),
+    "day": (STATISTICS_DAILY_BAKERY, QUERY_STATISTICS_DAILY, StatisticsDaily),
+    "month": (STATISTICS_MONTHLY_BAKERY, QUERY_STATISTICS_MONTHLY, StatisticsMonthly),
+}
+
+# Number of missing days or months rolled up by a single backfill task
+MAX_ROLLUPS_PER_BACKFILL = 30
 
 
 # Convert pressure and temperature statistics from the native unit used for statistics
@@ -144,11 +183,93 @@ class ValidationIssue:
         return dataclasses.asdict(self)
 
 
+class StatisticsMetaCache:
+    """Write-through cache of the statistics metadata.
+
+    The metadata is indexed by metadata_id and by statistic_id. The whole table
+    is read the first time it's needed. Changes made by the recorder are written
+    to the cache, anything else which changes the table clears it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._lock = threading.Lock()
+        self._metadata: dict[str, StatisticMetaData] | None = None
+        self._metadata_ids: dict[str, str] = {}
+        # Bumped on every change, a table read while the cache changed is dropped
+        self._generation = 0
+
+    def get(self, session: scoped_session) -> dict[str, StatisticMetaData]:
+        """Return the metadata of all statistics indexed by metadata_id."""
+        with self._lock:
+            if self._metadata is not None:
+                return self._metadata
+            generation = self._generation
+
+        metadata: dict[str, StatisticMetaData] = {}
+        for metadata_id, statistic_id, unit, has_mean, has_sum in (
+            execute(session.query(*QUERY_STATISTIC_META).order_by(StatisticsMeta.id))
+            or []
+        ):
+            metadata[metadata_id] = {
+                "statistic_id": statistic_id,
+                "unit_of_measurement": unit,
+                "has_mean": has_mean,
+                "has_sum": has_sum,
+            }
+
+        with self._lock:
+            if generation == self._generation:
+                self._metadata = metadata
+                self._metadata_ids = {
+                    meta["statistic_id"]: metadata_id
+                    for metadata_id, meta in metadata.items()
+                }
+        return metadata
+
+    def get_metadata_id(self, session: scoped_session, statistic_id: str) -> str | None:
+        """Return the metadata_id of a statistic_id."""
+        with self._lock:
+            if self._metadata is not None:
+                return self._metadata_ids.get(statistic_id)
+        for metadata_id, meta in self.get(session).items():
+            if meta["statistic_id"] == statistic_id:
+                return metadata_id
+        return None
+
+    def set(self, metadata_id: str, metadata: StatisticMetaData) -> None:
+        """Write the added or updated metadata of a statistic to the cache."""
+        with self._lock:
+            self._generation += 1
+            if self._metadata is None:
+                return
+            # Replace the dicts, readers may be iterating the current ones
+            self._metadata = {**self._metadata, metadata_id: metadata}
+            self._metadata_ids = {
+                **self._metadata_ids,
+                metadata["statistic_id"]: metadata_id,
+            }
+
+    def clear(self) -> None:
+        """Clear the cache, the table is read again when it's needed."""
+        with self._lock:
+            self._generation += 1
+            self._metadata = None
+            self._metadata_ids = {}
+
+
+def _metadata_cache(hass: HomeAssistant) -> StatisticsMetaCache:
+    """Return the statistics metadata cache of the recorder."""
+    cache: StatisticsMetaCache = hass.data[DATA_INSTANCE].statistics_meta_cache
+    return cache
+
+
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the history hooks."""
     hass.data[STATISTICS_BAKERY] = baked.bakery()
-    hass.data[STATISTICS_META_BAKERY] = baked.bakery()
     hass.data[STATISTICS_SHORT_TERM_BAKERY] = baked.bakery()
+    hass.data[STATISTICS_DAILY_BAKERY] = baked.bakery()
+    hass.data[STATISTICS_MONTHLY_BAKERY] = baked.bakery()
 
     def entity_id_changed(event: Event) -> None:
         """Handle entity_id changed."""
@@ -159,6 +280,7 @@ def async_setup(hass: HomeAssistant) -> None:
                 StatisticsMeta.statistic_id == old_entity_id
                 and StatisticsMeta.source == DOMAIN
             ).update({StatisticsMeta.statistic_id: entity_id})
+        _metadata_cache(hass).clear()
 
     @callback
     def entity_registry_changed_filter(event: Event) -> bool:
@@ -185,21 +307,6 @@ def get_start_time() -> datetime:
     return last_period
 
 
-def _get_metadata_ids(
-    hass: HomeAssistant, session: scoped_session, statistic_ids: list[str]
-) -> list[str]:
-    """Resolve metadata_id for a list of statistic_ids."""
-    baked_query = hass.data[STATISTICS_META_BAKERY](
-        lambda session: session.query(*QUERY_STATISTIC_META_ID)
-    )
-    baked_query += lambda q: q.filter(
-        StatisticsMeta.statistic_id.in_(bindparam("statistic_ids"))
-    )
-    result = execute(baked_query(session).params(statistic_ids=statistic_ids))
-
-    return [id for id, _ in result] if result else []
-
-
 def _update_or_add_metadata(
     hass: HomeAssistant,
     session: scoped_session,
@@ -213,21 +320,22 @@ def _update_or_add_metadata(
     Updating metadata source is not possible.
     """
     statistic_id = new_metadata["statistic_id"]
+    cache = _metadata_cache(hass)
     old_metadata_dict = _get_metadata(hass, session, [statistic_id], None)
     if not old_metadata_dict:
         unit = new_metadata["unit_of_measurement"]
         has_mean = new_metadata["has_mean"]
         has_sum = new_metadata["has_sum"]
-        session.add(
-            StatisticsMeta.from_meta(DOMAIN, statistic_id, unit, has_mean, has_sum)
-        )
-        metadata_ids = _get_metadata_ids(hass, session, [statistic_id])
+        meta = StatisticsMeta.from_meta(DOMAIN, statistic_id, unit, has_mean, has_sum)
+        session.add(meta)
+        session.flush()
+        cache.set(meta.id, new_metadata)
         _LOGGER.debug(
             "Added new statistics metadata for %s, new_metadata: %s",
             statistic_id,
             new_metadata,
         )
-        return metadata_ids[0]
+        return meta.id  # type: ignore[no-any-return]
 
     metadata_id, old_metadata = next(iter(old_metadata_dict.items()))
     if (
@@ -243,6 +351,7 @@ def _update_or_add_metadata(
             },
             synchronize_session=False,
         )
+        cache.set(metadata_id, new_metadata)
         _LOGGER.debug(
             "Updated statistics metadata for %s, old_metadata: %s, new_metadata: %s",
             statistic_id,
@@ -332,6 +441,163 @@ def compile_hourly_statistics(
         session.add(Statistics.from_stats(metadata_id, stat))
 
 
+def _local_day_period(time: datetime) -> tuple[datetime, datetime]:
+    """Return the UTC start and end of the local day a point in time is in."""
+    day = dt_util.as_local(time).date()
+    return (
+        dt_util.as_utc(dt_util.start_of_local_day(day)),
+        dt_util.as_utc(dt_util.start_of_local_day(day + timedelta(days=1))),
+    )
+
+
+def _local_month_period(time: datetime) -> tuple[datetime, datetime]:
+    """Return the UTC start and end of the local month a point in time is in."""
+    month = dt_util.as_local(time).date().replace(day=1)
+    next_month = (month + timedelta(days=32)).replace(day=1)
+    return (
+        dt_util.as_utc(dt_util.start_of_local_day(month)),
+        dt_util.as_utc(dt_util.start_of_local_day(next_month)),
+    )
+
+
+def _period_end(
+    table: type[StatisticsBase],
+) -> Callable[[datetime], datetime]:
+    """Return a function which returns the end of a period of a statistics table."""
+    if table is StatisticsDaily:
+        return lambda start: _local_day_period(start)[1]
+    if table is StatisticsMonthly:
+        return lambda start: _local_month_period(start)[1]
+    duration: timedelta = (
+        StatisticsShortTerm.duration
+        if table is StatisticsShortTerm
+        else Statistics.duration
+    )
+    return lambda start: start + duration
+
+
+def _compile_rollup(
+    session: scoped_session,
+    source: type[StatisticsBase],
+    target: type[StatisticsBase],
+    start_time: datetime,
+    end_time: datetime,
+) -> None:
+    """Roll the statistics of a period up into the rollup table.
+
+    This will summarize the statistics of the source table during the period:
+    - the mean is the average of the means, min and max are their extremes
+    - sum and state are taken from the last entry during the period
+    """
+    summary: dict[str, StatisticData] = {}
+    stats = execute(
+        session.query(
+            source.metadata_id,
+            func.avg(source.mean),
+            func.min(source.min),
+            func.max(source.max),
+        )
+        .filter(source.start >= start_time)
+        .filter(source.start < end_time)
+        .group_by(source.metadata_id)
+    )
+    for metadata_id, _mean, _min, _max in stats or []:
+        summary[metadata_id] = {
+            "start": start_time,
+            "mean": _mean,
+            "min": _min,
+            "max": _max,
+        }
+
+    subquery = (
+        session.query(
+            source.metadata_id,
+            source.last_reset,
+            source.state,
+            source.sum,
+            source.sum_increase,
+            func.row_number()
+            .over(partition_by=source.metadata_id, order_by=source.start.desc())
+            .label("rownum"),
+        )
+        .filter(source.start >= start_time)
+        .filter(source.start < end_time)
+        .subquery()
+    )
+    stats = execute(session.query(subquery).filter(subquery.c.rownum == 1))
+    for metadata_id, last_reset, state, _sum, sum_increase, _ in stats or []:
+        summary.setdefault(metadata_id, {"start": start_time}).update(
+            {
+                "last_reset": process_timestamp(last_reset),
+                "state": state,
+                "sum": _sum,
+                "sum_increase": sum_increase,
+            }
+        )
+
+    # Replace the rollup of the period if it was compiled before
+    session.query(target).filter(target.start == start_time).delete(
+        synchronize_session=False
+    )
+    for metadata_id, stat in summary.items():
+        session.add(target.from_stats(metadata_id, stat))
+
+
+def compile_rollup_statistics(session: scoped_session, hour_start: datetime) -> None:
+    """Roll up the local day and month which end with an hour of statistics."""
+    day_start, day_end = _local_day_period(hour_start)
+    if day_end > hour_start + Statistics.duration:
+        return
+    _compile_rollup(session, Statistics, StatisticsDaily, day_start, day_end)
+
+    month_start, month_end = _local_month_period(day_start)
+    if month_end == day_end:
+        _compile_rollup(
+            session, StatisticsDaily, StatisticsMonthly, month_start, month_end
+        )
+
+
+def _rollup_starts(session: scoped_session, table: type[StatisticsBase]) -> set:
+    """Return the distinct start times in a statistics table."""
+    return {
+        process_timestamp(start) for start, in session.query(table.start).distinct()
+    }
+
+
+@retryable_database_job("statistics rollup backfill")
+def backfill_rollup_statistics(instance: Recorder) -> bool:
+    """Roll up the long term statistics of days and months without a rollup.
+
+    Days are rolled up before months, at most MAX_ROLLUPS_PER_BACKFILL periods per
+    run. Returns False if there are more periods left to roll up.
+    """
+    with session_scope(session=instance.get_session()) as session:  # type: ignore
+        if not (last_start := session.query(func.max(Statistics.start)).scalar()):
+            return True
+        # Periods are only rolled up once all their hours were compiled
+        compiled_until = process_timestamp(last_start) + Statistics.duration
+
+        for source, target, period in (
+            (Statistics, StatisticsDaily, _local_day_period),
+            (StatisticsDaily, StatisticsMonthly, _local_month_period),
+        ):
+            rolled_up = _rollup_starts(session, target)
+            missing = sorted(
+                {
+                    (start, end)
+                    for start, end in map(period, _rollup_starts(session, source))
+                    if end <= compiled_until and start not in rolled_up
+                }
+            )
+            for start, end in missing[:MAX_ROLLUPS_PER_BACKFILL]:
+                _LOGGER.debug("Rolling up %s statistics for %s-%s", target, start, end)
+                _compile_rollup(session, source, target, start, end)
+            if len(missing) > MAX_ROLLUPS_PER_BACKFILL:
+                return False
+
+    return True
+
+
 @retryable_database_job("statistics")
 def compile_statistics(instance: Recorder, start: datetime) -> bool:
     """Compile 5-minute statistics for all integrations with a recorder platform.
@@ -360,24 +626,32 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
         platform_stats.extend(platform_stat)
 
     # Insert collected statistics in the database
-    with session_scope(session=instance.get_session()) as session:  # type: ignore
-        for stats in platform_stats:
-            metadata_id = _update_or_add_metadata(instance.hass, session, stats["meta"])
-            for stat in stats["stat"]:
-                try:
-                    session.add(StatisticsShortTerm.from_stats(metadata_id, stat))
-                except SQLAlchemyError:
-                    _LOGGER.exception(
-                        "Unexpected exception when inserting statistics %s:%s ",
-                        metadata_id,
-                        stats,
-                    )
-
-        if start.minute == 55:
-            # A full hour is ready, summarize it
-            compile_hourly_statistics(instance, session, start)
-
-        session.add(StatisticsRuns(start=start))
+    try:
+        with session_scope(session=instance.get_session()) as session:  # type: ignore
+            for stats in platform_stats:
+                metadata_id = _update_or_add_metadata(
+                    instance.hass, session, stats["meta"]
+                )
+                for stat in stats["stat"]:
+                    try:
+                        session.add(StatisticsShortTerm.from_stats(metadata_id, stat))
+                    except SQLAlchemyError:
+                        _LOGGER.exception(
+                            "Unexpected exception when inserting statistics %s:%s ",
+                            metadata_id,
+                            stats,
+                        )
+
+            if start.minute == 55:
+                # A full hour is ready, summarize it
+                compile_hourly_statistics(instance, session, start)
+                compile_rollup_statistics(session, start.replace(minute=0))
+
+            session.add(StatisticsRuns(start=start))
+    except Exception:
+        # Metadata written to the cache was rolled back
+        instance.statistics_meta_cache.clear()
+        raise
 
     return True
 
@@ -393,42 +667,26 @@ def _get_metadata(
     If statistic_ids is given, fetch metadata only for the listed statistics_ids.
     If statistic_type is given, fetch metadata only for statistic_ids supporting it.
     """
-
-    def _meta(metas: list, wanted_metadata_id: str) -> StatisticMetaData | None:
-        meta: StatisticMetaData | None = None
-        for metadata_id, statistic_id, unit, has_mean, has_sum in metas:
-            if metadata_id == wanted_metadata_id:
-                meta = {
-                    "statistic_id": statistic_id,
-                    "unit_of_measurement": unit,
-                    "has_mean": has_mean,
-                    "has_sum": has_sum,
-                }
-        return meta
-
-    # Fetch metatadata from the database
-    baked_query = hass.data[STATISTICS_META_BAKERY](
-        lambda session: session.query(*QUERY_STATISTIC_META)
-    )
-    if statistic_ids is not None:
-        baked_query += lambda q: q.filter(
-            StatisticsMeta.statistic_id.in_(bindparam("statistic_ids"))
-        )
-    if statistic_type == "mean":
-        baked_query += lambda q: q.filter(StatisticsMeta.has_mean.isnot(False))
-    elif statistic_type == "sum":
-        baked_query += lambda q: q.filter(StatisticsMeta.has_sum.isnot(False))
-    result = execute(baked_query(session).params(statistic_ids=statistic_ids))
-    if not result:
-        return {}
-
-    metadata_ids = [metadata[0] for metadata in result]
-    # Prepare the result dict
+    cache = _metadata_cache(hass)
+    all_metadata = cache.get(session)
+    if statistic_ids is None:
+        metadata_ids: Iterable[str] = all_metadata
+    else:
+        metadata_ids = [
+            metadata_id
+            for statistic_id in statistic_ids
+            if (metadata_id := cache.get_metadata_id(session, statistic_id)) is not None
+        ]
+
+    # Prepare the result dict, callers are free to modify it
     metadata: dict[str, StatisticMetaData] = {}
-    for _id in metadata_ids:
-        meta = _meta(result, _id)
-        if meta:
-            metadata[_id] = meta
+    for metadata_id in metadata_ids:
+        meta = all_metadata[metadata_id]
+        if statistic_type == "mean" and meta["has_mean"] is False:
+            continue
+        if statistic_type == "sum" and meta["has_sum"] is False:
+            continue
+        metadata[metadata_id] = meta.copy()
     return metadata
 
 
@@ -437,12 +695,10 @@ def get_metadata(
     statistic_id: str,
 ) -> StatisticMetaData | None:
     """Return metadata for a statistic_id."""
-    statistic_ids = [statistic_id]
     with session_scope(hass=hass) as session:
-        metadata_ids = _get_metadata_ids(hass, session, [statistic_id])
-        if not metadata_ids:
-            return None
-        return _get_metadata(hass, session, statistic_ids, None).get(metadata_ids[0])
+        return next(
+            iter(_get_metadata(hass, session, [statistic_id], None).values()), None
+        )
 
 
 def _configured_unit(unit: str, units: UnitSystem) -> str:
@@ -514,7 +770,7 @@ def _statistics_during_period_query(
     statistic_ids: list[str] | None,
     bakery: Any,
     base_query: Iterable,
-    table: type[Statistics | StatisticsShortTerm],
+    table: type[StatisticsBase],
 ) -> Callable:
     """Prepare a database query for statistics during a given period.
 
@@ -541,7 +797,7 @@ def statistics_during_period(
     start_time: datetime,
     end_time: datetime | None = None,
     statistic_ids: list[str] | None = None,
-    period: Literal["hour"] | Literal["5minute"] = "hour",
+    period: Literal["5minute", "hour", "day", "month"] = "hour",
 ) -> dict[str, list[dict[str, str]]]:
     """Return statistics during UTC period start_time - end_time for the statistic_ids.
 
@@ -559,14 +815,7 @@ def statistics_during_period(
         if statistic_ids is not None:
             metadata_ids = list(metadata.keys())
 
-        if period == "hour":
-            bakery = STATISTICS_BAKERY
-            base_query = QUERY_STATISTICS
-            table = Statistics
-        else:
-            bakery = STATISTICS_SHORT_TERM_BAKERY
-            base_query = QUERY_STATISTICS_SHORT_TERM
-            table = StatisticsShortTerm
+        bakery, base_query, table = STATISTICS_PERIODS[period]
 
         baked_query = _statistics_during_period_query(
             hass, end_time, statistic_ids, bakery, base_query, table
@@ -581,7 +830,7 @@ def statistics_during_period(
             return {}
         # Return statistics combined with metadata
         return _sorted_statistics_to_dict(
-            hass, stats, statistic_ids, metadata, True, table.duration
+            hass, stats, statistic_ids, metadata, True, table
         )
 
 
@@ -624,7 +873,7 @@ def get_last_statistics(
             statistic_ids,
             metadata,
             convert_units,
-            StatisticsShortTerm.duration,
+            StatisticsShortTerm,
         )
 
 
@@ -634,11 +883,12 @@ def _sorted_statistics_to_dict(
     statistic_ids: list[str] | None,
     metadata: dict[str, StatisticMetaData],
     convert_units: bool,
-    duration: timedelta,
+    table: type[StatisticsBase],
 ) -> dict[str, list[dict]]:
     """Convert SQL results into JSON friendly data structure."""
     result: dict = defaultdict(list)
     units = hass.config.units
+    period_end = _period_end(table)
 
     def no_conversion(val: Any, _: Any) -> float | None:
         """Return x."""
@@ -661,7 +911,7 @@ def _sorted_statistics_to_dict(
         ent_results = result[meta_id]
         for db_state in group:
             start = process_timestamp(db_state.start)
-            end = start + duration
+            end = period_end(start)
             ent_results.append(
                 {
                     "statistic_id": statistic_id,
@@ -23,7 +23,9 @@ from .models import (
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
     TABLE_STATISTICS,
+    TABLE_STATISTICS_DAILY,
     TABLE_STATISTICS_META,
+    TABLE_STATISTICS_MONTHLY,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
     RecorderRuns,
@@ -188,7 +190,9 @@ def basic_sanity_check(cursor):
         # The statistics tables may not be present in old databases
         if table in [
             TABLE_STATISTICS,
+            TABLE_STATISTICS_DAILY,
             TABLE_STATISTICS_META,
+            TABLE_STATISTICS_MONTHLY,
             TABLE_STATISTICS_RUNS,
             TABLE_STATISTICS_SHORT_TERM,
         ]:
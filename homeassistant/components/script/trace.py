@@ -5,9 +5,14 @@ from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any
 
-from homeassistant.components.trace import ActionTrace, async_store_trace
+from homeassistant.components.trace import (
+    ActionTrace,
+    async_get_capture,
+    async_store_trace,
+)
 from homeassistant.components.trace.const import CONF_STORED_TRACES
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import TRACE_CAPTURE_OFF, trace_capture_cv
 
 
 class ScriptTrace(ActionTrace):
@@ -36,7 +41,10 @@ def trace_script(
 ) -> Iterator[ScriptTrace]:
     """Trace execution of a script."""
     trace = ScriptTrace(item_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    capture = async_get_capture(hass, trace_config)
+    if capture != TRACE_CAPTURE_OFF:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    token = trace_capture_cv.set(capture)
 
     try:
         yield trace
@@ -45,5 +53,6 @@ def trace_script(
             trace.set_error(ex)
         raise ex
     finally:
+        trace_capture_cv.reset(token)
         if item_id:
             trace.finished()
@@ -5,6 +5,7 @@ import asyncio
 from collections.abc import Awaitable
 from datetime import timedelta
 from enum import Enum
+from functools import lru_cache
 from ipaddress import IPv4Address, IPv6Address
 import logging
 from typing import Any, Callable, Mapping
@@ -36,6 +37,11 @@ SCAN_INTERVAL = timedelta(seconds=60)
 
 IPV4_BROADCAST = IPv4Address("255.255.255.255")
 
+# Number of recently seen devices whose matching domains are kept
+MATCH_CACHE_SIZE = 1024
+# Matcher keys used to index the integration matchers, in order of preference
+MATCHER_INDEX_KEYS = ("st", "devicetype", "manufacturer")
+
 # Attributes for accessing info from SSDP response
 ATTR_SSDP_LOCATION = "ssdp_location"
 ATTR_SSDP_ST = "ssdp_st"
@@ -156,6 +162,63 @@ def _async_headers_match(
     return True
 
 
+class IntegrationMatchers:
+    """The ssdp matchers of all integrations, indexed for fast lookups.
+
+    Each matcher is indexed by the value of its most selective key, so only the
+    matchers sharing a value with the device are compared. The domains of
+    recently seen devices are cached, most of them match no integration.
+    """
+
+    def __init__(self, integration_matchers: dict[str, list[dict[str, str]]]) -> None:
+        """Index the matchers."""
+        self._matchers: list[tuple[str, dict[str, str]]] = []
+        self._index: dict[str, dict[str, list[tuple[str, dict[str, str]]]]] = {}
+
+        for domain, matchers in integration_matchers.items():
+            for matcher in matchers:
+                matcher = {key.lower(): value for key, value in matcher.items()}
+                self._matchers.append((domain, matcher))
+                index_key = next(
+                    (key for key in MATCHER_INDEX_KEYS if key in matcher),
+                    min(matcher, default=""),
+                )
+                self._index.setdefault(index_key, {}).setdefault(
+                    matcher.get(index_key, ""), []
+                ).append((domain, matcher))
+
+        self._keys = tuple(
+            sorted({key for _, matcher in self._matchers for key in matcher})
+        )
+        self._cached_match = lru_cache(maxsize=MATCH_CACHE_SIZE)(self._match)
+
+    @core_callback
+    def async_matching_domains(self, info_with_desc: CaseInsensitiveDict) -> set[str]:
+        """Return the domains with a matcher matching the device."""
+        values = tuple(info_with_desc.get(key) for key in self._keys)
+        try:
+            return set(self._cached_match(values))
+        except TypeError:
+            # Nested values of the description can't be hashed
+            info = dict(zip(self._keys, values))
+            return {
+                domain
+                for domain, matcher in self._matchers
+                if all(info[key] == value for key, value in matcher.items())
+            }
+
+    def _match(self, values: tuple[Any, ...]) -> frozenset[str]:
+        """Return the domains with a matcher matching the values of the keys."""
+        info = dict(zip(self._keys, values))
+        info[""] = ""
+        return frozenset(
+            domain
+            for index_key, by_value in self._index.items()
+            for domain, matcher in by_value.get(info[index_key], ())
+            if all(info[key] == value for key, value in matcher.items())
+        )
+
+
 class Scanner:
     """Class to manage SSDP searching and SSDP advertisements."""
 
@@ -167,7 +230,7 @@ class Scanner:
         self._callbacks: list[tuple[SsdpCallback, dict[str, str]]] = []
         self._flow_dispatcher: FlowDispatcher | None = None
         self._description_cache: DescriptionCache | None = None
-        self._integration_matchers: dict[str, list[dict[str, str]]] | None = None
+        self._integration_matchers: IntegrationMatchers | None = None
 
     @property
     def _ssdp_devices(self) -> list[SsdpDevice]:
@@ -271,7 +334,9 @@ class Scanner:
         requester = AiohttpSessionRequester(session, True, 10)
         self._description_cache = DescriptionCache(requester)
         self._flow_dispatcher = FlowDispatcher(self.hass)
-        self._integration_matchers = await async_get_ssdp(self.hass)
+        self._integration_matchers = IntegrationMatchers(
+            await async_get_ssdp(self.hass)
+        )
 
         await self._async_start_ssdp_listeners()
 
@@ -326,12 +391,7 @@ class Scanner:
     @core_callback
     def _async_matching_domains(self, info_with_desc: CaseInsensitiveDict) -> set[str]:
         assert self._integration_matchers is not None
-        domains = set()
-        for domain, matchers in self._integration_matchers.items():
-            for matcher in matchers:
-                if all(info_with_desc.get(k) == v for (k, v) in matcher.items()):
-                    domains.add(domain)
-        return domains
+        return self._integration_matchers.async_matching_domains(info_with_desc)
 
     async def _ssdp_listener_callback(
         self, ssdp_device: SsdpDevice, dst: DeviceOrServiceType, source: SsdpSource
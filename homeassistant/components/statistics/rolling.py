@@ -0,0 +1,145 @@
+"""Statistics of a sliding window of values, updated as values come and go."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import deque
+from collections.abc import Iterator
+import math
+
+
+class RollingStatistics:
+    """A window of values with statistics that are updated incrementally.
+
+    The window behaves like a deque with a maximum length. The sum and the
+    variance are updated when a value is added or removed (Welford's method),
+    and a sorted copy of the window answers the median, quantiles, min and max.
+    The running sums are recomputed from the window once as many values were
+    removed as it holds, so rounding errors can't build up.
+    """
+
+    def __init__(self, maxlen: int) -> None:
+        """Initialize the window."""
+        self.maxlen = maxlen
+        self._values: deque[float] = deque()
+        self._sorted: list[float] = []
+        self._sum = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._removed = 0
+
+    def __len__(self) -> int:
+        """Return the number of values in the window."""
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate over the values from oldest to newest."""
+        return iter(self._values)
+
+    def __getitem__(self, index: int) -> float:
+        """Return a value of the window."""
+        return self._values[index]
+
+    def append(self, value: float) -> None:
+        """Add a value, removing the oldest one if the window is full."""
+        if len(self._values) == self.maxlen:
+            self.popleft()
+        self._values.append(value)
+        insort(self._sorted, value)
+
+        self._sum += value
+        delta = value - self._mean
+        self._mean += delta / len(self._values)
+        self._m2 += delta * (value - self._mean)
+
+    def popleft(self) -> float:
+        """Remove and return the oldest value."""
+        value = self._values.popleft()
+        del self._sorted[bisect_left(self._sorted, value)]
+
+        if not self._values:
+            self._sum = self._mean = self._m2 = 0.0
+            self._removed = 0
+            return value
+
+        self._removed += 1
+        if self._removed >= len(self._values):
+            self._recompute()
+            return value
+
+        self._sum -= value
+        delta = value - self._mean
+        self._mean -= delta / len(self._values)
+        self._m2 -= delta * (value - self._mean)
+        return value
+
+    def _recompute(self) -> None:
+        """Compute the running sums from the values of the window."""
+        self._removed = 0
+        self._sum = math.fsum(self._values)
+        self._mean = self._sum / len(self._values)
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in self._values)
+
+    @property
+    def total(self) -> float:
+        """Return the sum of the values."""
+        return self._sum
+
+    @property
+    def mean(self) -> float:
+        """Return the mean of the values, the window must not be empty."""
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, the window must hold two values."""
+        return max(self._m2, 0.0) / (len(self._values) - 1)
+
+    @property
+    def stdev(self) -> float:
+        """Return the sample standard deviation, the window must hold two values."""
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self) -> float:
+        """Return the smallest value, the window must not be empty."""
+        return self._sorted[0]
+
+    @property
+    def max(self) -> float:
+        """Return the largest value, the window must not be empty."""
+        return self._sorted[-1]
+
+    @property
+    def median(self) -> float:
+        """Return the median of the values, the window must not be empty."""
+        data = self._sorted
+        middle = len(data) // 2
+        if len(data) % 2:
+            return data[middle]
+        return (data[middle - 1] + data[middle]) / 2
+
+    def quantiles(self, intervals: int, method: str) -> list[float]:
+        """Return the cut points dividing the values in intervals.
+
+        This matches statistics.quantiles, the window must hold two values.
+        """
+        data = self._sorted
+        count = len(data)
+        result = []
+        if method == "inclusive":
+            scale = count - 1
+            for i in range(1, intervals):
+                j, delta = divmod(i * scale, intervals)
+                result.append(
+                    (data[j] * (intervals - delta) + data[j + 1] * delta) / intervals
+                )
+            return result
+
+        scale = count + 1
+        for i in range(1, intervals):
+            j = min(max(i * scale // intervals, 1), count - 1)
+            delta = i * scale - j * intervals
+            result.append(
+                (data[j - 1] * (intervals - delta) + data[j] * delta) / intervals
+            )
+        return result
@@ -1,7 +1,7 @@
 """Support for statistics for sensor values."""
 from collections import deque
 import logging
-import statistics
+import math
 
 import voluptuous as vol
 
@@ -26,6 +26,7 @@ from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.util import dt as dt_util
 
 from . import DOMAIN, PLATFORMS
+from .rolling import RollingStatistics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -131,7 +132,10 @@ class StatisticsSensor(SensorEntity):
         self._quantile_intervals = quantile_intervals
         self._quantile_method = quantile_method
         self._unit_of_measurement = None
-        self.states = deque(maxlen=self._sampling_size)
+        if self.is_binary:
+            self.states = deque(maxlen=self._sampling_size)
+        else:
+            self.states = RollingStatistics(self._sampling_size)
         self.ages = deque(maxlen=self._sampling_size)
 
         self.count = 0
@@ -187,7 +191,10 @@ class StatisticsSensor(SensorEntity):
             if self.is_binary:
                 self.states.append(new_state.state)
             else:
-                self.states.append(float(new_state.state))
+                value = float(new_state.state)
+                if math.isnan(value):
+                    raise ValueError
+                self.states.append(value)
 
             self.ages.append(new_state.last_updated)
         except ValueError:
@@ -283,33 +290,31 @@ class StatisticsSensor(SensorEntity):
         self.count = len(self.states)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if self.count:  # require only one data point
+                self.mean = round(self.states.mean, self._precision)
+                self.median = round(self.states.median, self._precision)
+            else:
+                _LOGGER.debug("%s: no data points", self.entity_id)
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
+            if self.count > 1:  # require at least two data points
+                self.stdev = round(self.states.stdev, self._precision)
+                self.variance = round(self.states.variance, self._precision)
                 if self._quantile_intervals < self.count:
                     self.quantiles = [
                         round(quantile, self._precision)
-                        for quantile in statistics.quantiles(
-                            self.states,
-                            n=self._quantile_intervals,
-                            method=self._quantile_method,
+                        for quantile in self.states.quantiles(
+                            self._quantile_intervals, self._quantile_method
                         )
                     ]
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            else:
+                _LOGGER.debug("%s: less than two data points", self.entity_id)
                 self.stdev = self.variance = self.quantiles = STATE_UNKNOWN
 
             if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+                self.total = round(self.states.total, self._precision)
+                self.min = round(self.states.min, self._precision)
+                self.max = round(self.states.max, self._precision)
 
                 self.min_age = self.ages[0]
                 self.max_age = self.ages[-1]
@@ -11,6 +11,9 @@ import voluptuous as vol
 from homeassistant.core import Context
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.trace import (
+    TRACE_CAPTURE_FULL,
+    TRACE_CAPTURE_OFF,
+    TRACE_CAPTURE_SUMMARY,
     TraceElement,
     script_execution_get,
     trace_id_get,
@@ -20,23 +23,55 @@ from homeassistant.helpers.trace import (
 import homeassistant.util.dt as dt_util
 
 from . import websocket_api
-from .const import CONF_STORED_TRACES, DATA_TRACE, DEFAULT_STORED_TRACES
+from .const import (
+    CONF_CAPTURE,
+    CONF_STORED_TRACES,
+    DATA_TRACE,
+    DATA_TRACE_CAPTURE,
+    DEFAULT_STORED_TRACES,
+)
 from .utils import LimitedSizeDict
 
 DOMAIN = "trace"
 
+CAPTURE_LEVELS = (TRACE_CAPTURE_OFF, TRACE_CAPTURE_SUMMARY, TRACE_CAPTURE_FULL)
+
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_CAPTURE): vol.In(CAPTURE_LEVELS),
 }
 
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN, default={}): vol.Schema(
+            {
+                vol.Optional(CONF_CAPTURE, default=TRACE_CAPTURE_FULL): vol.In(
+                    CAPTURE_LEVELS
+                )
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
 
 async def async_setup(hass, config):
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
+    hass.data[DATA_TRACE_CAPTURE] = config.get(DOMAIN, {}).get(
+        CONF_CAPTURE, TRACE_CAPTURE_FULL
+    )
     websocket_api.async_setup(hass)
     return True
 
 
+def async_get_capture(hass, trace_config):
+    """Return the level of detail of the traces of a script or automation."""
+    if CONF_CAPTURE in trace_config:
+        return trace_config[CONF_CAPTURE]
+    return hass.data.get(DATA_TRACE_CAPTURE, TRACE_CAPTURE_FULL)
+
+
 def async_store_trace(hass, trace, stored_traces):
     """Store a trace if its item_id is valid."""
     key = trace.key
@@ -73,6 +108,7 @@ class ActionTrace:
         self._timestamp_finish: dt.datetime | None = None
         self._timestamp_start: dt.datetime = dt_util.utcnow()
         self.key: tuple[str, str] = key
+        self._dict: dict[str, Any] | None = None
         if trace_id_get():
             trace_set_child_id(self.key, self.run_id)
         trace_id_set((key, self.run_id))
@@ -92,7 +128,13 @@ class ActionTrace:
         self._script_execution = script_execution_get()
 
     def as_dict(self) -> dict[str, Any]:
-        """Return dictionary version of this ActionTrace."""
+        """Return dictionary version of this ActionTrace.
+
+        The trace is only converted when it is viewed, a finished trace is
+        converted once.
+        """
+        if self._dict is not None:
+            return self._dict
 
         result = self.as_short_dict()
 
@@ -111,6 +153,8 @@ class ActionTrace:
         )
         if self._error is not None:
             result["error"] = str(self._error)
+        if self._timestamp_finish is not None:
+            self._dict = result
         return result
 
     def as_short_dict(self) -> dict[str, Any]:
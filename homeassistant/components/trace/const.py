@@ -1,5 +1,7 @@
 """Shared constants for script and automation tracing and debugging."""
 
+CONF_CAPTURE = "capture"
 CONF_STORED_TRACES = "stored_traces"
 DATA_TRACE = "trace"
+DATA_TRACE_CAPTURE = "trace_capture"
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
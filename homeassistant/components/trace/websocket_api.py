@@ -15,6 +15,7 @@ from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.script import (
     SCRIPT_BREAKPOINT_HIT,
     SCRIPT_DEBUG_CONTINUE_ALL,
+    async_get_run_statistics,
     breakpoint_clear,
     breakpoint_clear_all,
     breakpoint_list,
@@ -37,6 +38,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, websocket_trace_get)
     websocket_api.async_register_command(hass, websocket_trace_list)
     websocket_api.async_register_command(hass, websocket_trace_contexts)
+    websocket_api.async_register_command(hass, websocket_run_statistics)
     websocket_api.async_register_command(hass, websocket_breakpoint_clear)
     websocket_api.async_register_command(hass, websocket_breakpoint_list)
     websocket_api.async_register_command(hass, websocket_breakpoint_set)
@@ -138,6 +140,23 @@ def websocket_trace_contexts(hass, connection, msg):
     connection.send_result(msg["id"], contexts)
 
 
+@callback
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "trace/run_statistics",
+        vol.Optional("domain"): vol.In(TRACE_DOMAINS),
+    }
+)
+def websocket_run_statistics(hass, connection, msg):
+    """Return how long the runs of scripts and automations took."""
+    statistics = async_get_run_statistics(hass)
+    if "domain" in msg:
+        statistics = [item for item in statistics if item["domain"] == msg["domain"]]
+
+    connection.send_result(msg["id"], statistics)
+
+
 @callback
 @websocket_api.require_admin
 @websocket_api.websocket_command(
@@ -5,8 +5,10 @@ import asyncio
 from collections.abc import Coroutine
 from contextlib import suppress
 import fnmatch
+from functools import lru_cache
 from ipaddress import IPv6Address, ip_address
 import logging
+import re
 import socket
 from typing import Any, TypedDict, cast
 
@@ -62,6 +64,9 @@ MAX_PROPERTY_VALUE_LEN = 230
 # Dns label max length
 MAX_NAME_LEN = 63
 
+# Number of recently seen services whose matches are kept
+MATCH_CACHE_SIZE = 1024
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.All(
@@ -300,6 +305,92 @@ class FlowDispatcher:
         )
 
 
+def _compile_pattern(matcher: dict[str, str], key: str) -> re.Pattern | None:
+    """Compile the shell-style pattern of a matcher key."""
+    if key not in matcher:
+        return None
+    return re.compile(fnmatch.translate(matcher[key]))
+
+
+def _pattern_matches(pattern: re.Pattern | None, value: str | None) -> bool:
+    """Return if a value matches the pattern of a matcher key."""
+    return pattern is None or (value is not None and bool(pattern.match(value)))
+
+
+class IntegrationMatchers:
+    """The zeroconf matchers of all integrations, compiled per service type.
+
+    The matches of recently seen services are cached, most of them match no
+    integration.
+    """
+
+    def __init__(self, zeroconf_types: dict[str, list[dict[str, str]]]) -> None:
+        """Compile the matchers."""
+        self._matchers = {
+            service_type: [
+                (
+                    matcher["domain"],
+                    _compile_pattern(matcher, "macaddress"),
+                    _compile_pattern(matcher, "name"),
+                    _compile_pattern(matcher, "manufacturer"),
+                )
+                for matcher in matchers
+            ]
+            for service_type, matchers in zeroconf_types.items()
+        }
+        self.async_matching_domains = lru_cache(maxsize=MATCH_CACHE_SIZE)(
+            self._matching_domains
+        )
+
+    def _matching_domains(
+        self,
+        service_type: str,
+        uppercase_mac: str | None,
+        lowercase_name: str | None,
+        lowercase_manufacturer: str | None,
+    ) -> tuple[str, ...]:
+        """Return the domains with a matcher matching the service."""
+        # Not all homekit types are currently used for discovery
+        # so not all service type exist in zeroconf_types
+        return tuple(
+            domain
+            for domain, mac_re, name_re, manufacturer_re in self._matchers.get(
+                service_type, ()
+            )
+            if _pattern_matches(mac_re, uppercase_mac)
+            and _pattern_matches(name_re, lowercase_name)
+            and _pattern_matches(manufacturer_re, lowercase_manufacturer)
+        )
+
+
+class HomeKitModels:
+    """The HomeKit models of all integrations, compiled for fast lookups."""
+
+    def __init__(self, homekit_models: dict[str, str]) -> None:
+        """Compile the models."""
+        self._models = [
+            (
+                model,
+                (f"{model} ", f"{model}-"),
+                re.compile(fnmatch.translate(model)),
+                domain,
+            )
+            for model, domain in homekit_models.items()
+        ]
+        self.async_get_domain = lru_cache(maxsize=MATCH_CACHE_SIZE)(self._get_domain)
+
+    def _get_domain(self, model: str) -> str | None:
+        """Return the domain of the first matching model."""
+        for test_model, prefixes, pattern, domain in self._models:
+            if (
+                model == test_model
+                or model.startswith(prefixes)
+                or pattern.match(model)
+            ):
+                return domain
+        return None
+
+
 class ZeroconfDiscovery:
     """Discovery via zeroconf."""
 
@@ -315,7 +406,8 @@ class ZeroconfDiscovery:
         self.hass = hass
         self.zeroconf = zeroconf
         self.zeroconf_types = zeroconf_types
-        self.homekit_models = homekit_models
+        self.integration_matchers = IntegrationMatchers(zeroconf_types)
+        self.homekit_models = HomeKitModels(homekit_models)
         self.ipv6 = ipv6
 
         self.flow_dispatcher: FlowDispatcher | None = None
@@ -422,30 +514,11 @@ class ZeroconfDiscovery:
         else:
             lowercase_manufacturer = None
 
-        # Not all homekit types are currently used for discovery
-        # so not all service type exist in zeroconf_types
-        for matcher in self.zeroconf_types.get(service_type, []):
-            if len(matcher) > 1:
-                if "macaddress" in matcher and (
-                    uppercase_mac is None
-                    or not fnmatch.fnmatch(uppercase_mac, matcher["macaddress"])
-                ):
-                    continue
-                if "name" in matcher and (
-                    lowercase_name is None
-                    or not fnmatch.fnmatch(lowercase_name, matcher["name"])
-                ):
-                    continue
-                if "manufacturer" in matcher and (
-                    lowercase_manufacturer is None
-                    or not fnmatch.fnmatch(
-                        lowercase_manufacturer, matcher["manufacturer"]
-                    )
-                ):
-                    continue
-
+        for domain in self.integration_matchers.async_matching_domains(
+            service_type, uppercase_mac, lowercase_name, lowercase_manufacturer
+        ):
             flow: ZeroconfFlow = {
-                "domain": matcher["domain"],
+                "domain": domain,
                 "context": {"source": config_entries.SOURCE_ZEROCONF},
                 "data": info,
             }
@@ -453,7 +526,7 @@ class ZeroconfDiscovery:
 
 
 def handle_homekit(
-    hass: HomeAssistant, homekit_models: dict[str, str], info: HaServiceInfo
+    hass: HomeAssistant, homekit_models: HomeKitModels, info: HaServiceInfo
 ) -> ZeroconfFlow | None:
     """Handle a HomeKit discovery.
 
@@ -470,21 +543,14 @@ def handle_homekit(
     if model is None:
         return None
 
-    for test_model in homekit_models:
-        if (
-            model != test_model
-            and not model.startswith((f"{test_model} ", f"{test_model}-"))
-            and not fnmatch.fnmatch(model, test_model)
-        ):
-            continue
-
-        return {
-            "domain": homekit_models[test_model],
-            "context": {"source": config_entries.SOURCE_HOMEKIT},
-            "data": info,
-        }
+    if (domain := homekit_models.async_get_domain(model)) is None:
+        return None
 
-    return None
+    return {
+        "domain": domain,
+        "context": {"source": config_entries.SOURCE_HOMEKIT},
+        "data": info,
+    }
 
 
 def info_from_service(service: AsyncServiceInfo) -> HaServiceInfo | None:
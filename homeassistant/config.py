@@ -25,6 +25,7 @@ from homeassistant.const import (
     ATTR_ASSUMED_STATE,
     ATTR_FRIENDLY_NAME,
     ATTR_HIDDEN,
+    CONF_ABSOLUTE_CHANGE,
     CONF_ALLOWLIST_EXTERNAL_DIRS,
     CONF_ALLOWLIST_EXTERNAL_URLS,
     CONF_AUTH_MFA_MODULES,
@@ -34,15 +35,24 @@ from homeassistant.const import (
     CONF_CUSTOMIZE_DOMAIN,
     CONF_CUSTOMIZE_GLOB,
     CONF_ELEVATION,
+    CONF_EXECUTOR_POOLS,
     CONF_EXTERNAL_URL,
     CONF_ID,
+    CONF_INTEGRATIONS,
     CONF_INTERNAL_URL,
     CONF_LATITUDE,
     CONF_LEGACY_TEMPLATES,
     CONF_LONGITUDE,
+    CONF_MAX_SILENCE,
+    CONF_MAX_WORKERS,
     CONF_MEDIA_DIRS,
+    CONF_MIN_INTERVAL,
     CONF_NAME,
     CONF_PACKAGES,
+    CONF_PERCENTAGE_CHANGE,
+    CONF_STATE_FILTER,
+    CONF_STATE_FILTER_DOMAIN,
+    CONF_STATE_FILTER_GLOB,
     CONF_TEMPERATURE_UNIT,
     CONF_TIME_ZONE,
     CONF_TYPE,
@@ -65,7 +75,7 @@ from homeassistant.requirements import (
 )
 from homeassistant.util.package import is_docker_env
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
-from homeassistant.util.yaml import SECRET_YAML, Secrets, load_yaml
+from homeassistant.util.yaml import SECRET_YAML, ParsedYamlCache, Secrets, load_yaml
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -76,6 +86,9 @@ YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
+DATA_STATE_FILTER = "hass_state_filter"
+DATA_YAML_CACHE_DIR = "hass_yaml_cache_dir"
+YAML_CACHE_DIR = "yaml_cache"
 
 GROUP_CONFIG_PATH = "groups.yaml"
 AUTOMATION_CONFIG_PATH = "automations.yaml"
@@ -202,8 +215,60 @@ CUSTOMIZE_CONFIG_SCHEMA = vol.Schema(
     }
 )
 
+STATE_FILTER_DICT_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_ABSOLUTE_CHANGE): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional(CONF_PERCENTAGE_CHANGE): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional(CONF_MIN_INTERVAL): cv.positive_time_period,
+        vol.Optional(CONF_MAX_SILENCE): cv.positive_time_period,
+    }
+)
+
+STATE_FILTER_CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_STATE_FILTER, default={}): vol.Schema(
+            {cv.entity_id: STATE_FILTER_DICT_SCHEMA}
+        ),
+        vol.Optional(CONF_STATE_FILTER_DOMAIN, default={}): vol.Schema(
+            {cv.string: STATE_FILTER_DICT_SCHEMA}
+        ),
+        vol.Optional(CONF_STATE_FILTER_GLOB, default={}): vol.Schema(
+            {cv.string: STATE_FILTER_DICT_SCHEMA}
+        ),
+    }
+)
+
+
+def _no_integration_in_multiple_pools(pools: dict[str, dict]) -> dict[str, dict]:
+    """Validate that an integration is assigned to one executor pool only."""
+    assigned: dict[str, str] = {}
+    for name, pool in pools.items():
+        for domain in pool[CONF_INTEGRATIONS]:
+            if domain in assigned:
+                raise vol.Invalid(
+                    f"Integration {domain} is assigned to executor pools "
+                    f"{assigned[domain]} and {name}"
+                )
+            assigned[domain] = name
+    return pools
+
+
+EXECUTOR_POOLS_SCHEMA = vol.All(
+    cv.schema_with_slug_keys(
+        {
+            vol.Required(CONF_MAX_WORKERS): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            vol.Required(CONF_INTEGRATIONS): vol.All(cv.ensure_list, [cv.slug]),
+        }
+    ),
+    _no_integration_in_multiple_pools,
+)
+
 CORE_CONFIG_SCHEMA = vol.All(
-    CUSTOMIZE_CONFIG_SCHEMA.extend(
+    CUSTOMIZE_CONFIG_SCHEMA.extend(STATE_FILTER_CONFIG_SCHEMA.schema).extend(
         {
             CONF_NAME: vol.Coerce(str),
             CONF_LATITUDE: cv.latitude,
@@ -257,6 +322,7 @@ CORE_CONFIG_SCHEMA = vol.All(
             vol.Optional(CONF_MEDIA_DIRS): cv.schema_with_slug_keys(vol.IsDir()),
             vol.Optional(CONF_LEGACY_TEMPLATES): cv.boolean,
             vol.Optional(CONF_CURRENCY): cv.currency,
+            vol.Optional(CONF_EXECUTOR_POOLS, default={}): EXECUTOR_POOLS_SCHEMA,
         }
     ),
     _filter_bad_internal_external_urls,
@@ -348,10 +414,13 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     This function allow a component inside the asyncio loop to reload its
     configuration by itself. Include package merge.
     """
+    parsed_cache = None
     if hass.config.config_dir is None:
         secrets = None
     else:
         secrets = Secrets(Path(hass.config.config_dir))
+        if (cache_dir := hass.data.get(DATA_YAML_CACHE_DIR)) is not None:
+            parsed_cache = ParsedYamlCache(Path(cache_dir))
 
     # Not using async_add_executor_job because this is an internal method.
     config = await hass.loop.run_in_executor(
@@ -359,6 +428,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
         load_yaml_config_file,
         hass.config.path(YAML_CONFIG_FILE),
         secrets,
+        parsed_cache,
     )
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
@@ -366,7 +436,9 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
 
 
 def load_yaml_config_file(
-    config_path: str, secrets: Secrets | None = None
+    config_path: str,
+    secrets: Secrets | None = None,
+    parsed_cache: ParsedYamlCache | None = None,
 ) -> dict[Any, Any]:
     """Parse a YAML configuration file.
 
@@ -374,7 +446,10 @@ def load_yaml_config_file(
 
     This method needs to run in an executor.
     """
-    conf_dict = load_yaml(config_path, secrets)
+    conf_dict = load_yaml(config_path, secrets, parsed_cache)
+
+    if parsed_cache is not None:
+        parsed_cache.prune()
 
     if not isinstance(conf_dict, dict):
         msg = (
@@ -611,6 +686,33 @@ async def async_process_ha_core_config(hass: HomeAssistant, config: dict) -> Non
 
     hass.data[DATA_CUSTOMIZE] = EntityValues(cust_exact, cust_domain, cust_glob)
 
+    # State write filters
+    if (
+        config[CONF_STATE_FILTER]
+        or config[CONF_STATE_FILTER_DOMAIN]
+        or config[CONF_STATE_FILTER_GLOB]
+    ):
+        hass.data[DATA_STATE_FILTER] = EntityValues(
+            config[CONF_STATE_FILTER],
+            config[CONF_STATE_FILTER_DOMAIN],
+            OrderedDict(config[CONF_STATE_FILTER_GLOB]),
+        )
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.helpers import significant_change
+
+        await significant_change.async_initialize(hass)
+    else:
+        hass.data.pop(DATA_STATE_FILTER, None)
+
+    # Executor pools, the pools that are no longer used finish their jobs
+    for pool in hass.executor_pools.configure(
+        {
+            name: (pool[CONF_MAX_WORKERS], pool[CONF_INTEGRATIONS])
+            for name, pool in config[CONF_EXECUTOR_POOLS].items()
+        }
+    ):
+        hass.async_add_executor_job(pool.shutdown)
+
     if CONF_UNIT_SYSTEM in config:
         if config[CONF_UNIT_SYSTEM] == CONF_UNIT_SYSTEM_IMPERIAL:
             hac.units = IMPERIAL_SYSTEM
@@ -41,6 +41,7 @@ SUN_EVENT_SUNRISE: Final = "sunrise"
 
 # #### CONFIG ####
 CONF_ABOVE: Final = "above"
+CONF_ABSOLUTE_CHANGE: Final = "absolute_change"
 CONF_ACCESS_TOKEN: Final = "access_token"
 CONF_ADDRESS: Final = "address"
 CONF_AFTER: Final = "after"
@@ -109,6 +110,7 @@ CONF_EVENT: Final = "event"
 CONF_EVENT_DATA: Final = "event_data"
 CONF_EVENT_DATA_TEMPLATE: Final = "event_data_template"
 CONF_EXCLUDE: Final = "exclude"
+CONF_EXECUTOR_POOLS: Final = "executor_pools"
 CONF_EXTERNAL_URL: Final = "external_url"
 CONF_FILENAME: Final = "filename"
 CONF_FILE_PATH: Final = "file_path"
@@ -124,6 +126,7 @@ CONF_ICON: Final = "icon"
 CONF_ICON_TEMPLATE: Final = "icon_template"
 CONF_ID: Final = "id"
 CONF_INCLUDE: Final = "include"
+CONF_INTEGRATIONS: Final = "integrations"
 CONF_INTERNAL_URL: Final = "internal_url"
 CONF_IP_ADDRESS: Final = "ip_address"
 CONF_LATITUDE: Final = "latitude"
@@ -132,9 +135,12 @@ CONF_LIGHTS: Final = "lights"
 CONF_LONGITUDE: Final = "longitude"
 CONF_MAC: Final = "mac"
 CONF_MAXIMUM: Final = "maximum"
+CONF_MAX_SILENCE: Final = "max_silence"
+CONF_MAX_WORKERS: Final = "max_workers"
 CONF_MEDIA_DIRS: Final = "media_dirs"
 CONF_METHOD: Final = "method"
 CONF_MINIMUM: Final = "minimum"
+CONF_MIN_INTERVAL: Final = "min_interval"
 CONF_MODE: Final = "mode"
 CONF_MONITORED_CONDITIONS: Final = "monitored_conditions"
 CONF_MONITORED_VARIABLES: Final = "monitored_variables"
@@ -149,6 +155,7 @@ CONF_PAYLOAD: Final = "payload"
 CONF_PAYLOAD_OFF: Final = "payload_off"
 CONF_PAYLOAD_ON: Final = "payload_on"
 CONF_PENDING_TIME: Final = "pending_time"
+CONF_PERCENTAGE_CHANGE: Final = "percentage_change"
 CONF_PIN: Final = "pin"
 CONF_PLATFORM: Final = "platform"
 CONF_PORT: Final = "port"
@@ -181,6 +188,9 @@ CONF_SLAVE: Final = "slave"
 CONF_SOURCE: Final = "source"
 CONF_SSL: Final = "ssl"
 CONF_STATE: Final = "state"
+CONF_STATE_FILTER: Final = "state_filter"
+CONF_STATE_FILTER_DOMAIN: Final = "state_filter_domain"
+CONF_STATE_FILTER_GLOB: Final = "state_filter_glob"
 CONF_STATE_TEMPLATE: Final = "state_template"
 CONF_STRUCTURE: Final = "structure"
 CONF_SWITCHES: Final = "switches"
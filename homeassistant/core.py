@@ -7,6 +7,7 @@ of entities and react to changes.
 from __future__ import annotations
 
 import asyncio
+from collections import Counter
 from collections.abc import Awaitable, Collection, Coroutine, Iterable, Mapping
 import datetime
 import enum
@@ -67,6 +68,8 @@ from homeassistant.util.async_ import (
     shutdown_run_callback_threadsafe,
 )
 import homeassistant.util.dt as dt_util
+from homeassistant.util.executor import ExecutorPools
+from homeassistant.util.process import ProcessPool
 from homeassistant.util.timeout import TimeoutManager
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM, UnitSystem
 import homeassistant.util.uuid as uuid_util
@@ -233,6 +236,10 @@ class HomeAssistant:
         self._stopped: asyncio.Event | None = None
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
+        # Executor pools integrations can be assigned to
+        self.executor_pools = ExecutorPools()
+        # Worker processes for CPU heavy jobs
+        self.process_pool = ProcessPool()
 
     @property
     def is_running(self) -> bool:
@@ -366,7 +373,7 @@ class HomeAssistant:
             return None
         else:
             task = self.loop.run_in_executor(  # type: ignore
-                None, hassjob.target, *args
+                self.executor_pools.executor_for(hassjob.target), hassjob.target, *args
             )
 
         # If a task is scheduled
@@ -401,8 +408,35 @@ class HomeAssistant:
     def async_add_executor_job(
         self, target: Callable[..., T], *args: Any
     ) -> Awaitable[T]:
-        """Add an executor job from within the event loop."""
-        task = self.loop.run_in_executor(None, target, *args)
+        """Add an executor job from within the event loop.
+
+        The job runs in the executor pool its integration is assigned to or
+        in the default executor.
+        """
+        task = self.loop.run_in_executor(
+            self.executor_pools.executor_for(target), target, *args
+        )
+
+        # If a task is scheduled
+        if self._track_task:
+            self._pending_tasks.append(task)
+
+        return task
+
+    @callback
+    def async_add_process_job(
+        self, target: Callable[..., T], *args: Any
+    ) -> Awaitable[T]:
+        """Add a job that runs in a worker process from within the event loop.
+
+        The target and arguments have to be picklable. Use this for CPU heavy
+        jobs that would hold the GIL for a long time in the executor.
+        """
+        # The result type of the pool's run is not inferred through *args
+        task = cast(
+            "asyncio.Future[T]",
+            self.loop.run_in_executor(None, self.process_pool.run, target, *args),
+        )
 
         # If a task is scheduled
         if self._track_task:
@@ -569,6 +603,11 @@ class HomeAssistant:
                 "Timed out waiting for shutdown stage 3 to complete, the shutdown will continue"
             )
 
+        if self.executor_pools.pools:
+            await self.loop.run_in_executor(None, self.executor_pools.shutdown)
+        if self.process_pool.started:
+            await self.loop.run_in_executor(None, self.process_pool.shutdown)
+
         self.exit_code = exit_code
         self.state = CoreState.stopped
 
@@ -912,7 +951,12 @@ class State:
 
         self.entity_id = entity_id.lower()
         self.state = state
-        self.attributes = MappingProxyType(attributes or {})
+        # Attributes that are already read only are shared with the caller
+        self.attributes = (
+            attributes
+            if isinstance(attributes, MappingProxyType)
+            else MappingProxyType(attributes or {})
+        )
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
@@ -1012,6 +1056,8 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        self._written: Counter[str] = Counter()
+        self._suppressed: Counter[str] = Counter()
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -1129,6 +1175,22 @@ class StateMachine:
         )
         return True
 
+    @callback
+    def async_write_statistics(self) -> dict[str, dict[str, int]]:
+        """Return the number of written and suppressed state writes per domain.
+
+        A write is suppressed when neither the state nor the attributes changed.
+
+        This method must be run in the event loop.
+        """
+        return {
+            domain: {
+                "written": self._written[domain],
+                "suppressed": self._suppressed[domain],
+            }
+            for domain in sorted(self._written.keys() | self._suppressed.keys())
+        }
+
     def set(
         self,
         entity_id: str,
@@ -1204,10 +1266,15 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == MappingProxyType(attributes)
+            # Writers passing back the attributes of the current state skip
+            # the comparison of all attributes
+            same_attr = (
+                attributes is old_state.attributes or old_state.attributes == attributes
+            )
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
+            self._suppressed[old_state.domain] += 1  # type: ignore[union-attr]
             return
 
         if context is None:
@@ -1225,6 +1292,7 @@ class StateMachine:
             old_state is None,
         )
         self._states[entity_id] = state
+        self._written[state.domain] += 1
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -1250,6 +1318,35 @@ class Service:
         self.schema = schema
 
 
+class ServiceSchemaCache:
+    """The data of a service call validated by the schema of the service.
+
+    A caller that passes the same data to every call of a service can pass
+    a cache so the data is only validated again when the schema changed.
+    Every call gets its own copy of the dictionaries and lists of the data,
+    as handlers may change them.
+    """
+
+    __slots__ = ["schema", "data"]
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self.schema: vol.Schema | None = None
+        self.data: dict | None = None
+
+
+def _copy_service_data(value: Any) -> Any:
+    """Copy the dictionaries and lists of service data, sharing other values.
+
+    Validated data can hold objects like templates that must not be copied.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_service_data(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_service_data(item) for item in value]
+    return value
+
+
 class ServiceCall:
     """Representation of a call to a service."""
 
@@ -1410,6 +1507,7 @@ class ServiceRegistry:
         context: Context | None = None,
         limit: float | None = SERVICE_CALL_LIMIT,
         target: dict | None = None,
+        schema_cache: ServiceSchemaCache | None = None,
     ) -> bool | None:
         """
         Call a service.
@@ -1425,6 +1523,9 @@ class ServiceRegistry:
         Because the service is sent as an event you are not allowed to use
         the keys ATTR_DOMAIN and ATTR_SERVICE in your service_data.
 
+        A schema_cache may only be passed by callers that pass the same data
+        and target to every call, their validated data is reused.
+
         This method is a coroutine.
         """
         domain = domain.lower()
@@ -1440,7 +1541,13 @@ class ServiceRegistry:
         if target:
             service_data.update(target)
 
-        if handler.schema:
+        if (
+            schema_cache is not None
+            and schema_cache.data is not None
+            and schema_cache.schema is handler.schema
+        ):
+            processed_data = _copy_service_data(schema_cache.data)
+        elif handler.schema:
             try:
                 processed_data = handler.schema(service_data)
             except vol.Invalid:
@@ -1451,6 +1558,9 @@ class ServiceRegistry:
                     service_data,
                 )
                 raise
+            if schema_cache is not None:
+                schema_cache.schema = handler.schema
+                schema_cache.data = _copy_service_data(processed_data)
         else:
             processed_data = service_data
 
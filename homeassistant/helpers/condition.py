@@ -61,6 +61,7 @@ import homeassistant.util.dt as dt_util
 from .trace import (
     TraceElement,
     trace_append_element,
+    trace_enabled,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -82,6 +83,14 @@ INPUT_ENTITY_ID = re.compile(
 
 ConditionCheckerType = Callable[[HomeAssistant, TemplateVarsType], bool]
 
+# Relative cost of evaluating the conditions of a compiled condition, cheaper
+# conditions of an and/or/not condition are evaluated first
+COST_TRIGGER = 1
+COST_STATE = 2
+COST_NUMERIC_STATE = 3
+COST_TEMPLATE = 10
+COST_OTHER = 5
+
 
 def condition_trace_append(variables: TemplateVarsType, path: str) -> TraceElement:
     """Append a TraceElement to trace[path]."""
@@ -92,6 +101,9 @@ def condition_trace_append(variables: TemplateVarsType, path: str) -> TraceEleme
 
 def condition_trace_set_result(result: bool, **kwargs: Any) -> None:
     """Set the result of TraceElement at the top of the stack."""
+    if not trace_enabled():
+        return
+
     node = trace_stack_top(trace_stack_cv)
 
     # The condition function may be called directly, in which case tracing
@@ -104,6 +116,9 @@ def condition_trace_set_result(result: bool, **kwargs: Any) -> None:
 
 def condition_trace_update_result(**kwargs: Any) -> None:
     """Update the result of TraceElement at the top of the stack."""
+    if not trace_enabled():
+        return
+
     node = trace_stack_top(trace_stack_cv)
 
     # The condition function may be called directly, in which case tracing
@@ -141,6 +156,8 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
     @ft.wraps(condition)
     def wrapper(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Trace condition."""
+        if not trace_enabled():
+            return condition(hass, variables)
         with trace_condition(variables):
             result = condition(hass, variables)
             condition_trace_update_result(result=result)
@@ -156,8 +173,49 @@ async def async_from_config(
 ) -> ConditionCheckerType:
     """Turn a condition configuration into a method.
 
+    A validated configuration is also compiled to a checker that is used while
+    tracing is disabled, see async_compile. It is compiled in the background
+    the first time the condition is tested while tracing is disabled, so
+    conditions that are always traced are never compiled.
+
     Should be run on the event loop.
     """
+    checker = await _async_from_config(hass, config, config_validation)
+    if config_validation:
+        return checker
+
+    compiled: ConditionCheckerType | None = None
+    compiling = False
+
+    async def async_compile_checker() -> None:
+        """Compile the condition for untraced tests."""
+        nonlocal compiled
+        compiled = await async_compile(hass, config)
+
+    def if_condition(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+        """Test the condition, with the compiled checker if tracing is disabled."""
+        nonlocal compiling
+        if not trace_enabled():
+            if compiled is not None:
+                try:
+                    return compiled(hass, variables)
+                except ConditionError:
+                    # Evaluate the condition again to raise the errors in full
+                    pass
+            elif not compiling:
+                compiling = True
+                hass.async_create_task(async_compile_checker())
+        return checker(hass, variables)
+
+    return if_condition
+
+
+async def _async_from_config(
+    hass: HomeAssistant,
+    config: ConfigType | Template,
+    config_validation: bool = True,
+) -> ConditionCheckerType:
+    """Turn a condition configuration into a traced method."""
     if isinstance(config, Template):
         # We got a condition template, wrap it in a configuration to pass along.
         config = {
@@ -194,7 +252,7 @@ async def async_and_from_config(
     if config_validation:
         config = cv.AND_CONDITION_SCHEMA(config)
     checks = [
-        await async_from_config(hass, entry, False) for entry in config["conditions"]
+        await _async_from_config(hass, entry, False) for entry in config["conditions"]
     ]
 
     @trace_condition_function
@@ -229,7 +287,7 @@ async def async_or_from_config(
     if config_validation:
         config = cv.OR_CONDITION_SCHEMA(config)
     checks = [
-        await async_from_config(hass, entry, False) for entry in config["conditions"]
+        await _async_from_config(hass, entry, False) for entry in config["conditions"]
     ]
 
     @trace_condition_function
@@ -264,7 +322,7 @@ async def async_not_from_config(
     if config_validation:
         config = cv.NOT_CONDITION_SCHEMA(config)
     checks = [
-        await async_from_config(hass, entry, False) for entry in config["conditions"]
+        await _async_from_config(hass, entry, False) for entry in config["conditions"]
     ]
 
     @trace_condition_function
@@ -292,6 +350,256 @@ async def async_not_from_config(
     return if_not_condition
 
 
+async def async_compile(
+    hass: HomeAssistant, config: ConfigType | Template
+) -> ConditionCheckerType:
+    """Compile a validated condition configuration into an untraced method.
+
+    Nested and/or/not conditions are flattened and their cheaper conditions
+    are evaluated first, which only changes the result when a condition fails
+    with an error. The entities and thresholds are looked up once. The
+    method raises a ConditionError when a condition fails, but its errors are
+    less detailed than the errors of the method from async_from_config.
+    """
+    return (await _async_compile(hass, config))[1]
+
+
+async def _async_compile(
+    hass: HomeAssistant, config: ConfigType | Template
+) -> tuple[int, ConditionCheckerType]:
+    """Compile a condition and return its cost and method."""
+    if isinstance(config, Template):
+        config = {
+            CONF_CONDITION: "template",
+            CONF_VALUE_TEMPLATE: config,
+        }
+
+    condition = config[CONF_CONDITION]
+    if condition in ("and", "or", "not"):
+        return await _async_compile_multi(hass, config)
+    if condition == "state":
+        return COST_STATE, _compile_state(config)
+    if condition == "numeric_state":
+        return _compile_numeric_state(hass, config)
+    if condition == "template":
+        return COST_TEMPLATE, _compile_template(hass, config)
+    if condition == "trigger":
+        return COST_TRIGGER, await _async_from_config(hass, config, False)
+
+    # Other conditions don't trace while tracing is disabled
+    return COST_OTHER, await _async_from_config(hass, config, False)
+
+
+async def _async_compile_multi(
+    hass: HomeAssistant, config: ConfigType
+) -> tuple[int, ConditionCheckerType]:
+    """Compile an and/or/not condition."""
+    condition = config[CONF_CONDITION]
+    # The conditions of a not condition are or'ed
+    flatten = "or" if condition == "not" else condition
+    compiled = []
+    to_compile = deque(config["conditions"])
+    while to_compile:
+        entry = to_compile.popleft()
+        if not isinstance(entry, Template) and entry[CONF_CONDITION] == flatten:
+            to_compile.extendleft(reversed(entry["conditions"]))
+            continue
+        compiled.append(await _async_compile(hass, entry))
+
+    compiled.sort(key=lambda item: item[0])
+    cost = sum(item[0] for item in compiled)
+    checks = [item[1] for item in compiled]
+    # An and condition stops at the first false condition, an or condition and
+    # a not condition at the first true condition
+    stop_on: bool = condition != "and"
+    is_or: bool = condition == "or"
+
+    def if_multi_condition(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool:
+        """Test and/or/not condition."""
+        error = None
+        for check in checks:
+            try:
+                if bool(check(hass, variables)) is stop_on:
+                    return is_or
+            except ConditionError as ex:
+                error = ex
+
+        if error is not None:
+            raise error
+
+        return not is_or
+
+    return cost, if_multi_condition
+
+
+def _compile_state(config: ConfigType) -> ConditionCheckerType:
+    """Compile a state condition."""
+    entity_ids = config.get(CONF_ENTITY_ID, [])
+    req_states = config.get(CONF_STATE, [])
+    if not isinstance(req_states, list):
+        req_states = [req_states]
+    for_period = config.get("for")
+    attribute = config.get(CONF_ATTRIBUTE)
+
+    # The wanted states and whether they are the state of an input entity
+    wanted = [
+        (
+            req_state,
+            isinstance(req_state, str) and INPUT_ENTITY_ID.match(req_state) is not None,
+        )
+        for req_state in req_states
+    ]
+    has_input_entities = any(is_entity for _, is_entity in wanted)
+    wanted_states = tuple(req_state for req_state, _ in wanted)
+
+    def if_state(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+        """Test state condition."""
+        for entity_id in entity_ids:
+            entity = hass.states.get(entity_id)
+            if entity is None:
+                raise ConditionErrorMessage("state", f"unknown entity {entity_id}")
+
+            if attribute is None:
+                value = entity.state
+            elif attribute in entity.attributes:
+                value = entity.attributes[attribute]
+            else:
+                raise ConditionErrorMessage(
+                    "state",
+                    f"attribute '{attribute}' (of entity {entity_id}) does not exist",
+                )
+
+            if not has_input_entities:
+                if value not in wanted_states:
+                    return False
+            else:
+                for req_state, is_entity in wanted:
+                    if is_entity:
+                        state_entity = hass.states.get(req_state)
+                        if state_entity is None:
+                            raise ConditionErrorMessage(
+                                "state",
+                                f"the 'state' entity {req_state} is unavailable",
+                            )
+                        req_state = state_entity.state
+                    if value == req_state:
+                        break
+                else:
+                    return False
+
+            if for_period is not None and (
+                dt_util.utcnow() - for_period <= entity.last_changed
+            ):
+                return False
+
+        return True
+
+    return if_state
+
+
+def _compile_numeric_state(
+    hass: HomeAssistant, config: ConfigType
+) -> tuple[int, ConditionCheckerType]:
+    """Compile a numeric state condition."""
+    entity_ids = config.get(CONF_ENTITY_ID, [])
+    attribute = config.get(CONF_ATTRIBUTE)
+    value_template = config.get(CONF_VALUE_TEMPLATE)
+    if value_template is not None:
+        value_template.hass = hass
+
+    # The thresholds as (limit, entity id of the limit, below)
+    thresholds = [
+        (None, limit, is_below) if isinstance(limit, str) else (limit, None, is_below)
+        for limit, is_below in (
+            (config.get(CONF_BELOW), True),
+            (config.get(CONF_ABOVE), False),
+        )
+        if limit is not None
+    ]
+
+    def if_numeric_state(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool:
+        """Test numeric state condition."""
+        for entity_id in entity_ids:
+            entity = hass.states.get(entity_id)
+            if entity is None:
+                raise ConditionErrorMessage(
+                    "numeric_state", f"unknown entity {entity_id}"
+                )
+            if attribute is not None and attribute not in entity.attributes:
+                raise ConditionErrorMessage(
+                    "numeric_state",
+                    f"attribute '{attribute}' (of entity {entity_id}) does not exist",
+                )
+
+            if value_template is not None:
+                try:
+                    value = value_template.async_render(
+                        {**(variables or {}), "state": entity}
+                    )
+                except TemplateError as ex:
+                    raise ConditionErrorMessage(
+                        "numeric_state", f"template error: {ex}"
+                    ) from ex
+            elif attribute is None:
+                value = entity.state
+            else:
+                value = entity.attributes[attribute]
+
+            if value in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                return False
+            try:
+                fvalue = float(value)
+            except (ValueError, TypeError) as ex:
+                raise ConditionErrorMessage(
+                    "numeric_state",
+                    f"entity {entity_id} state '{value}' cannot be processed as a number",
+                ) from ex
+
+            for limit, limit_entity_id, is_below in thresholds:
+                if limit_entity_id is not None:
+                    limit_entity = hass.states.get(limit_entity_id)
+                    if limit_entity is None:
+                        raise ConditionErrorMessage(
+                            "numeric_state", f"unknown entity {limit_entity_id}"
+                        )
+                    if limit_entity.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                        return False
+                    try:
+                        limit = float(limit_entity.state)
+                    except ValueError as ex:
+                        raise ConditionErrorMessage(
+                            "numeric_state",
+                            f"entity {limit_entity_id} state cannot be processed as a number",
+                        ) from ex
+                if fvalue >= limit if is_below else fvalue <= limit:
+                    return False
+
+        return True
+
+    cost = COST_NUMERIC_STATE if value_template is None else COST_TEMPLATE
+    return cost, if_numeric_state
+
+
+def _compile_template(hass: HomeAssistant, config: ConfigType) -> ConditionCheckerType:
+    """Compile a template condition."""
+    value_template = cast(Template, config[CONF_VALUE_TEMPLATE])
+    value_template.hass = hass
+
+    def if_template(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+        """Test template condition."""
+        try:
+            value = value_template.async_render(variables, parse_result=False)
+        except TemplateError as ex:
+            raise ConditionErrorMessage("template", str(ex)) from ex
+        return cast(str, value).lower() == "true"
+
+    return if_template
+
+
 def numeric_state(
     hass: HomeAssistant,
     entity: None | str | State,
@@ -11,9 +11,10 @@ import logging
 import math
 import sys
 from timeit import default_timer as timer
+from types import MappingProxyType
 from typing import Any, TypedDict, final
 
-from homeassistant.config import DATA_CUSTOMIZE
+from homeassistant.config import DATA_CUSTOMIZE, DATA_STATE_FILTER
 from homeassistant.const import (
     ATTR_ASSUMED_STATE,
     ATTR_DEVICE_CLASS,
@@ -36,6 +37,7 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.entity_registry import RegistryEntry
 from homeassistant.helpers.event import Event, async_track_entity_registry_updated_event
+from homeassistant.helpers.significant_change import StateWriteFilter
 from homeassistant.helpers.typing import StateType
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util, ensure_unique_string, slugify
@@ -214,6 +216,9 @@ class Entity(ABC):
     # Protect for multiple updates
     _update_staged = False
 
+    # Duration of the last update, excluding the wait for parallel updates
+    _update_duration: float | None = None
+
     # Process updates in parallel
     parallel_updates: asyncio.Semaphore | None = None
 
@@ -227,6 +232,12 @@ class Entity(ABC):
     _context: Context | None = None
     _context_set: datetime | None = None
 
+    # Filter for insignificant state writes, if configured
+    _state_filter: StateWriteFilter | None = None
+
+    # Attributes of the last write and the key they were built for
+    _attributes_cache: tuple[tuple, MappingProxyType] | None = None
+
     # If entity is added to an entity platform
     _added = False
 
@@ -365,6 +376,15 @@ class Entity(ABC):
         """Return True if unable to access real state of the entity."""
         return self._attr_assumed_state
 
+    @property
+    def attributes_fingerprint(self) -> Any:
+        """Return a hashable value that changes whenever the attributes change.
+
+        When not None, the attributes of the previous write are reused as long
+        as the fingerprint stays the same, instead of rebuilding them.
+        """
+        return None
+
     @property
     def force_update(self) -> bool:
         """Return True if state updates should be forced.
@@ -483,10 +503,66 @@ class Entity(ABC):
 
         start = timer()
 
+        state = self._stringify_state()
+        cache_key = None
+        if (fingerprint := self.attributes_fingerprint) is not None:
+            cache_key = (
+                fingerprint,
+                self.available,
+                self.registry_entry,
+                self.hass.data.get(DATA_CUSTOMIZE),
+                self.hass.config.units,
+            )
+            if (
+                self._attributes_cache is not None
+                and self._attributes_cache[0] == cache_key
+            ):
+                # Pass the attributes of the last write back to the state
+                # machine, which skips comparing them to the current state
+                self._async_write_state(state, self._attributes_cache[1])
+                return
+
+        attr = self._async_build_attributes(start)
+
+        # Overwrite properties that have been set in the config file.
+        if DATA_CUSTOMIZE in self.hass.data:
+            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
+
+        # Convert temperature if we detect one
+        converted = False
+        try:
+            unit_of_measure = attr.get(ATTR_UNIT_OF_MEASUREMENT)
+            units = self.hass.config.units
+            if (
+                unit_of_measure in (TEMP_CELSIUS, TEMP_FAHRENHEIT)
+                and unit_of_measure != units.temperature_unit
+            ):
+                converted = True
+                prec = len(state) - state.index(".") - 1 if "." in state else 0
+                temp = units.temperature(float(state), unit_of_measure)
+                state = str(round(temp) if prec == 0 else round(temp, prec))
+                attr[ATTR_UNIT_OF_MEASUREMENT] = units.temperature_unit
+        except ValueError:
+            # Could not convert state to float
+            pass
+
+        # The state of entities with converted temperatures is converted on
+        # every write, so their attributes are not reused
+        if cache_key is None or converted:
+            self._attributes_cache = None
+            self._async_write_state(state, attr)
+            return
+
+        read_only_attr = MappingProxyType(attr)
+        self._attributes_cache = (cache_key, read_only_attr)
+        self._async_write_state(state, read_only_attr)
+
+    @callback
+    def _async_build_attributes(self, start: float) -> dict[str, Any]:
+        """Build the attributes of the entity."""
         attr = self.capability_attributes
         attr = dict(attr) if attr else {}
 
-        state = self._stringify_state()
         if self.available:
             attr.update(self.state_attributes or {})
             extra_state_attributes = self.extra_state_attributes
@@ -533,26 +609,11 @@ class Entity(ABC):
                 report_issue,
             )
 
-        # Overwrite properties that have been set in the config file.
-        if DATA_CUSTOMIZE in self.hass.data:
-            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
-
-        # Convert temperature if we detect one
-        try:
-            unit_of_measure = attr.get(ATTR_UNIT_OF_MEASUREMENT)
-            units = self.hass.config.units
-            if (
-                unit_of_measure in (TEMP_CELSIUS, TEMP_FAHRENHEIT)
-                and unit_of_measure != units.temperature_unit
-            ):
-                prec = len(state) - state.index(".") - 1 if "." in state else 0
-                temp = units.temperature(float(state), unit_of_measure)
-                state = str(round(temp) if prec == 0 else round(temp, prec))
-                attr[ATTR_UNIT_OF_MEASUREMENT] = units.temperature_unit
-        except ValueError:
-            # Could not convert state to float
-            pass
+        return attr
 
+    @callback
+    def _async_write_state(self, state: str, attr: Mapping[str, Any]) -> None:
+        """Write the state and attributes to the state machine."""
         if (
             self._context_set is not None
             and dt_util.utcnow() - self._context_set > self.context_recent_time
@@ -560,10 +621,35 @@ class Entity(ABC):
             self._context = None
             self._context_set = None
 
+        if (
+            state_filter := self._async_get_state_filter()
+        ) is not None and not state_filter.async_filter_write(
+            state, attr, self.force_update, self._context
+        ):
+            return
+
         self.hass.states.async_set(
             self.entity_id, state, attr, self.force_update, self._context
         )
 
+    @callback
+    def _async_get_state_filter(self) -> StateWriteFilter | None:
+        """Return the state write filter configured for this entity."""
+        if (filters := self.hass.data.get(DATA_STATE_FILTER)) is None or not (
+            config := filters.get(self.entity_id)
+        ):
+            if self._state_filter is not None:
+                self._state_filter.async_cancel()
+                self._state_filter = None
+            return None
+
+        if self._state_filter is None or self._state_filter.config is not config:
+            if self._state_filter is not None:
+                self._state_filter.async_cancel()
+            self._state_filter = StateWriteFilter(self.hass, self.entity_id, config)
+
+        return self._state_filter
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
@@ -606,6 +692,7 @@ class Entity(ABC):
         if self.parallel_updates:
             await self.parallel_updates.acquire()
 
+        start = timer()
         try:
             if hasattr(self, "async_update"):
                 task = self.hass.async_create_task(self.async_update())  # type: ignore
@@ -632,6 +719,7 @@ class Entity(ABC):
             )
             await task
         finally:
+            self._update_duration = timer() - start
             self._update_staged = False
             if self.parallel_updates:
                 self.parallel_updates.release()
@@ -702,6 +790,10 @@ class Entity(ABC):
             while self._on_remove:
                 self._on_remove.pop()()
 
+        if self._state_filter is not None:
+            self._state_filter.async_cancel()
+            self._state_filter = None
+
         await self.async_internal_will_remove_from_hass()
         await self.async_will_remove_from_hass()
 
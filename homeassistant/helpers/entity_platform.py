@@ -39,11 +39,12 @@ from . import (
     config_validation as cv,
     device_registry as dev_reg,
     entity_registry as ent_reg,
+    polling,
     service,
 )
 from .device_registry import DeviceRegistry
 from .entity_registry import DISABLED_INTEGRATION, EntityRegistry
-from .event import async_call_later, async_track_time_interval
+from .event import async_call_later
 from .typing import ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -57,6 +58,8 @@ SLOW_ADD_MIN_TIMEOUT = 500
 
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
+DATA_DOMAIN_ENTITIES = "domain_entities"
+DATA_DOMAIN_PLATFORM_ENTITIES = "domain_platform_entities"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
 _LOGGER = logging.getLogger(__name__)
@@ -95,6 +98,15 @@ class EntityPlatform:
         self.entity_namespace = entity_namespace
         self.config_entry: config_entries.ConfigEntry | None = None
         self.entities: dict[str, Entity] = {}
+        # Indexes of all entities of this domain, and of all entities of this
+        # domain provided by this platform type, shared between the platform
+        # instances. Used to resolve service call targets by entity_id.
+        self.domain_entities: dict[str, Entity] = hass.data.setdefault(
+            DATA_DOMAIN_ENTITIES, {}
+        ).setdefault(domain, {})
+        self.domain_platform_entities: dict[str, Entity] = hass.data.setdefault(
+            DATA_DOMAIN_PLATFORM_ENTITIES, {}
+        ).setdefault((domain, platform_name), {})
         self._tasks: list[asyncio.Future] = []
         # Stop tracking tasks after setup is completed
         self._setup_complete = False
@@ -102,7 +114,7 @@ class EntityPlatform:
         self._async_unsub_polling: CALLBACK_TYPE | None = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
-        self._process_updates: asyncio.Lock | None = None
+        self._poller: polling.PlatformPoller | None = None
 
         self.parallel_updates: asyncio.Semaphore | None = None
 
@@ -402,10 +414,13 @@ class EntityPlatform:
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
+        self._async_unsub_polling = polling.async_track_polling_interval(
             self.hass,
             self._update_entity_states,
             self.scan_interval,
+            polling.async_get_scheduler(self.hass).async_next_start_offset(
+                self.scan_interval
+            ),
         )
 
     async def _async_add_entity(  # noqa: C901
@@ -569,6 +584,8 @@ class EntityPlatform:
 
         entity_id = entity.entity_id
         self.entities[entity_id] = entity
+        self.domain_entities[entity_id] = entity
+        self.domain_platform_entities[entity_id] = entity
 
         if not restored:
             # Reserve the state in the state machine
@@ -581,6 +598,8 @@ class EntityPlatform:
         def remove_entity_cb() -> None:
             """Remove entity from entities list."""
             self.entities.pop(entity_id)
+            self.domain_entities.pop(entity_id, None)
+            self.domain_platform_entities.pop(entity_id, None)
 
         entity.async_on_remove(remove_entity_cb)
 
@@ -609,6 +628,16 @@ class EntityPlatform:
         if self._async_unsub_polling is not None:
             self._async_unsub_polling()
             self._async_unsub_polling = None
+        if self._poller is not None:
+            polling.async_get_scheduler(self.hass).async_remove_poller(self)
+            self._poller = None
+
+    @property
+    def poll_statistics(self) -> polling.PollStatistics | None:
+        """Return the polling statistics of the platform."""
+        if self._poller is None:
+            return None
+        return self._poller.statistics
 
     async def async_destroy(self) -> None:
         """Destroy an entity platform.
@@ -626,8 +655,7 @@ class EntityPlatform:
         if self._async_unsub_polling is not None and not any(
             entity.should_poll for entity in self.entities.values()
         ):
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+            self.async_unsub_polling()
 
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
@@ -664,11 +692,7 @@ class EntityPlatform:
             """Handle the service."""
             await service.entity_service_call(
                 self.hass,
-                [
-                    plf
-                    for plf in self.hass.data[DATA_ENTITY_PLATFORM][self.platform_name]
-                    if plf.domain == self.domain
-                ],
+                self.domain_platform_entities,
                 func,
                 call,
                 required_features,
@@ -681,31 +705,14 @@ class EntityPlatform:
     async def _update_entity_states(self, now: datetime) -> None:
         """Update the states of all the polling entities.
 
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+        The polling scheduler spreads the updates over the scan interval and
+        backs off entities whose updates are slow or failing.
 
         This method must be run in the event loop.
         """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
-            self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
-                self.platform_name,
-                self.domain,
-                self.scan_interval,
-            )
-            return
-
-        async with self._process_updates:
-            tasks = []
-            for entity in self.entities.values():
-                if not entity.should_poll:
-                    continue
-                tasks.append(entity.async_update_ha_state(True))
-
-            if tasks:
-                await asyncio.gather(*tasks)
+        if self._poller is None:
+            self._poller = polling.async_get_scheduler(self.hass).async_get_poller(self)
+        await self._poller.async_poll(now)
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
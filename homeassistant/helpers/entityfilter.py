@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import fnmatch
+from functools import lru_cache
 import re
 from typing import Callable
 
@@ -20,6 +21,9 @@ CONF_EXCLUDE_ENTITIES = "exclude_entities"
 
 CONF_ENTITY_GLOBS = "entity_globs"
 
+# Maximum number of entity ids a filter caches the result for
+FILTER_CACHE_SIZE = 16384
+
 
 def convert_filter(config: dict[str, list[str]]) -> Callable[[str], bool]:
     """Convert the filter schema into a filter."""
@@ -104,18 +108,19 @@ INCLUDE_EXCLUDE_FILTER_SCHEMA = vol.All(
 )
 
 
-def _glob_to_re(glob: str) -> re.Pattern[str]:
-    """Translate and compile glob string into pattern."""
-    return re.compile(fnmatch.translate(glob))
+def _convert_globs_to_pattern(globs: set[str]) -> re.Pattern[str] | None:
+    """Convert a set of globs to a single compiled pattern matching any of them."""
+    if not globs:
+        return None
 
+    # Sorted to build the same pattern for the same globs
+    translated = [f"(?:{fnmatch.translate(glob)})" for glob in sorted(globs)]
+    return re.compile("|".join(translated))
 
-def _test_against_patterns(patterns: list[re.Pattern[str]], entity_id: str) -> bool:
-    """Test entity against list of patterns, true if any match."""
-    for pattern in patterns:
-        if pattern.match(entity_id):
-            return True
 
-    return False
+def _test_against_pattern(pattern: re.Pattern[str] | None, entity_id: str) -> bool:
+    """Test entity against a combined pattern, true if it matches."""
+    return pattern is not None and pattern.match(entity_id) is not None
 
 
 # It's safe since we don't modify it. And None causes typing warnings
@@ -128,15 +133,18 @@ def generate_filter(
     include_entity_globs: list[str] = [],
     exclude_entity_globs: list[str] = [],
 ) -> Callable[[str], bool]:
-    """Return a function that will filter entities based on the args."""
+    """Return a function that will filter entities based on the args.
+
+    The globs of each include and exclude class are combined into a single
+    pattern and the result is cached per entity id. Changed filter config
+    generates a new filter, which starts with an empty cache.
+    """
     include_d = set(include_domains)
     include_e = set(include_entities)
     exclude_d = set(exclude_domains)
     exclude_e = set(exclude_entities)
-    include_eg_set = set(include_entity_globs)
-    exclude_eg_set = set(exclude_entity_globs)
-    include_eg = list(map(_glob_to_re, include_eg_set))
-    exclude_eg = list(map(_glob_to_re, exclude_eg_set))
+    include_eg = _convert_globs_to_pattern(set(include_entity_globs))
+    exclude_eg = _convert_globs_to_pattern(set(exclude_entity_globs))
 
     have_exclude = bool(exclude_e or exclude_d or exclude_eg)
     have_include = bool(include_e or include_d or include_eg)
@@ -146,7 +154,7 @@ def generate_filter(
         return (
             entity_id in include_e
             or domain in include_d
-            or bool(include_eg and _test_against_patterns(include_eg, entity_id))
+            or _test_against_pattern(include_eg, entity_id)
         )
 
     def entity_excluded(domain: str, entity_id: str) -> bool:
@@ -154,7 +162,7 @@ def generate_filter(
         return (
             entity_id in exclude_e
             or domain in exclude_d
-            or bool(exclude_eg and _test_against_patterns(exclude_eg, entity_id))
+            or _test_against_pattern(exclude_eg, entity_id)
         )
 
     # Case 1 - no includes or excludes - pass all entities
@@ -164,6 +172,7 @@ def generate_filter(
     # Case 2 - includes, no excludes - only include specified entities
     if have_include and not have_exclude:
 
+        @lru_cache(maxsize=FILTER_CACHE_SIZE)
         def entity_filter_2(entity_id: str) -> bool:
             """Return filter function for case 2."""
             domain = split_entity_id(entity_id)[0]
@@ -174,6 +183,7 @@ def generate_filter(
     # Case 3 - excludes, no includes - only exclude specified entities
     if not have_include and have_exclude:
 
+        @lru_cache(maxsize=FILTER_CACHE_SIZE)
         def entity_filter_3(entity_id: str) -> bool:
             """Return filter function for case 3."""
             domain = split_entity_id(entity_id)[0]
@@ -190,17 +200,16 @@ def generate_filter(
     #   If glob matches then exclude domains and glob checked
     if include_d or include_eg:
 
+        @lru_cache(maxsize=FILTER_CACHE_SIZE)
         def entity_filter_4a(entity_id: str) -> bool:
             """Return filter function for case 4a."""
             domain = split_entity_id(entity_id)[0]
             if domain in include_d:
                 return not (
                     entity_id in exclude_e
-                    or bool(
-                        exclude_eg and _test_against_patterns(exclude_eg, entity_id)
-                    )
+                    or _test_against_pattern(exclude_eg, entity_id)
                 )
-            if _test_against_patterns(include_eg, entity_id):
+            if _test_against_pattern(include_eg, entity_id):
                 return not entity_excluded(domain, entity_id)
             return entity_id in include_e
 
@@ -215,12 +224,11 @@ def generate_filter(
     #  - if domain is not excluded, pass if entity not excluded by ID
     if exclude_d or exclude_eg:
 
+        @lru_cache(maxsize=FILTER_CACHE_SIZE)
         def entity_filter_4b(entity_id: str) -> bool:
             """Return filter function for case 4b."""
             domain = split_entity_id(entity_id)[0]
-            if domain in exclude_d or (
-                exclude_eg and _test_against_patterns(exclude_eg, entity_id)
-            ):
+            if domain in exclude_d or _test_against_pattern(exclude_eg, entity_id):
                 return entity_id in include_e
             return entity_id not in exclude_e
 
@@ -28,6 +28,9 @@ async def async_process_integration_platforms(
             return
 
         integration = await async_get_integration(hass, component_name)
+        # Avoid an import attempt for every integration without the platform
+        if await integration.async_platform_exists(platform_name) is False:
+            return
 
         try:
             platform = integration.get_platform(platform_name)
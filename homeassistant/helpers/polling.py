@@ -0,0 +1,322 @@
+"""Schedule the polling of entities of entity platforms."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import partial
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+
+from .event import async_call_later, async_track_time_interval
+
+if TYPE_CHECKING:
+    from .entity import Entity
+    from .entity_platform import EntityPlatform
+
+DATA_POLLING_SCHEDULER = "polling_scheduler"
+
+# Polling entities are updated in batches of this size. A platform with no
+# more polling entities than this updates all of them at once.
+POLL_BATCH_SIZE = 10
+# Batches are spread over this fraction of the scan interval
+POLL_SPREAD_FRACTION = 0.5
+# An update taking longer than this fraction of the scan interval is slow
+SLOW_POLL_FRACTION = 0.5
+# Consecutive failed updates before an entity is backed off
+BACKOFF_AFTER_FAILURES = 3
+# Maximum number of polling cycles a slow or failing entity is skipped
+MAX_BACKOFF_CYCLES = 16
+# Number of update latencies kept per platform
+LATENCY_SAMPLES = 200
+# Fractional part of the golden ratio, used to spread platform start offsets
+GOLDEN_RATIO_FRACTION = 0.6180339887498949
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class PollStatistics:
+    """Polling statistics of an entity platform."""
+
+    cycles: int = 0
+    overruns: int = 0
+    updates: int = 0
+    failures: int = 0
+    skipped: int = 0
+    last_cycle_duration: float | None = None
+    latencies: deque[float] = field(
+        default_factory=lambda: deque(maxlen=LATENCY_SAMPLES)
+    )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        latencies = sorted(self.latencies)
+        return {
+            "cycles": self.cycles,
+            "overruns": self.overruns,
+            "updates": self.updates,
+            "failures": self.failures,
+            "skipped": self.skipped,
+            "last_cycle_duration": self.last_cycle_duration,
+            "latency_p50": _percentile(latencies, 0.5),
+            "latency_p95": _percentile(latencies, 0.95),
+            "latency_max": latencies[-1] if latencies else None,
+        }
+
+
+@dataclass
+class _EntityPollState:
+    """Backoff state of a polled entity."""
+
+    failures: int = 0
+    backoff: int = 0
+    skip: int = 0
+
+
+def _percentile(values: list[float], percentile: float) -> float | None:
+    """Return the percentile of a sorted list of values."""
+    if not values:
+        return None
+    return values[min(len(values) - 1, int(len(values) * percentile))]
+
+
+class PlatformPoller:
+    """Poll the entities of a single entity platform.
+
+    Polling entities are updated in batches spread over the first part of the
+    scan interval. Entities whose updates keep failing or take too long are
+    skipped for an exponentially growing number of cycles.
+    """
+
+    def __init__(self, hass: HomeAssistant, platform: EntityPlatform) -> None:
+        """Initialize the poller."""
+        self.hass = hass
+        self.platform = platform
+        self.statistics = PollStatistics()
+        self._entity_states: dict[str, _EntityPollState] = {}
+        self._pending_batches = 0
+        self._cycle_start = 0.0
+        self._cancel_batches: list[CALLBACK_TYPE] = []
+
+    @property
+    def scan_interval_seconds(self) -> float:
+        """Return the scan interval of the platform in seconds."""
+        return self.platform.scan_interval.total_seconds()
+
+    async def async_poll(self, now: datetime) -> None:
+        """Run a polling cycle."""
+        platform = self.platform
+
+        if self._pending_batches:
+            self.statistics.overruns += 1
+            platform.logger.warning(
+                "Updating %s %s took longer than the scheduled update interval %s",
+                platform.platform_name,
+                platform.domain,
+                platform.scan_interval,
+            )
+            return
+
+        entities = self._async_due_entities(
+            entity for entity in platform.entities.values() if entity.should_poll
+        )
+        if not entities:
+            return
+
+        self.statistics.cycles += 1
+        self._cycle_start = time.monotonic()
+
+        batches = [
+            entities[idx : idx + POLL_BATCH_SIZE]
+            for idx in range(0, len(entities), POLL_BATCH_SIZE)
+        ]
+        self._pending_batches = len(batches)
+        spacing = self.scan_interval_seconds * POLL_SPREAD_FRACTION / len(batches)
+
+        for idx, batch in enumerate(batches[1:], 1):
+            self._cancel_batches.append(
+                async_call_later(
+                    self.hass,
+                    spacing * idx,
+                    HassJob(partial(self._async_poll_delayed_batch, batch)),
+                )
+            )
+
+        await self._async_poll_batch(batches[0])
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel the batches scheduled for the running cycle."""
+        for cancel in self._cancel_batches:
+            cancel()
+        self._cancel_batches.clear()
+        self._pending_batches = 0
+
+    @callback
+    def _async_due_entities(self, entities: Iterable[Entity]) -> list[Entity]:
+        """Return the entities that should be polled this cycle."""
+        entity_states = self._entity_states
+        current_states: dict[str, _EntityPollState] = {}
+        due = []
+
+        for entity in entities:
+            state = entity_states.get(entity.entity_id) or _EntityPollState()
+            current_states[entity.entity_id] = state
+            if state.skip:
+                state.skip -= 1
+                self.statistics.skipped += 1
+                continue
+            due.append(entity)
+
+        # Drop the state of entities that were removed
+        self._entity_states = current_states
+        return due
+
+    async def _async_poll_delayed_batch(
+        self, batch: list[Entity], _now: datetime
+    ) -> None:
+        """Poll a batch of entities that was spread over the interval."""
+        await self._async_poll_batch(batch)
+
+    async def _async_poll_batch(self, batch: list[Entity]) -> None:
+        """Poll a batch of entities."""
+        await asyncio.gather(*(self.async_poll_entity(entity) for entity in batch))
+
+        self._pending_batches = max(self._pending_batches - 1, 0)
+        if not self._pending_batches:
+            self._cancel_batches.clear()
+            self.statistics.last_cycle_duration = time.monotonic() - self._cycle_start
+
+    async def async_poll_entity(self, entity: Entity) -> None:
+        """Update a single entity and track its latency and failures."""
+        # The entity may have been removed while its batch was waiting
+        if entity.hass is None or entity.entity_id not in self.platform.entities:
+            return
+
+        state = self._entity_states.setdefault(entity.entity_id, _EntityPollState())
+        failed = False
+
+        try:
+            await entity.async_device_update()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Update for %s fails", entity.entity_id)
+            failed = True
+        else:
+            entity.async_write_ha_state()
+
+        # Measured by the entity, so time spent waiting on parallel updates of
+        # other entities is not counted against it
+        duration = entity._update_duration or 0.0  # pylint: disable=protected-access
+        self.statistics.updates += 1
+        self.statistics.latencies.append(duration)
+
+        if failed:
+            self.statistics.failures += 1
+            state.failures += 1
+        else:
+            state.failures = 0
+
+        if state.failures >= BACKOFF_AFTER_FAILURES or (
+            duration > self.scan_interval_seconds * SLOW_POLL_FRACTION
+        ):
+            state.backoff = min(max(state.backoff * 2, 1), MAX_BACKOFF_CYCLES)
+            state.skip = state.backoff
+            _LOGGER.debug(
+                "Backing off polling of %s for %s cycles", entity.entity_id, state.skip
+            )
+        else:
+            state.backoff = 0
+
+
+class PollingScheduler:
+    """Keep track of the pollers of all entity platforms."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the polling scheduler."""
+        self.hass = hass
+        self._pollers: dict[EntityPlatform, PlatformPoller] = {}
+        self._platform_starts = 0
+
+    @callback
+    def async_get_poller(self, platform: EntityPlatform) -> PlatformPoller:
+        """Return the poller of an entity platform."""
+        poller = self._pollers.get(platform)
+        if poller is None:
+            poller = self._pollers[platform] = PlatformPoller(self.hass, platform)
+        return poller
+
+    @callback
+    def async_next_start_offset(self, interval: timedelta) -> timedelta:
+        """Return the delay before the first polling cycle of a platform.
+
+        Offsets follow the golden ratio sequence, so platforms that start
+        polling at the same time are spread evenly over their scan interval.
+        The first platform polls after a full interval and no platform polls
+        later than that.
+        """
+        fraction = 1 - (self._platform_starts * GOLDEN_RATIO_FRACTION) % 1
+        self._platform_starts += 1
+        return interval * fraction
+
+    @callback
+    def async_remove_poller(self, platform: EntityPlatform) -> None:
+        """Remove the poller of an entity platform."""
+        poller = self._pollers.pop(platform, None)
+        if poller is not None:
+            poller.async_cancel()
+
+    @callback
+    def async_get_statistics(self) -> list[dict[str, Any]]:
+        """Return the polling statistics of all entity platforms."""
+        return [
+            {
+                "domain": platform.domain,
+                "platform": platform.platform_name,
+                "config_entry_id": platform.config_entry.entry_id
+                if platform.config_entry
+                else None,
+                "scan_interval": poller.scan_interval_seconds,
+                **poller.statistics.as_dict(),
+            }
+            for platform, poller in self._pollers.items()
+        ]
+
+
+@callback
+@singleton(DATA_POLLING_SCHEDULER)
+def async_get_scheduler(hass: HomeAssistant) -> PollingScheduler:
+    """Return the polling scheduler."""
+    return PollingScheduler(hass)
+
+
+@callback
+def async_track_polling_interval(
+    hass: HomeAssistant,
+    action: Callable[[datetime], Awaitable[None]],
+    interval: timedelta,
+    offset: timedelta,
+) -> CALLBACK_TYPE:
+    """Run a polling action every interval, starting after an offset."""
+    cancel: CALLBACK_TYPE
+
+    async def async_first_poll(now: datetime) -> None:
+        """Poll for the first time and start the interval."""
+        nonlocal cancel
+        cancel = async_track_time_interval(hass, action, interval)
+        await action(now)
+
+    cancel = async_call_later(hass, offset, HassJob(async_first_poll))
+
+    @callback
+    def remove_listener() -> None:
+        """Stop polling."""
+        cancel()
+
+    return remove_listener
@@ -4,10 +4,12 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Sequence
 from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial
 import itertools
 import logging
+import time
 from types import MappingProxyType
 from typing import Any, Callable, Dict, TypedDict, Union, cast
 
@@ -127,6 +129,16 @@ _TIMEOUT_MSG = "Timeout reached, abort script."
 
 _SHUTDOWN_MAX_WAIT = 60
 
+# Actions that never wait for a delay, template or trigger. A script made of
+# only these actions runs in the task of its caller.
+_WAIT_FREE_ACTIONS = {
+    cv.SCRIPT_ACTION_ACTIVATE_SCENE,
+    cv.SCRIPT_ACTION_CALL_SERVICE,
+    cv.SCRIPT_ACTION_CHECK_CONDITION,
+    cv.SCRIPT_ACTION_FIRE_EVENT,
+    cv.SCRIPT_ACTION_VARIABLES,
+}
+
 
 ACTION_TRACE_NODE_MAX_LEN = 20  # Max length of a trace node for repeated actions
 
@@ -367,8 +379,9 @@ class _ScriptRun:
                 if self._stop.is_set():
                     return
                 try:
-                    handler = f"_async_{cv.determine_script_action(self._action)}_step"
-                    await getattr(self, handler)()
+                    # pylint: disable=protected-access
+                    action = self._script._actions[self._step]
+                    await getattr(self, f"_async_{action}_step")()
                 except Exception as ex:
                     if not isinstance(ex, _StopScript) and (
                         self._log_exceptions or log_exceptions
@@ -541,9 +554,9 @@ class _ScriptRun:
         """Call the service specified in the action."""
         self._step_log("call service")
 
-        params = service.async_prepare_call_from_config(
-            self._hass, self._action, self._variables
-        )
+        # pylint: disable=protected-access
+        compiled = self._script._get_service_call(self._step)
+        params = compiled.async_prepare(self._variables)
 
         running_script = (
             params[CONF_DOMAIN] == "automation"
@@ -558,20 +571,19 @@ class _ScriptRun:
             limit = SERVICE_CALL_LIMIT
 
         trace_set_result(params=params, running_script=running_script, limit=limit)
-        service_task = self._hass.async_create_task(
-            self._hass.services.async_call(
-                **params,
-                blocking=True,
-                context=self._context,
-                limit=limit,
-            )
+        service_call = self._hass.services.async_call(
+            **params,
+            blocking=True,
+            context=self._context,
+            limit=limit,
+            schema_cache=compiled.schema_cache,
         )
         if limit is not None:
             # There is a call limit, so just wait for it to finish.
-            await service_task
+            await service_call
             return
 
-        await self._async_run_long_action(service_task)
+        await self._async_run_long_action(self._hass.async_create_task(service_call))
 
     async def _async_device_step(self):
         """Perform the device automation specified in the action."""
@@ -587,12 +599,13 @@ class _ScriptRun:
         """Activate the scene specified in the action."""
         self._step_log("activate scene")
         trace_set_result(scene=self._action[CONF_SCENE])
+        # pylint: disable=protected-access
+        compiled = self._script._get_service_call(self._step)
         await self._hass.services.async_call(
-            scene.DOMAIN,
-            SERVICE_TURN_ON,
-            {ATTR_ENTITY_ID: self._action[CONF_SCENE]},
+            **compiled.async_prepare(),
             blocking=True,
             context=self._context,
+            schema_cache=compiled.schema_cache,
         )
 
     async def _async_event_step(self):
@@ -926,6 +939,16 @@ def _referenced_extract_ids(data: dict[str, Any], key: str, found: set[str]) ->
             found.add(item_id)
 
 
+@dataclass
+class ScriptRunStatistics:
+    """Statistics of the runs of a script."""
+
+    runs: int = 0
+    run_time_total: float = 0.0
+    run_time_max: float = 0.0
+    run_time_last: float | None = None
+
+
 class _ChooseData(TypedDict):
     choices: list[tuple[list[ConditionCheckerType], Script]]
     default: Script | None
@@ -991,6 +1014,9 @@ class Script:
         if script_mode == SCRIPT_MODE_QUEUED:
             self._queue_lck = asyncio.Lock()
         self._config_cache: dict[set[tuple], Callable[..., bool]] = {}
+        self._action_types: list[str] | None = None
+        self._service_calls: dict[int, service.CompiledServiceCall] = {}
+        self.run_statistics = ScriptRunStatistics()
         self._repeat_script: dict[int, Script] = {}
         self._choose_data: dict[int, _ChooseData] = {}
         self._referenced_entities: set[str] | None = None
@@ -1042,6 +1068,53 @@ class Script:
             self.last_action = sub_script.last_action
             self._changed()
 
+    @property
+    def _actions(self) -> list[str]:
+        """Return the type of each action of the sequence."""
+        if self._action_types is None:
+            self._action_types = [
+                cv.determine_script_action(action) for action in self.sequence
+            ]
+        return self._action_types
+
+    @property
+    def _wait_free(self) -> bool:
+        """Return if a run never waits, so it can run in the caller's task."""
+        return self.script_mode != SCRIPT_MODE_QUEUED and all(
+            action in _WAIT_FREE_ACTIONS for action in self._actions
+        )
+
+    def _get_service_call(self, step: int) -> service.CompiledServiceCall:
+        """Return the compiled service call of a service or scene step."""
+        compiled = self._service_calls.get(step)
+        if compiled is None:
+            action = self.sequence[step]
+            if CONF_SCENE in action:
+                action = {
+                    CONF_SERVICE: f"{scene.DOMAIN}.{SERVICE_TURN_ON}",
+                    service.CONF_SERVICE_DATA: {ATTR_ENTITY_ID: action[CONF_SCENE]},
+                }
+            compiled = self._service_calls[step] = service.CompiledServiceCall(
+                self._hass, action
+            )
+        return compiled
+
+    @callback
+    def get_run_statistics(self) -> dict[str, Any]:
+        """Return the statistics of the runs as a dictionary."""
+        statistics = self.run_statistics
+        return {
+            "name": self.name,
+            "domain": self.domain,
+            "runs": statistics.runs,
+            "running": self.runs,
+            "run_time_avg": statistics.run_time_total / statistics.runs
+            if statistics.runs
+            else None,
+            "run_time_max": statistics.run_time_max,
+            "run_time_last": statistics.run_time_last,
+        }
+
     @property
     def is_running(self) -> bool:
         """Return true if script is on."""
@@ -1215,12 +1288,28 @@ class Script:
         self.last_triggered = utcnow()
         self._changed()
 
+        start = time.monotonic()
         try:
-            await asyncio.shield(run.async_run())
+            if self._wait_free:
+                await run.async_run()
+            else:
+                await asyncio.shield(run.async_run())
         except asyncio.CancelledError:
             await run.async_stop()
             self._changed()
             raise
+        finally:
+            self._async_record_run(time.monotonic() - start)
+
+    @callback
+    def _async_record_run(self, run_time: float) -> None:
+        """Record how long a run took."""
+        statistics = self.run_statistics
+        statistics.runs += 1
+        statistics.run_time_total += run_time
+        statistics.run_time_last = run_time
+        if run_time > statistics.run_time_max:
+            statistics.run_time_max = run_time
 
     async def _async_stop(
         self, aws: list[asyncio.Task], update_state: bool, spare: _ScriptRun | None
@@ -1344,6 +1433,15 @@ class Script:
             self._logger.log(level, msg, *args, **kwargs)
 
 
+@callback
+def async_get_run_statistics(hass: HomeAssistant) -> list[dict[str, Any]]:
+    """Return the run statistics of the top level scripts."""
+    return [
+        script["instance"].get_run_statistics()
+        for script in hass.data.get(DATA_SCRIPTS, [])
+    ]
+
+
 @callback
 def breakpoint_clear(hass, key, run_id, node):
     """Clear a breakpoint."""
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Awaitable, Iterable
+import copy
 import dataclasses
 from functools import partial, wraps
 import logging
@@ -23,7 +24,13 @@ from homeassistant.const import (
     ENTITY_MATCH_ALL,
     ENTITY_MATCH_NONE,
 )
-from homeassistant.core import Context, HomeAssistant, ServiceCall, callback
+from homeassistant.core import (
+    Context,
+    HomeAssistant,
+    ServiceCall,
+    ServiceSchemaCache,
+    callback,
+)
 from homeassistant.exceptions import (
     HomeAssistantError,
     TemplateError,
@@ -165,6 +172,65 @@ async def async_call_from_config(
         await hass.services.async_call(**params, blocking=blocking, context=context)
 
 
+def _async_render_service(
+    hass: HomeAssistant, domain_service: str | template.Template, variables: Any
+) -> tuple[str, str]:
+    """Render the service name of a config as domain and service."""
+    if isinstance(domain_service, template.Template):
+        try:
+            domain_service.hass = hass
+            domain_service = domain_service.async_render(variables)
+            domain_service = cv.service(domain_service)
+        except TemplateError as ex:
+            raise HomeAssistantError(
+                f"Error rendering service name template: {ex}"
+            ) from ex
+        except vol.Invalid as ex:
+            raise HomeAssistantError(
+                f"Template rendered invalid service: {domain_service}"
+            ) from ex
+
+    domain, service = domain_service.split(".", 1)
+    return domain, service
+
+
+def _async_render_target(
+    hass: HomeAssistant, conf: Any, variables: TemplateVarsType
+) -> dict[str, Any]:
+    """Render the target of a config."""
+    target: dict[str, Any] = {}
+    try:
+        if isinstance(conf, template.Template):
+            conf.hass = hass
+            target.update(conf.async_render(variables))
+        else:
+            template.attach(hass, conf)
+            target.update(template.render_complex(conf, variables))
+
+        if CONF_ENTITY_ID in target:
+            target[CONF_ENTITY_ID] = cv.comp_entity_ids(target[CONF_ENTITY_ID])
+    except TemplateError as ex:
+        raise HomeAssistantError(
+            f"Error rendering service target template: {ex}"
+        ) from ex
+    except vol.Invalid as ex:
+        raise HomeAssistantError(
+            f"Template rendered invalid entity IDs: {target[CONF_ENTITY_ID]}"
+        ) from ex
+    return target
+
+
+def _async_render_data(
+    hass: HomeAssistant, conf: Any, variables: TemplateVarsType
+) -> Any:
+    """Render the data or data template of a config."""
+    try:
+        template.attach(hass, conf)
+        return template.render_complex(conf, variables)
+    except TemplateError as ex:
+        raise HomeAssistantError(f"Error rendering data template: {ex}") from ex
+
+
 @callback
 @bind_hass
 def async_prepare_call_from_config(
@@ -175,66 +241,25 @@ def async_prepare_call_from_config(
 ) -> ServiceParams:
     """Prepare to call a service based on a config hash."""
     if validate_config:
-        try:
-            config = cv.SERVICE_SCHEMA(config)
-        except vol.Invalid as ex:
-            raise HomeAssistantError(
-                f"Invalid config for calling service: {ex}"
-            ) from ex
+        config = _validate_call_config(config)
 
     if CONF_SERVICE in config:
         domain_service = config[CONF_SERVICE]
     else:
         domain_service = config[CONF_SERVICE_TEMPLATE]
 
-    if isinstance(domain_service, template.Template):
-        try:
-            domain_service.hass = hass
-            domain_service = domain_service.async_render(variables)
-            domain_service = cv.service(domain_service)
-        except TemplateError as ex:
-            raise HomeAssistantError(
-                f"Error rendering service name template: {ex}"
-            ) from ex
-        except vol.Invalid as ex:
-            raise HomeAssistantError(
-                f"Template rendered invalid service: {domain_service}"
-            ) from ex
-
-    domain, service = domain_service.split(".", 1)
+    domain, service = _async_render_service(hass, domain_service, variables)
 
     target = {}
     if CONF_TARGET in config:
-        conf = config[CONF_TARGET]
-        try:
-            if isinstance(conf, template.Template):
-                conf.hass = hass
-                target.update(conf.async_render(variables))
-            else:
-                template.attach(hass, conf)
-                target.update(template.render_complex(conf, variables))
-
-            if CONF_ENTITY_ID in target:
-                target[CONF_ENTITY_ID] = cv.comp_entity_ids(target[CONF_ENTITY_ID])
-        except TemplateError as ex:
-            raise HomeAssistantError(
-                f"Error rendering service target template: {ex}"
-            ) from ex
-        except vol.Invalid as ex:
-            raise HomeAssistantError(
-                f"Template rendered invalid entity IDs: {target[CONF_ENTITY_ID]}"
-            ) from ex
+        target = _async_render_target(hass, config[CONF_TARGET], variables)
 
     service_data = {}
 
     for conf in (CONF_SERVICE_DATA, CONF_SERVICE_DATA_TEMPLATE):
         if conf not in config:
             continue
-        try:
-            template.attach(hass, config[conf])
-            service_data.update(template.render_complex(config[conf], variables))
-        except TemplateError as ex:
-            raise HomeAssistantError(f"Error rendering data template: {ex}") from ex
+        service_data.update(_async_render_data(hass, config[conf], variables))
 
     if CONF_SERVICE_ENTITY_ID in config:
         if target:
@@ -250,6 +275,105 @@ def async_prepare_call_from_config(
     }
 
 
+def _validate_call_config(config: ConfigType) -> ConfigType:
+    """Validate the config of a service call."""
+    try:
+        return cv.SERVICE_SCHEMA(config)  # type: ignore[no-any-return]
+    except vol.Invalid as ex:
+        raise HomeAssistantError(f"Invalid config for calling service: {ex}") from ex
+
+
+class CompiledServiceCall:
+    """A service call config that is validated and split up once.
+
+    The parts of the config without templates are rendered when the call is
+    compiled, only the templates are rendered for each call. The data of a
+    config without any templates is the same for every call, so it is also
+    validated only once by the schema of the service.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, config: ConfigType, validate_config: bool = False
+    ) -> None:
+        """Compile a service call config."""
+        if validate_config:
+            config = _validate_call_config(config)
+        self.hass = hass
+        self.config = config
+        self.static = template.is_static_complex(config)
+        self.schema_cache = ServiceSchemaCache() if self.static else None
+
+        domain_service = config.get(CONF_SERVICE, config.get(CONF_SERVICE_TEMPLATE))
+        self._domain_service: tuple[str, str] | None = None
+        if template.is_static_complex(domain_service):
+            self._domain_service = _async_render_service(hass, domain_service, None)
+
+        self._target: dict[str, Any] | None = None
+        if CONF_TARGET in config and template.is_static_complex(config[CONF_TARGET]):
+            self._target = _async_render_target(hass, config[CONF_TARGET], None)
+
+        # The data and data template in order, each split into the rendered
+        # keys without templates and the keys that have to be rendered
+        self._data: list[tuple[dict[str, Any], Any]] = []
+        for conf in (CONF_SERVICE_DATA, CONF_SERVICE_DATA_TEMPLATE):
+            if conf not in config:
+                continue
+            data = config[conf]
+            if not isinstance(data, dict):
+                self._data.append(({}, data))
+                continue
+            static = {
+                key: value
+                for key, value in data.items()
+                if template.is_static_complex(key) and template.is_static_complex(value)
+            }
+            dynamic = {key: value for key, value in data.items() if key not in static}
+            self._data.append(
+                (
+                    _async_render_data(hass, static, None),
+                    dynamic or None,
+                )
+            )
+
+    @callback
+    def async_prepare(self, variables: TemplateVarsType = None) -> ServiceParams:
+        """Prepare the parameters of a call, rendering the templates."""
+        config = self.config
+        hass = self.hass
+
+        if self._domain_service is not None:
+            domain, service = self._domain_service
+        else:
+            domain, service = _async_render_service(
+                hass,
+                config.get(CONF_SERVICE, config.get(CONF_SERVICE_TEMPLATE)),
+                variables,
+            )
+
+        target: dict[str, Any] = {}
+        if self._target is not None:
+            target = copy.deepcopy(self._target)
+        elif CONF_TARGET in config:
+            target = _async_render_target(hass, config[CONF_TARGET], variables)
+
+        # The rendered data is shared by all calls, handlers may change their copy
+        service_data: dict[str, Any] = {}
+        for static, dynamic in self._data:
+            service_data.update(copy.deepcopy(static))
+            if dynamic is not None:
+                service_data.update(_async_render_data(hass, dynamic, variables))
+
+        if CONF_SERVICE_ENTITY_ID in config:
+            target[ATTR_ENTITY_ID] = config[CONF_SERVICE_ENTITY_ID]
+
+        return {
+            "domain": domain,
+            "service": service,
+            "service_data": service_data,
+            "target": target,
+        }
+
+
 @bind_hass
 def extract_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
@@ -519,13 +643,17 @@ def async_set_service_schema(
 @bind_hass
 async def entity_service_call(
     hass: HomeAssistant,
-    platforms: Iterable[EntityPlatform],
+    platforms: Iterable[EntityPlatform] | dict[str, Entity],
     func: str | Callable[..., Any],
     call: ServiceCall,
     required_features: Iterable[int] | None = None,
 ) -> None:
     """Handle an entity service call.
 
+    Platforms can either be an iterable of entity platforms or a dict that
+    maps entity_id to the registered entities, in which case the targeted
+    entities are looked up directly instead of scanning all entities.
+
     Calls all platforms simultaneously.
     """
     if call.context.user_id:
@@ -559,57 +687,51 @@ async def entity_service_call(
     else:
         data = call
 
-    # Check the permissions
-
     # A list with entities to call the service on.
     entity_candidates: list[Entity] = []
 
-    if entity_perms is None:
-        for platform in platforms:
-            if target_all_entities:
+    if target_all_entities:
+        if isinstance(platforms, dict):
+            entity_candidates.extend(platforms.values())
+        else:
+            for platform in platforms:
                 entity_candidates.extend(platform.entities.values())
-            else:
-                assert all_referenced is not None
-                entity_candidates.extend(
-                    [
-                        entity
-                        for entity in platform.entities.values()
-                        if entity.entity_id in all_referenced
-                    ]
-                )
 
-    elif target_all_entities:
         # If we target all entities, we will select all entities the user
         # is allowed to control.
-        for platform in platforms:
-            entity_candidates.extend(
-                [
-                    entity
-                    for entity in platform.entities.values()
-                    if entity_perms(entity.entity_id, POLICY_CONTROL)
-                ]
-            )
+        if entity_perms is not None:
+            entity_candidates = [
+                entity
+                for entity in entity_candidates
+                if entity_perms(entity.entity_id, POLICY_CONTROL)
+            ]
 
     else:
         assert all_referenced is not None
 
-        for platform in platforms:
-            platform_entities = []
-            for entity in platform.entities.values():
+        if isinstance(platforms, dict):
+            registered_entities: list[dict[str, Entity]] = [platforms]
+        else:
+            registered_entities = [platform.entities for platform in platforms]
 
-                if entity.entity_id not in all_referenced:
+        # Look up the targeted entities instead of scanning all entities
+        for entities_by_id in registered_entities:
+            for entity_id in all_referenced:
+                entity = entities_by_id.get(entity_id)
+                if entity is None:
                     continue
 
-                if not entity_perms(entity.entity_id, POLICY_CONTROL):
+                # Check the permissions
+                if entity_perms is not None and not entity_perms(
+                    entity_id, POLICY_CONTROL
+                ):
                     raise Unauthorized(
                         context=call.context,
-                        entity_id=entity.entity_id,
+                        entity_id=entity_id,
                         permission=POLICY_CONTROL,
                     )
 
-                platform_entities.append(entity)
-
-            entity_candidates.extend(platform_entities)
+                entity_candidates.append(entity)
 
     if not target_all_entities:
         assert referenced is not None
@@ -25,26 +25,40 @@ level of significance.
 The following cases will never be passed to your function:
 - if either state is unknown/unavailable
 - state adding/removing
+
+Entities can also be configured to filter insignificant state writes before
+they reach the state machine, see `StateWriteFilter`.
 """
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Mapping
+from datetime import timedelta
 from types import MappingProxyType
 from typing import Any, Callable, Optional, Union
 
-from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.const import (
+    CONF_ABSOLUTE_CHANGE,
+    CONF_MAX_SILENCE,
+    CONF_MIN_INTERVAL,
+    CONF_PERCENTAGE_CHANGE,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import Context, HomeAssistant, State, callback
 
 from .integration_platform import async_process_integration_platforms
 
 PLATFORM = "significant_change"
 DATA_FUNCTIONS = "significant_change"
+DEFAULT_MAX_SILENCE = timedelta(minutes=5)
 CheckTypeFunc = Callable[
     [
         HomeAssistant,
         str,
-        Union[dict, MappingProxyType],
+        Mapping[str, Any],
         str,
-        Union[dict, MappingProxyType],
+        Mapping[str, Any],
     ],
     Optional[bool],
 ]
@@ -69,12 +83,12 @@ async def create_checker(
     extra_significant_check: ExtraCheckTypeFunc | None = None,
 ) -> SignificantlyChangedChecker:
     """Create a significantly changed checker for a domain."""
-    await _initialize(hass)
+    await async_initialize(hass)
     return SignificantlyChangedChecker(hass, extra_significant_check)
 
 
 # Marked as singleton so multiple calls all wait for same output.
-async def _initialize(hass: HomeAssistant) -> None:
+async def async_initialize(hass: HomeAssistant) -> None:
     """Initialize the functions."""
     if DATA_FUNCTIONS in hass.data:
         return
@@ -234,3 +248,167 @@ class SignificantlyChangedChecker:
             extra_arg,
         )
         return True
+
+
+class StateWriteFilter:
+    """Class to filter insignificant state writes of an entity.
+
+    A state is written when it changed significantly compared to the last
+    written state. Numeric states are compared with the configured absolute
+    and percentage change, other states with the significant change platform
+    of the domain. Any attribute change is significant.
+
+    Held back states are not lost: the latest one is written once the minimum
+    interval or the maximum silence has passed since the last write.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entity_id: str, config: Mapping[str, Any]
+    ) -> None:
+        """Initialize the state write filter."""
+        self.hass = hass
+        self.entity_id = entity_id
+        self.config = config
+        self.written = 0
+        self.suppressed = 0
+        self._absolute_change: float | None = config.get(CONF_ABSOLUTE_CHANGE)
+        self._percentage_change: float | None = config.get(CONF_PERCENTAGE_CHANGE)
+        min_interval: timedelta | None = config.get(CONF_MIN_INTERVAL)
+        self._min_interval = min_interval.total_seconds() if min_interval else 0.0
+        self._max_silence = config.get(
+            CONF_MAX_SILENCE, DEFAULT_MAX_SILENCE
+        ).total_seconds()
+        self._last_state: str | None = None
+        self._last_attributes: Mapping[str, Any] | None = None
+        self._last_write = 0.0
+        self._pending: tuple[str, Mapping[str, Any], bool, Context | None] | None = None
+        self._timer: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_filter_write(
+        self,
+        new_state: str,
+        attributes: Mapping[str, Any],
+        force_update: bool,
+        context: Context | None,
+    ) -> bool:
+        """Return if the state should be written to the state machine now.
+
+        States that are held back are written later by the filter itself.
+        """
+        now = self.hass.loop.time()
+
+        if self._last_state is None:
+            pass
+        elif self._is_significant(new_state, attributes):
+            if now - self._last_write < self._min_interval:
+                self._async_hold(
+                    (new_state, attributes, force_update, context),
+                    self._last_write + self._min_interval,
+                )
+                return False
+        elif now - self._last_write < self._max_silence:
+            self._async_hold(
+                (new_state, attributes, force_update, context),
+                self._last_write + self._max_silence,
+            )
+            return False
+
+        self._async_written(new_state, attributes, now)
+        return True
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel writing the held back state."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending = None
+
+    def _is_significant(self, new_state: str, attributes: Mapping[str, Any]) -> bool:
+        """Test if a state changed significantly from the last written state."""
+        old_state = self._last_state
+        assert old_state is not None
+
+        if attributes != self._last_attributes:
+            return True
+
+        if new_state == old_state:
+            return False
+
+        if old_state in (STATE_UNKNOWN, STATE_UNAVAILABLE) or new_state in (
+            STATE_UNKNOWN,
+            STATE_UNAVAILABLE,
+        ):
+            return True
+
+        if self._absolute_change is not None or self._percentage_change is not None:
+            try:
+                old_value = float(old_state)
+                new_value = float(new_state)
+            except ValueError:
+                return True
+
+            return (
+                self._absolute_change is None
+                or check_absolute_change(old_value, new_value, self._absolute_change)
+            ) and (
+                self._percentage_change is None
+                or check_percentage_change(
+                    old_value, new_value, self._percentage_change
+                )
+            )
+
+        functions: dict[str, CheckTypeFunc] | None = self.hass.data.get(DATA_FUNCTIONS)
+        if functions is None:
+            return True
+
+        check_significantly_changed = functions.get(self.entity_id.split(".", 1)[0])
+        if check_significantly_changed is None:
+            return True
+
+        result = check_significantly_changed(
+            self.hass, old_state, self._last_attributes, new_state, attributes
+        )
+        return result is not False
+
+    @callback
+    def _async_hold(
+        self,
+        pending: tuple[str, Mapping[str, Any], bool, Context | None],
+        when: float,
+    ) -> None:
+        """Hold back a state until it is written at the latest at when."""
+        self._pending = pending
+        self.suppressed += 1
+
+        if self._timer is not None:
+            if self._timer.when() <= when:
+                return
+            self._timer.cancel()
+
+        self._timer = self.hass.loop.call_at(when, self._async_write_pending)
+
+    @callback
+    def _async_write_pending(self) -> None:
+        """Write the held back state."""
+        self._timer = None
+        if self._pending is None:
+            return
+
+        new_state, attributes, force_update, context = self._pending
+        self._async_written(new_state, attributes, self.hass.loop.time())
+        self.hass.states.async_set(
+            self.entity_id, new_state, attributes, force_update, context
+        )
+
+    @callback
+    def _async_written(
+        self, new_state: str, attributes: Mapping[str, Any], now: float
+    ) -> None:
+        """Track that a state was written."""
+        self.written += 1
+        self._last_state = new_state
+        self._last_attributes = attributes
+        self._last_write = now
+        self.async_cancel()
@@ -135,6 +135,19 @@ def is_complex(value: Any) -> bool:
     return False
 
 
+def is_static_complex(value: Any) -> bool:
+    """Test if a data structure renders the same without depending on variables."""
+    if isinstance(value, Template):
+        return bool(value.is_static)
+    if isinstance(value, list):
+        return all(is_static_complex(val) for val in value)
+    if isinstance(value, collections.abc.Mapping):
+        return all(is_static_complex(val) for val in value.keys()) and all(
+            is_static_complex(val) for val in value.values()
+        )
+    return True
+
+
 def is_template_string(maybe_template: str) -> bool:
     """Check if the input is a Jinja2 template."""
     return _RE_JINJA_DELIMITERS.search(maybe_template) is not None
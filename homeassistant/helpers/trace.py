@@ -11,6 +11,11 @@ from typing import Any, Callable, cast
 from homeassistant.helpers.typing import TemplateVarsType
 import homeassistant.util.dt as dt_util
 
+# Levels of detail traces are captured with
+TRACE_CAPTURE_OFF = "off"
+TRACE_CAPTURE_SUMMARY = "summary"
+TRACE_CAPTURE_FULL = "full"
+
 
 class TraceElement:
     """Container for trace data."""
@@ -25,15 +30,24 @@ class TraceElement:
         self.reuse_by_child = False
         self._timestamp = dt_util.utcnow()
 
+        self._variables: dict[str, Any] | None = None
+
+        if trace_capture_cv.get() != TRACE_CAPTURE_FULL:
+            return
         if variables is None:
             variables = {}
+
+        # The copy of the last variables is shared by the steps until the
+        # variables change, so unchanged steps don't copy them
         last_variables = variables_cv.get() or {}
-        variables_cv.set(dict(variables))
         changed_variables = {
             key: value
             for key, value in variables.items()
-            if key not in last_variables or last_variables[key] != value
+            if key not in last_variables
+            or (last_variables[key] is not value and last_variables[key] != value)
         }
+        if changed_variables or len(variables) != len(last_variables):
+            variables_cv.set(dict(variables))
         self._variables = changed_variables
 
     def __repr__(self) -> str:
@@ -89,6 +103,10 @@ trace_stack_cv: ContextVar[list[TraceElement] | None] = ContextVar(
 trace_path_stack_cv: ContextVar[list[str] | None] = ContextVar(
     "trace_path_stack_cv", default=None
 )
+# Level of detail of the current trace
+trace_capture_cv: ContextVar[str] = ContextVar(
+    "trace_capture_cv", default=TRACE_CAPTURE_FULL
+)
 # Copy of last variables
 variables_cv: ContextVar[Any | None] = ContextVar("variables_cv", default=None)
 # (domain, item_id) + Run ID
@@ -111,6 +129,11 @@ def trace_id_get() -> tuple[tuple[str, str], str] | None:
     return trace_id_cv.get()
 
 
+def trace_enabled() -> bool:
+    """Return if the steps of the current trace are recorded."""
+    return trace_capture_cv.get() != TRACE_CAPTURE_OFF
+
+
 def trace_stack_push(trace_stack_var: ContextVar, node: Any) -> None:
     """Push an element to the top of a trace stack."""
     trace_stack = trace_stack_var.get()
@@ -160,6 +183,8 @@ def trace_append_element(
     maxlen: int | None = None,
 ) -> None:
     """Append a TraceElement to trace[path]."""
+    if not trace_enabled():
+        return
     path = trace_element.path
     trace = trace_cv.get()
     if trace is None:
@@ -1,24 +1,128 @@
 """Triggers."""
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 import asyncio
+from collections.abc import Hashable
+from dataclasses import dataclass
 import logging
 from typing import Any, Callable
 
 import voluptuous as vol
 
 from homeassistant.const import CONF_ID, CONF_PLATFORM
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Context, HassJob, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.typing import ConfigType, TemplateVarsType
 from homeassistant.loader import IntegrationNotFound, async_get_integration
 
+DATA_SHARED_TRIGGERS = "shared_triggers"
+
 _PLATFORM_ALIASES = {
     "device_automation": ("device",),
     "homeassistant": ("event", "numeric_state", "state", "time_pattern", "time"),
 }
 
 
+@dataclass(frozen=True, eq=False)
+class TriggerSubscriber:
+    """An automation that subscribed to a shared trigger."""
+
+    job: HassJob
+    trigger_data: dict[str, Any]
+    platform_type: str
+    name: str
+
+
+class SharedTrigger(ABC):
+    """A trigger that is shared by the automations with the same trigger.
+
+    The trigger listens for the events once and calls the actions of all its
+    subscribers when it fires.
+    """
+
+    def __init__(self, hass: HomeAssistant, key: Hashable | None) -> None:
+        """Initialize the trigger, a trigger without a key is not shared."""
+        self.hass = hass
+        self._key = key
+        self._subscribers: list[TriggerSubscriber] = []
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @property
+    def subscribers(self) -> list[TriggerSubscriber]:
+        """Return the subscribers of the trigger."""
+        return self._subscribers
+
+    @callback
+    def async_subscribe(self, subscriber: TriggerSubscriber) -> CALLBACK_TYPE:
+        """Subscribe to the trigger and return a function to unsubscribe."""
+        if not self._subscribers:
+            self._unsub = self._async_attach()
+        self._subscribers.append(subscriber)
+
+        @callback
+        def async_unsubscribe() -> None:
+            """Unsubscribe from the trigger."""
+            self._subscribers.remove(subscriber)
+            if self._subscribers:
+                return
+            if self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+            if self._key is not None:
+                self.hass.data[DATA_SHARED_TRIGGERS].pop(self._key, None)
+
+        return async_unsubscribe
+
+    @abstractmethod
+    @callback
+    def _async_attach(self) -> CALLBACK_TYPE:
+        """Start listening and return a function to stop listening."""
+
+    @callback
+    def async_fire(
+        self,
+        subscribers: list[TriggerSubscriber],
+        trigger: dict[str, Any],
+        context: Context | None,
+    ) -> None:
+        """Call the actions of the subscribers that are still subscribed."""
+        for subscriber in subscribers:
+            if subscriber not in self._subscribers:
+                continue
+            self.hass.async_run_hass_job(
+                subscriber.job,
+                {
+                    "trigger": {
+                        **subscriber.trigger_data,
+                        "platform": subscriber.platform_type,
+                        **trigger,
+                    }
+                },
+                context,
+            )
+
+
+@callback
+def async_get_shared_trigger(
+    hass: HomeAssistant,
+    key: Hashable,
+    factory: Callable[[Hashable | None], SharedTrigger],
+) -> SharedTrigger:
+    """Return the shared trigger with a key, a trigger with an unhashable key is not shared."""
+    try:
+        hash(key)
+    except TypeError:
+        return factory(None)
+
+    shared_triggers: dict[Hashable, SharedTrigger] = hass.data.setdefault(
+        DATA_SHARED_TRIGGERS, {}
+    )
+    if (trigger := shared_triggers.get(key)) is None:
+        trigger = shared_triggers[key] = factory(key)
+    return trigger
+
+
 async def _async_get_trigger_platform(hass: HomeAssistant, config: ConfigType) -> Any:
     platform_and_sub_type = config[CONF_PLATFORM].split(".")
     platform = platform_and_sub_type[0]
@@ -14,6 +14,7 @@ import json
 import logging
 import pathlib
 import sys
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable, Dict, TypedDict, TypeVar, cast
 
@@ -23,12 +24,12 @@ from awesomeversion import (
     AwesomeVersionStrategy,
 )
 
+from homeassistant.const import __version__
 from homeassistant.generated.dhcp import DHCP
 from homeassistant.generated.mqtt import MQTT
 from homeassistant.generated.ssdp import SSDP
 from homeassistant.generated.usb import USB
 from homeassistant.generated.zeroconf import HOMEKIT, ZEROCONF
-from homeassistant.util.async_ import gather_with_concurrency
 
 # Typing imports that create a circular dependency
 if TYPE_CHECKING:
@@ -45,6 +46,8 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_IMPORT_TIMES = "import_times"
+DATA_MANIFEST_INDEX = "manifest_index"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -58,6 +61,11 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+MANIFEST_INDEX_STORAGE_KEY = "core.manifest_index"
+MANIFEST_INDEX_STORAGE_VERSION = 1
+# The index is written at shutdown unless new manifests stay unsaved this long
+MANIFEST_INDEX_SAVE_DELAY = 300
+
 
 class Manifest(TypedDict, total=False):
     """
@@ -112,28 +120,20 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
+    index: ManifestIndex | None = hass.data.get(DATA_MANIFEST_INDEX)
+
+    def resolve_custom_components() -> list[Integration | None]:
+        """Resolve the integrations in all custom component directories."""
         return [
-            entry
-            for path in paths
+            Integration.resolve_from_root(hass, custom_components, entry.name, index)
+            for path in custom_components.__path__
             for entry in pathlib.Path(path).iterdir()
             if entry.is_dir()
         ]
 
-    dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
-    )
-
-    integrations = await gather_with_concurrency(
-        MAX_LOAD_CONCURRENTLY,
-        *(
-            hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
-            )
-            for comp in dirs
-        ),
-    )
+    integrations = await hass.async_add_executor_job(resolve_custom_components)
+    if index is not None:
+        index.async_schedule_save()
 
     return {
         integration.domain: integration
@@ -294,21 +294,27 @@ class Integration:
 
     @classmethod
     def resolve_from_root(
-        cls, hass: HomeAssistant, root_module: ModuleType, domain: str
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        index: ManifestIndex | None = None,
     ) -> Integration | None:
-        """Resolve an integration from a root module."""
+        """Resolve an integration from a root module.
+
+        Manifests found in the index are not read again. Manifests that are
+        read are added to it.
+        """
+        built_in = root_module.__name__ == PACKAGE_BUILTIN
         for base in root_module.__path__:  # type: ignore
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
-            try:
-                manifest = json.loads(manifest_path.read_text())
-            except ValueError as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
+            manifest = index.get(manifest_path) if index is not None else _UNDEF
+            if manifest is _UNDEF:
+                manifest = _read_manifest(manifest_path)
+                if index is not None and manifest is not _UNDEF:
+                    index.add(manifest_path, manifest, built_in)
+            if manifest is None or manifest is _UNDEF:
                 continue
 
             integration = cls(
@@ -367,6 +373,8 @@ class Integration:
         self.file_path = file_path
         self.manifest = manifest
         manifest["is_built_in"] = self.is_built_in
+        self._platform_names: set[str] | None = None
+        self._platform_names_listed = False
 
         if self.dependencies:
             self._all_dependencies_resolved: bool | None = None
@@ -521,7 +529,7 @@ class Integration:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
-            cache[self.domain] = importlib.import_module(self.pkg_path)
+            cache[self.domain] = _import_module(self.hass, self.pkg_path)
         return cache[self.domain]  # type: ignore
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -534,13 +542,47 @@ class Integration:
 
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return _import_module(self.hass, f"{self.pkg_path}.{platform_name}")
+
+    async def async_platform_exists(self, platform_name: str) -> bool | None:
+        """Return if the integration has a platform without importing it.
+
+        The files of the integration are listed once in the executor. Returns
+        None when they can not be listed.
+        """
+        if f"{self.domain}.{platform_name}" in self.hass.data.get(DATA_COMPONENTS, {}):
+            return True
+
+        if not self._platform_names_listed:
+            self._platform_names = await self.hass.async_add_executor_job(
+                _list_platform_names, self.file_path
+            )
+            self._platform_names_listed = True
+
+        if self._platform_names is None:
+            return None
+        return platform_name in self._platform_names
 
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
 
 
+def _list_platform_names(file_path: pathlib.Path | None) -> set[str] | None:
+    """Return the names of the modules and packages of an integration."""
+    # Integrations mocked in tests have no files
+    if file_path is None:
+        return None
+    try:
+        return {
+            path.stem
+            for path in file_path.iterdir()
+            if path.suffix == ".py" or (path / "__init__.py").exists()
+        }
+    except OSError:
+        return None
+
+
 async def async_get_integration(hass: HomeAssistant, domain: str) -> Integration:
     """Get an integration."""
     cache = hass.data.get(DATA_INTEGRATIONS)
@@ -587,14 +629,152 @@ async def _async_get_integration(hass: HomeAssistant, domain: str) -> Integratio
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
-    if integration := await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
+    index: ManifestIndex | None = hass.data.get(DATA_MANIFEST_INDEX)
+    # Unchecked manifests of built-in integrations from the index need no
+    # executor job
+    if (
+        index is not None
+        and not index.check_built_in
+        and all(
+            index.get(pathlib.Path(base) / domain / "manifest.json") is not _UNDEF
+            for base in components.__path__  # type: ignore
+        )
     ):
+        integration = Integration.resolve_from_root(hass, components, domain, index)
+    else:
+        integration = await hass.async_add_executor_job(
+            Integration.resolve_from_root, hass, components, domain, index
+        )
+        if index is not None:
+            index.async_schedule_save()
+
+    if integration:
         return integration
 
     raise IntegrationNotFound(domain)
 
 
+def _read_manifest(manifest_path: pathlib.Path) -> Any:
+    """Read a manifest.
+
+    Returns None if it does not exist and _UNDEF if it is invalid.
+    """
+    if not manifest_path.is_file():
+        return None
+
+    try:
+        return json.loads(manifest_path.read_text())
+    except ValueError as err:
+        _LOGGER.error("Error parsing manifest.json file at %s: %s", manifest_path, err)
+        return _UNDEF
+
+
+class ManifestIndex:
+    """Index of the manifests that were read in an earlier run.
+
+    The index is dropped when the version of Home Assistant or the directory
+    of the built-in integrations changed. Manifests of custom integrations
+    are only used while their modification time is unchanged. A missing
+    manifest of a built-in integration is also remembered.
+
+    Built-in manifests can be edited without changing the version in a
+    development checkout, so a development version checks them like the
+    manifests of custom integrations.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, data: dict[str, Any] | None, root_mtime: int | None
+    ) -> None:
+        """Initialize the index."""
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.helpers.storage import Store
+
+        self._store = Store(
+            hass, MANIFEST_INDEX_STORAGE_VERSION, MANIFEST_INDEX_STORAGE_KEY
+        )
+        self._root_mtime = root_mtime
+        self.check_built_in = AwesomeVersion(__version__).dev
+        self._manifests: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        if (
+            data is not None
+            and data["core_version"] == __version__
+            and data["root_mtime"] == self._root_mtime
+        ):
+            self._manifests = data["manifests"]
+
+    def get(self, manifest_path: pathlib.Path) -> Any:
+        """Return a manifest, None if it does not exist or _UNDEF if unknown."""
+        if (entry := self._manifests.get(str(manifest_path))) is None:
+            return _UNDEF
+        if entry["mtime"] is not None:
+            try:
+                if manifest_path.stat().st_mtime_ns != entry["mtime"]:
+                    return _UNDEF
+            except OSError:
+                return _UNDEF
+        return entry["manifest"]
+
+    def add(
+        self, manifest_path: pathlib.Path, manifest: Manifest | None, built_in: bool
+    ) -> None:
+        """Add a manifest that was read."""
+        if manifest is None and (not built_in or self.check_built_in):
+            return
+        mtime = None
+        if not built_in or self.check_built_in:
+            try:
+                mtime = manifest_path.stat().st_mtime_ns
+            except OSError:
+                return
+        self._manifests[str(manifest_path)] = {"mtime": mtime, "manifest": manifest}
+        self._dirty = True
+
+    def async_schedule_save(self) -> None:
+        """Schedule saving the index if manifests were added."""
+        if self._dirty:
+            self._dirty = False
+            self._store.async_delay_save(self._data_to_save, MANIFEST_INDEX_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the index to store."""
+        return {
+            "core_version": __version__,
+            "root_mtime": self._root_mtime,
+            # Manifests may be added while the data is written in the executor
+            "manifests": dict(self._manifests),
+        }
+
+
+def _built_in_root_mtime() -> int | None:
+    """Return the modification time of the built-in integrations directory."""
+    from homeassistant import components  # pylint: disable=import-outside-toplevel
+
+    try:
+        return max(
+            pathlib.Path(path).stat().st_mtime_ns
+            for path in components.__path__  # type: ignore
+        )
+    except (OSError, ValueError):
+        return None
+
+
+async def async_load_manifest_index(hass: HomeAssistant) -> None:
+    """Load the index of the manifests read in an earlier run.
+
+    Without the index every manifest is read from disk.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.storage import Store
+
+    store = Store(hass, MANIFEST_INDEX_STORAGE_VERSION, MANIFEST_INDEX_STORAGE_KEY)
+    data = await store.async_load()
+    root_mtime = await hass.async_add_executor_job(_built_in_root_mtime)
+    hass.data[DATA_MANIFEST_INDEX] = ManifestIndex(
+        hass, data if isinstance(data, dict) else None, root_mtime
+    )
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
@@ -618,6 +798,17 @@ class CircularDependency(LoaderError):
         self.to_domain = to_domain
 
 
+def _import_module(hass: HomeAssistant, name: str) -> ModuleType:
+    """Import a module and record how long the import took."""
+    if name in sys.modules:
+        return importlib.import_module(name)
+
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    hass.data.setdefault(DATA_IMPORT_TIMES, {})[name] = time.perf_counter() - start
+    return module
+
+
 def _load_file(
     hass: HomeAssistant, comp_or_platform: str, base_paths: list[str]
 ) -> ModuleType | None:
@@ -638,7 +829,7 @@ def _load_file(
 
     for path in (f"{base}.{comp_or_platform}" for base in base_paths):
         try:
-            module = importlib.import_module(path)
+            module = _import_module(hass, path)
 
             # In Python 3 you can import files from directories that do not
             # contain the file __init__.py. A directory is a valid module if
@@ -3,11 +3,14 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Iterable
+from dataclasses import dataclass, field
 import os
+import time
 from typing import Any, cast
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.singleton import singleton
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.loader import Integration, IntegrationNotFound, async_get_integration
 import homeassistant.util.package as pkg_util
@@ -16,8 +19,10 @@ import homeassistant.util.package as pkg_util
 
 PIP_TIMEOUT = 60  # The default is too low when the internet connection is satellite or high latency
 DATA_PIP_LOCK = "pip_lock"
+DATA_PIP_INSTALLS = "pip_installs"
 DATA_PKG_CACHE = "pkg_cache"
 DATA_INTEGRATIONS_WITH_REQS = "integrations_with_reqs"
+DATA_REQUIREMENTS_TIMINGS = "requirements_timings"
 CONSTRAINT_FILE = "package_constraints.txt"
 DISCOVERY_INTEGRATIONS: dict[str, Iterable[str]] = {
     "dhcp": ("dhcp",),
@@ -27,6 +32,22 @@ DISCOVERY_INTEGRATIONS: dict[str, Iterable[str]] = {
 }
 
 
+@dataclass
+class RequirementsTimings:
+    """Time spent checking and installing requirements."""
+
+    checked: int = 0
+    check_time: float = 0.0
+    install_times: dict[str, float] = field(default_factory=dict)
+
+
+@callback
+@singleton(DATA_REQUIREMENTS_TIMINGS)
+def async_get_timings(hass: HomeAssistant) -> RequirementsTimings:
+    """Return the time spent checking and installing requirements."""
+    return RequirementsTimings()
+
+
 class RequirementsNotFound(HomeAssistantError):
     """Raised when a component is not found."""
 
@@ -142,26 +163,66 @@ async def async_process_requirements(
 
     This method is a coroutine. It will raise RequirementsNotFound
     if an requirement can't be satisfied.
+
+    Pip runs one install at a time, because concurrent installs into the
+    same environment can conflict. Components waiting for the same
+    requirement share its install.
     """
+    timings = async_get_timings(hass)
+    start = time.monotonic()
+    missing = [req for req in requirements if not pkg_util.is_installed(req)]
+    timings.checked += len(requirements)
+    timings.check_time += time.monotonic() - start
+
+    if not missing:
+        return
+
+    kwargs = pip_kwargs(hass.config.config_dir)
+
+    for req in missing:
+        if not await _async_install_requirement(hass, req, kwargs):
+            raise RequirementsNotFound(name, [req])
+
+
+async def _async_install_requirement(
+    hass: HomeAssistant, req: str, kwargs: dict[str, Any]
+) -> bool:
+    """Install a requirement, sharing the result with concurrent installs of it."""
+    installs: dict[str, asyncio.Future[bool]] = hass.data.setdefault(
+        DATA_PIP_INSTALLS, {}
+    )
+    if (install := installs.get(req)) is not None:
+        return await asyncio.shield(install)
+
     pip_lock = hass.data.get(DATA_PIP_LOCK)
     if pip_lock is None:
         pip_lock = hass.data[DATA_PIP_LOCK] = asyncio.Lock()
 
-    kwargs = pip_kwargs(hass.config.config_dir)
-
-    async with pip_lock:
-        for req in requirements:
-            if pkg_util.is_installed(req):
-                continue
+    install = installs[req] = hass.loop.create_future()
+    try:
+        async with pip_lock:
+            start = time.monotonic()
+            result = await hass.async_add_executor_job(_install, req, kwargs)
+            async_get_timings(hass).install_times[req] = time.monotonic() - start
+    except asyncio.CancelledError:
+        install.cancel()
+        raise
+    except Exception as err:
+        install.set_exception(err)
+        # Mark the exception as retrieved, it is raised to the caller below
+        install.exception()
+        raise
+    else:
+        install.set_result(result)
+    finally:
+        del installs[req]
 
-            def _install(req: str, kwargs: dict[str, Any]) -> bool:
-                """Install requirement."""
-                return pkg_util.install_package(req, **kwargs)
+    return result
 
-            ret = await hass.async_add_executor_job(_install, req, kwargs)
 
-            if not ret:
-                raise RequirementsNotFound(name, [req])
+def _install(req: str, kwargs: dict[str, Any]) -> bool:
+    """Install requirement."""
+    return pkg_util.install_package(req, **kwargs)
 
 
 def pip_kwargs(config_dir: str | None) -> dict[str, Any]:
@@ -10,7 +10,10 @@ from typing import Any
 from homeassistant import bootstrap
 from homeassistant.core import callback
 from homeassistant.helpers.frame import warn_use
-from homeassistant.util.executor import InterruptibleThreadPoolExecutor
+from homeassistant.util.executor import (
+    EXECUTOR_THREAD_NAME_PREFIX,
+    MeteredThreadPoolExecutor,
+)
 from homeassistant.util.thread import deadlock_safe_shutdown
 
 # mypy: disallow-any-generics
@@ -69,8 +72,10 @@ class HassEventLoopPolicy(asyncio.DefaultEventLoopPolicy):  # type: ignore[valid
         if self.debug:
             loop.set_debug(True)
 
-        executor = InterruptibleThreadPoolExecutor(
-            thread_name_prefix="SyncWorker", max_workers=MAX_EXECUTOR_WORKERS
+        executor = MeteredThreadPoolExecutor(
+            "default",
+            max_workers=MAX_EXECUTOR_WORKERS,
+            thread_name_prefix=EXECUTOR_THREAD_NAME_PREFIX,
         )
         loop.set_default_executor(executor)
         loop.set_default_executor = warn_use(  # type: ignore
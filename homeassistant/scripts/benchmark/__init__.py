@@ -5,18 +5,31 @@ import argparse
 import asyncio
 import collections
 from contextlib import suppress
-from datetime import datetime
+from datetime import datetime, timedelta
+import itertools
 import json
 import logging
+import platform
+from statistics import median
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
-from typing import Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, TypeVar, cast
 
 from homeassistant import core
 from homeassistant.components.websocket_api.const import JSON_DUMP
-from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.const import (
+    ATTR_NOW,
+    EVENT_STATE_CHANGED,
+    EVENT_TIME_CHANGED,
+    __version__,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import load_json, save_json
+
+if TYPE_CHECKING:
+    from homeassistant.runner import HassEventLoopPolicy
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -25,32 +38,194 @@ CALLABLE_T = TypeVar("CALLABLE_T", bound=Callable)  # pylint: disable=invalid-na
 
 BENCHMARKS: dict[str, Callable] = {}
 
+_LOGGER = logging.getLogger(__name__)
+
+# A relative increase of the median runtime above this is a regression
+REGRESSION_THRESHOLD = 0.1
+
+# The synthetic house the benchmarks of the suite run against. Every ten
+# entities share a device and every room is an area.
+HOUSE_ENTITY_COUNT = 10 ** 4
+HOUSE_DOMAINS = (
+    "binary_sensor",
+    "climate",
+    "cover",
+    "light",
+    "light",
+    "media_player",
+    "sensor",
+    "sensor",
+    "sensor",
+    "switch",
+)
+HOUSE_ROOMS = (
+    "kitchen",
+    "living_room",
+    "dining_room",
+    "bedroom",
+    "guest_room",
+    "kids_room",
+    "bathroom",
+    "hallway",
+    "office",
+    "garage",
+    "attic",
+    "basement",
+    "laundry",
+    "porch",
+    "garden",
+    "shed",
+    "pantry",
+    "study",
+    "gym",
+    "workshop",
+)
+HOUSE_ENTITIES_PER_DEVICE = 10
+
 
 def run(args):
     """Handle benchmark commandline script."""
     # Disable logging
     logging.getLogger("homeassistant.core").setLevel(logging.CRITICAL)
+    # Setting up the house registers thousands of entities
+    logging.getLogger("homeassistant.helpers").setLevel(logging.WARNING)
 
     parser = argparse.ArgumentParser(description=("Run a Home Assistant benchmark."))
-    parser.add_argument("name", choices=BENCHMARKS)
-    parser.add_argument("--script", choices=["benchmark"])
+    parser.add_argument("name", nargs="?", choices=[*BENCHMARKS, "all"])
+    parser.add_argument(
+        "--runs",
+        type=int,
+        help="Number of runs of each benchmark, runs a single benchmark until "
+        "interrupted and all benchmarks once by default",
+    )
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BASELINE", "RESULTS"),
+        help="Compare the results of two runs written with --output",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=REGRESSION_THRESHOLD,
+        help="Relative slowdown of a benchmark reported as a regression",
+    )
+
+    args = parser.parse_args(args)
+
+    if args.compare:
+        return compare_results(*args.compare, args.threshold)
+
+    if args.name is None:
+        parser.error("the name of a benchmark or all is required")
 
-    args = parser.parse_args()
+    names = list(BENCHMARKS) if args.name == "all" else [args.name]
+    runs = args.runs
+    if runs is None:
+        runs = 1 if args.name == "all" else 0
 
-    bench = BENCHMARKS[args.name]
-    print("Using event loop:", asyncio.get_event_loop_policy().loop_name)
+    print("Using event loop:", _loop_name())
+
+    results: dict[str, list[float]] = {}
+    failed = []
 
     with suppress(KeyboardInterrupt):
-        while True:
-            asyncio.run(run_benchmark(bench))
+        for name in names:
+            runtimes = results[name] = []
+            try:
+                for _ in range(runs) if runs else itertools.count():
+                    runtimes.append(asyncio.run(run_benchmark(BENCHMARKS[name])))
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Benchmark %s failed", name)
+                failed.append(name)
+
+    if args.output:
+        save_json(args.output, results_as_dict(results))
+
+    if failed:
+        print(f"{len(failed)} benchmarks failed: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+def _loop_name() -> str:
+    """Return the name of the event loop the benchmarks run in."""
+    return cast("HassEventLoopPolicy", asyncio.get_event_loop_policy()).loop_name
 
 
 async def run_benchmark(bench):
     """Run a benchmark."""
     hass = core.HomeAssistant()
-    runtime = await bench(hass)
-    print(f"Benchmark {bench.__name__} done in {runtime}s")
-    await hass.async_stop()
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        hass.config.skip_pip = True
+        runtime = await bench(hass)
+        print(f"Benchmark {bench.__name__} done in {runtime}s")
+        await hass.async_stop()
+    return runtime
+
+
+def results_as_dict(results: dict[str, list[float]]) -> dict[str, Any]:
+    """Return the runtimes of the benchmarks as a JSON serializable dict."""
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "event_loop": _loop_name(),
+        "created": dt_util.utcnow().isoformat(),
+        "benchmarks": {
+            name: {
+                "runs": runtimes,
+                "min": min(runtimes),
+                "median": median(runtimes),
+            }
+            for name, runtimes in results.items()
+            if runtimes
+        },
+    }
+
+
+def compare_results(baseline_path: str, results_path: str, threshold: float) -> int:
+    """Print the change of the median runtimes between two result files.
+
+    Returns 1 if any benchmark regressed by more than the threshold.
+    """
+    baseline = _load_benchmarks(baseline_path)
+    results = _load_benchmarks(results_path)
+    if baseline is None or results is None:
+        return 1
+    regressions = []
+
+    for name in sorted(baseline.keys() & results.keys()):
+        old = baseline[name]["median"]
+        new = results[name]["median"]
+        change = (new - old) / old if old else 0.0
+        marker = ""
+        if change > threshold:
+            regressions.append(name)
+            marker = "  REGRESSION"
+        print(f"{name}: {old:.4f}s -> {new:.4f}s ({change:+.1%}){marker}")
+
+    for name in sorted(results.keys() - baseline.keys()):
+        print(f"{name}: {results[name]['median']:.4f}s (new)")
+    for name in sorted(baseline.keys() - results.keys()):
+        print(f"{name}: missing from {results_path}")
+
+    if regressions:
+        print(f"{len(regressions)} benchmarks regressed more than {threshold:.0%}")
+        return 1
+    return 0
+
+
+def _load_benchmarks(path: str) -> dict[str, Any] | None:
+    """Load the benchmarks of a result file written with --output."""
+    data = load_json(path)
+    if not isinstance(data, dict) or not isinstance(
+        benchmarks := data.get("benchmarks"), dict
+    ):
+        print(f"{path} does not contain benchmark results")
+        return None
+    return benchmarks
 
 
 def benchmark(func: CALLABLE_T) -> CALLABLE_T:
@@ -133,7 +308,8 @@ async def time_changed_helper(hass):
         if count == 10 ** 6:
             event.set()
 
-    hass.helpers.event.async_track_time_change(listener, minute=0, second=0)
+    # Only trackers without a time pattern listen to the time changed events
+    hass.helpers.event.async_track_time_change(listener)
     event_data = {ATTR_NOW: datetime(2017, 10, 10, 15, 0, 0, tzinfo=dt_util.UTC)}
 
     for _ in range(10 ** 6):
@@ -252,6 +428,39 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def group_state_updates(hass):
+    """Run 100k member state changes through nested 1000 member groups."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components import group
+
+    hass.state = core.CoreState.running
+    entity_ids = [f"light.light_{idx}" for idx in range(1000)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "off")
+
+    hass.data[group.REG_KEY] = group.GroupIntegrationRegistry()
+    lights = group.Group(hass, "lights", entity_ids=entity_ids)
+    lights.entity_id = "group.lights"
+    house = group.Group(hass, "house", entity_ids=[lights.entity_id])
+    house.entity_id = "group.house"
+    # pylint: disable=protected-access
+    lights._async_start()
+    house._async_start()
+    await hass.async_block_till_done()
+
+    states = ("on", "off")
+    size = len(entity_ids)
+
+    start = timer()
+
+    for idx in range(10 ** 5):
+        hass.states.async_set(entity_ids[idx % size], states[idx // size % 2])
+        await hass.async_block_till_done()
+
+    return timer() - start
+
+
 @benchmark
 async def logbook_filtering_state(hass):
     """Filter state changes."""
@@ -264,7 +473,6 @@ async def logbook_filtering_attributes(hass):
     return await _logbook_filtering(hass, 1, 2)
 
 
-@benchmark
 async def _logbook_filtering(hass, last_changed, last_updated):
     # pylint: disable=import-outside-toplevel
     from homeassistant.components import logbook
@@ -284,6 +492,8 @@ async def _logbook_filtering(hass, last_changed, last_updated):
         entity_id, dt_util.utcnow(), old_state, new_state
     )
 
+    # No integrations describe their logbook events
+    hass.data[logbook.DOMAIN] = {}
     entity_attr_cache = logbook.EntityAttributeCache(hass)
 
     entities_filter = convert_include_exclude_filter(
@@ -305,35 +515,31 @@ async def _logbook_filtering(hass, last_changed, last_updated):
 
 @benchmark
 async def filtering_entity_id(hass):
-    """Run a 100k state changes through entity filter."""
+    """Run a 100k state changes of 10k entities through entity filter."""
+    domains = [
+        "automation",
+        "binary_sensor",
+        "device_tracker",
+        "input_boolean",
+        "input_number",
+        "light",
+        "media_player",
+        "sensor",
+        "switch",
+        "group",
+    ]
+    rooms = ["kitchen", "living_room", "bedroom", "garage", "office"]
     config = {
         "include": {
-            "domains": [
-                "automation",
-                "script",
-                "group",
-                "media_player",
-                "custom_component",
-            ],
+            "domains": ["automation", "script", "group", "media_player"],
+            # 200 globs
             "entity_globs": [
-                "binary_sensor.*_contact",
-                "binary_sensor.*_occupancy",
-                "binary_sensor.*_detected",
-                "binary_sensor.*_active",
-                "input_*",
-                "device_tracker.*_phone",
-                "switch.*_light",
-                "binary_sensor.*_charging",
-                "binary_sensor.*_lock",
-                "binary_sensor.*_connected",
-            ],
-            "entities": [
-                "test.entity_1",
-                "test.entity_2",
-                "binary_sensor.garage_door_open",
-                "test.entity_3",
-                "test.entity_4",
-            ],
+                f"{domain}.{room}_*_{idx}"
+                for idx in range(20)
+                for domain, room in zip(domains[1::2], rooms)
+            ]
+            + [f"binary_sensor.*_{idx}_contact" for idx in range(100)],
+            "entities": [f"light.{room}_{idx}" for idx in range(50) for room in rooms],
         },
         "exclude": {
             "domains": ["input_number"],
@@ -343,18 +549,8 @@ async def filtering_entity_id(hass):
     }
 
     entity_ids = [
-        "automation.home_arrival",
-        "script.shut_off_house",
-        "binary_sensor.garage_door_open",
-        "binary_sensor.front_door_lock",
-        "binary_sensor.kitchen_motion_sensor_occupancy",
-        "switch.desk_lamp",
-        "light.dining_room",
-        "input_boolean.guest_staying_over",
-        "person.eleanor_fant",
-        "alert.issue_at_home",
-        "calendar.eleanor_fant_s_calendar",
-        "sun.sun",
+        f"{domains[idx % len(domains)]}.{rooms[idx % len(rooms)]}_{idx}_contact"
+        for idx in range(10 ** 4)
     ]
 
     entities_filter = convert_include_exclude_filter(config)
@@ -368,6 +564,54 @@ async def filtering_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def discovery_matchers(hass):
+    """Replay 100k discovery packets of 500 devices through the matchers."""
+    # pylint: disable=import-outside-toplevel
+    from async_upnp_client.utils import CaseInsensitiveDict
+
+    from homeassistant.components import dhcp, ssdp, zeroconf
+    from homeassistant.generated.dhcp import DHCP
+    from homeassistant.generated.ssdp import SSDP
+    from homeassistant.generated.zeroconf import HOMEKIT, ZEROCONF
+
+    dhcp_matchers = dhcp.IntegrationMatchers(DHCP)
+    ssdp_matchers = ssdp.IntegrationMatchers(SSDP)
+    zeroconf_matchers = zeroconf.IntegrationMatchers(ZEROCONF)
+    homekit_models = zeroconf.HomeKitModels(HOMEKIT)
+    service_types = list(ZEROCONF)
+
+    devices = [
+        (
+            f"{idx * 7919:012X}",
+            f"device-{idx}",
+            CaseInsensitiveDict(
+                st=f"urn:schemas-upnp-org:device:Basic:{idx % 3}",
+                deviceType="urn:schemas-upnp-org:device:Basic:1",
+                manufacturer=f"Vendor {idx % 50}",
+                modelName=f"Model {idx}",
+            ),
+            service_types[idx % len(service_types)],
+            f"Accessory {idx % 20}",
+        )
+        for idx in range(500)
+    ]
+    size = len(devices)
+
+    start = timer()
+
+    for i in range(10 ** 5):
+        mac, hostname, ssdp_info, service_type, model = devices[i % size]
+        dhcp_matchers.match(mac, hostname)
+        ssdp_matchers.async_matching_domains(ssdp_info)
+        zeroconf_matchers.async_matching_domains(
+            service_type, mac, hostname, ssdp_info["manufacturer"].lower()
+        )
+        homekit_models.async_get_domain(model)
+
+    return timer() - start
+
+
 @benchmark
 async def valid_entity_id(hass):
     """Run valid entity ID a million times."""
@@ -390,6 +634,670 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+async def _async_setup_house(hass, entity_count=HOUSE_ENTITY_COUNT):
+    """Set up the registries and states of the synthetic house.
+
+    Returns the entity ids of the house.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import area_registry, device_registry, entity_registry
+
+    await asyncio.gather(
+        area_registry.async_load(hass),
+        device_registry.async_load(hass),
+        entity_registry.async_load(hass),
+    )
+    areas = area_registry.async_get(hass)
+    devices = device_registry.async_get(hass)
+    entities = entity_registry.async_get(hass)
+
+    area_ids = [areas.async_create(room).id for room in HOUSE_ROOMS]
+    entity_ids = []
+    device = None
+
+    for idx in range(entity_count):
+        device_idx, device_entity_idx = divmod(idx, HOUSE_ENTITIES_PER_DEVICE)
+        room = device_idx % len(HOUSE_ROOMS)
+        domain = HOUSE_DOMAINS[idx % len(HOUSE_DOMAINS)]
+
+        if not device_entity_idx:
+            device = devices.async_get_or_create(
+                config_entry_id="benchmark",
+                identifiers={("benchmark", str(device_idx))},
+                name=f"Device {device_idx}",
+            )
+            devices.async_update_device(device.id, area_id=area_ids[room])
+
+        entry = entities.async_get_or_create(
+            domain,
+            "benchmark",
+            str(idx),
+            suggested_object_id=f"{HOUSE_ROOMS[room]}_{idx}",
+            device_id=device.id,
+        )
+        entity_ids.append(entry.entity_id)
+
+        if domain == "sensor":
+            hass.states.async_set(
+                entry.entity_id,
+                str(idx % 40),
+                {
+                    "device_class": "temperature",
+                    "state_class": "measurement",
+                    "unit_of_measurement": "°C",
+                    "friendly_name": f"Sensor {idx}",
+                },
+            )
+        else:
+            hass.states.async_set(
+                entry.entity_id,
+                "on" if idx % 3 else "off",
+                {"friendly_name": f"{domain.title()} {idx}"},
+            )
+
+    await hass.async_block_till_done()
+    return entity_ids
+
+
+async def _async_setup_recorder(hass):
+    """Set up the recorder with an in-memory SQLite database."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import config_entries
+    from homeassistant.components import recorder
+    from homeassistant.setup import async_setup_component
+
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    await async_setup_component(
+        hass, recorder.DOMAIN, {recorder.DOMAIN: {recorder.CONF_DB_URL: "sqlite://"}}
+    )
+    await hass.async_start()
+    instance = hass.data[recorder.DATA_INSTANCE]
+    await instance.async_recorder_ready.wait()
+    return instance
+
+
+async def _async_wait_recording_done(hass, instance):
+    """Wait until the recorder committed all queued events."""
+    await hass.async_block_till_done()
+    # The recorder commits after seeing the time change commit_interval times
+    for _ in range(instance.commit_interval):
+        hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: dt_util.utcnow()})
+    await hass.async_add_executor_job(instance.block_till_done)
+
+
+@benchmark
+async def recorder_write_throughput(hass):
+    """Record a state change of each of the 10k entities of the house."""
+    entity_ids = await _async_setup_house(hass)
+    instance = await _async_setup_recorder(hass)
+
+    start = timer()
+
+    for idx, entity_id in enumerate(entity_ids):
+        hass.states.async_set(entity_id, str(idx))
+
+    await _async_wait_recording_done(hass, instance)
+
+    return timer() - start
+
+
+@benchmark
+async def history_significant_states(hass):
+    """Query the history of the 10k entities of the house with 3 changes each."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.recorder import history
+
+    entity_ids = await _async_setup_house(hass)
+    instance = await _async_setup_recorder(hass)
+    history_start = dt_util.utcnow()
+
+    for change in range(3):
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, str(change))
+        await _async_wait_recording_done(hass, instance)
+
+    start = timer()
+
+    await hass.async_add_executor_job(
+        history.get_significant_states, hass, history_start
+    )
+    for entity_id in entity_ids[:100]:
+        await hass.async_add_executor_job(
+            history.state_changes_during_period, hass, history_start, None, entity_id
+        )
+
+    return timer() - start
+
+
+@benchmark
+async def statistics_during_period(hass):
+    """Query a month of hourly statistics of 100 sensors."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.recorder import statistics
+    from homeassistant.components.recorder.models import Statistics, StatisticsMeta
+    from homeassistant.components.recorder.util import session_scope
+
+    instance = await _async_setup_recorder(hass)
+    statistics_start = dt_util.utcnow().replace(
+        minute=0, second=0, microsecond=0
+    ) - timedelta(days=30)
+
+    def _insert_statistics():
+        with session_scope(session=instance.get_session()) as session:
+            for idx in range(100):
+                metadata = StatisticsMeta.from_meta(
+                    "recorder", f"sensor.temperature_{idx}", "°C", True, False
+                )
+                session.add(metadata)
+                session.flush()
+                for hour in range(30 * 24):
+                    session.add(
+                        Statistics.from_stats(
+                            metadata.id,
+                            {
+                                "start": statistics_start + timedelta(hours=hour),
+                                "mean": 20.0 + hour % 5,
+                                "min": 18.0,
+                                "max": 25.0,
+                            },
+                        )
+                    )
+
+    await hass.async_add_executor_job(_insert_statistics)
+
+    start = timer()
+
+    await hass.async_add_executor_job(
+        statistics.statistics_during_period, hass, statistics_start
+    )
+    for idx in range(100):
+        await hass.async_add_executor_job(
+            statistics.statistics_during_period,
+            hass,
+            statistics_start,
+            None,
+            [f"sensor.temperature_{idx}"],
+        )
+
+    return timer() - start
+
+
+def _statistics_sensor_values(count):
+    """Return the values of a noisy sensor for the statistics benchmarks."""
+    return [20.0 + (idx * 7919 % 1000) / 100 for idx in range(count)]
+
+
+@benchmark
+async def statistics_sensor_window(hass):
+    """Update the statistics of a full window of 10000 values 100 times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.statistics.rolling import RollingStatistics
+
+    values = _statistics_sensor_values(10100)
+    window = RollingStatistics(10000)
+    for value in values[:10000]:
+        window.append(value)
+    results = []
+
+    start = timer()
+
+    for value in values[10000:]:
+        window.append(value)
+        results.append(
+            (
+                window.mean,
+                window.median,
+                window.stdev,
+                window.variance,
+                window.quantiles(4, "exclusive"),
+                window.total,
+                window.min,
+                window.max,
+            )
+        )
+
+    return timer() - start
+
+
+@benchmark
+async def statistics_sensor_window_stdlib(hass):
+    """Compute the statistics of a full window of 10000 values 100 times.
+
+    This is the baseline of statistics_sensor_window, it computes the statistics
+    from the whole window with the statistics module.
+    """
+    # pylint: disable=import-outside-toplevel
+    from collections import deque
+    import statistics
+
+    values = _statistics_sensor_values(10100)
+    window = deque(values[:10000], maxlen=10000)
+    results = []
+
+    start = timer()
+
+    for value in values[10000:]:
+        window.append(value)
+        results.append(
+            (
+                statistics.mean(window),
+                statistics.median(window),
+                statistics.stdev(window),
+                statistics.variance(window),
+                statistics.quantiles(window, n=4, method="exclusive"),
+                sum(window),
+                min(window),
+                max(window),
+            )
+        )
+
+    return timer() - start
+
+
+@benchmark
+async def template_rendering(hass):
+    """Render templates over the states of the house 100 times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.template import Template
+
+    entity_ids = await _async_setup_house(hass)
+    templates = [
+        Template(template, hass)
+        for template in (
+            f"{{{{ states('{entity_ids[0]}') }}}}",
+            f"{{{{ state_attr('{entity_ids[6]}', 'unit_of_measurement') }}}}",
+            f"{{{{ is_state('{entity_ids[3]}', 'on') and "
+            f"states('{entity_ids[6]}') | float > 20 }}}}",
+            "{{ states.light | selectattr('state', 'eq', 'on') | list | count }}",
+            "{{ states.sensor | map(attribute='state') | map('float') | max }}",
+        )
+    ]
+    for template in templates:
+        template.ensure_valid()
+
+    start = timer()
+
+    for _ in range(100):
+        for template in templates:
+            template.async_render()
+
+    return timer() - start
+
+
+@benchmark
+async def websocket_fanout(hass):
+    """Send a state change of each entity of the house to 50 websocket clients."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.auth.models import RefreshToken, User
+    from homeassistant.components.websocket_api import commands
+    from homeassistant.components.websocket_api.connection import ActiveConnection
+
+    entity_ids = await _async_setup_house(hass)
+    user = User(
+        name="Benchmark",
+        perm_lookup=None,
+        is_owner=True,
+        is_active=True,
+        system_generated=False,
+    )
+    refresh_token = RefreshToken(
+        user=user, client_id=None, access_token_expiration=timedelta(minutes=30)
+    )
+    sent = collections.deque()
+
+    for _ in range(50):
+        connection = ActiveConnection(
+            logging.getLogger(__name__), hass, sent.append, user, refresh_token
+        )
+        commands.handle_subscribe_events(
+            hass,
+            connection,
+            {"id": 1, "type": "subscribe_events", "event_type": EVENT_STATE_CHANGED},
+        )
+
+    start = timer()
+
+    for idx, entity_id in enumerate(entity_ids):
+        hass.states.async_set(entity_id, str(idx))
+
+    await hass.async_block_till_done()
+
+    return timer() - start
+
+
+@benchmark
+async def mqtt_dispatch(hass):
+    """Dispatch 100k MQTT messages to 1000 devices of the house."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import config_entries
+    from homeassistant.components import mqtt
+
+    conf = mqtt.CONFIG_SCHEMA({mqtt.DOMAIN: {mqtt.CONF_BROKER: "localhost"}})
+    entry = config_entries.ConfigEntry(
+        1, mqtt.DOMAIN, "Benchmark", {}, config_entries.SOURCE_USER
+    )
+    client = mqtt.MQTT(hass, entry, conf[mqtt.DOMAIN])
+    count = 0
+
+    @core.callback
+    def message_received(msg):
+        """Handle a message."""
+        nonlocal count
+        count += 1
+
+    device_count = HOUSE_ENTITY_COUNT // HOUSE_ENTITIES_PER_DEVICE
+    for idx in range(device_count):
+        await client.async_subscribe(f"house/{idx}/state", message_received, 0)
+    await client.async_subscribe("house/+/availability", message_received, 0)
+    await client.async_subscribe("house/#", message_received, 0)
+
+    messages = [
+        mqtt.models.ReceiveMessage(f"house/{idx}/state", b"on", 0, False)
+        for idx in range(device_count)
+    ]
+
+    start = timer()
+
+    for idx in range(10 ** 5):
+        # pylint: disable=protected-access
+        client._mqtt_handle_message(messages[idx % device_count])
+
+    await hass.async_block_till_done()
+
+    return timer() - start
+
+
+@benchmark
+async def service_target_resolution(hass):
+    """Resolve service call targets of areas and devices of the house 1000 times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import area_registry, device_registry
+    from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+    await _async_setup_house(hass)
+    area_ids = [area.id for area in area_registry.async_get(hass).async_list_areas()]
+    device_ids = list(device_registry.async_get(hass).devices)
+    service_calls = [
+        core.ServiceCall(
+            "light",
+            "turn_on",
+            {
+                "area_id": area_ids[idx % len(area_ids)],
+                "device_id": device_ids[idx % len(device_ids)],
+            },
+        )
+        for idx in range(1000)
+    ]
+
+    start = timer()
+
+    for service_call in service_calls:
+        await async_extract_referenced_entity_ids(hass, service_call)
+
+    return timer() - start
+
+
+def _automation_conditions(entity_ids, count):
+    """Return the conditions of count automations over the house.
+
+    The automations mix the conditions of motion lights and climate control:
+    state and numeric state conditions, templates and nested and/or/not.
+    """
+    conditions = []
+    for idx in range(count):
+        base = (idx * 10) % len(entity_ids)
+        motion = entity_ids[base]
+        light = entity_ids[base + 3]
+        sensor = entity_ids[base + 6]
+        kind = idx % 4
+        if kind == 0:
+            conditions.append(
+                [
+                    {"condition": "state", "entity_id": motion, "state": "on"},
+                    {"condition": "state", "entity_id": light, "state": "off"},
+                ]
+            )
+        elif kind == 1:
+            conditions.append(
+                [
+                    {
+                        "condition": "numeric_state",
+                        "entity_id": sensor,
+                        "above": 5,
+                        "below": 30,
+                    },
+                    {
+                        "condition": "template",
+                        "value_template": f"{{{{ is_state('{light}', 'on') }}}}",
+                    },
+                ]
+            )
+        elif kind == 2:
+            conditions.append(
+                [
+                    {
+                        "condition": "or",
+                        "conditions": [
+                            {
+                                "condition": "and",
+                                "conditions": [
+                                    {
+                                        "condition": "state",
+                                        "entity_id": motion,
+                                        "state": "off",
+                                    },
+                                    {
+                                        "condition": "numeric_state",
+                                        "entity_id": sensor,
+                                        "below": 20,
+                                    },
+                                ],
+                            },
+                            {
+                                "condition": "template",
+                                "value_template": f"{{{{ states('{sensor}') "
+                                "| float > 35 }}",
+                            },
+                        ],
+                    }
+                ]
+            )
+        else:
+            conditions.append(
+                [
+                    {
+                        "condition": "not",
+                        "conditions": [
+                            {
+                                "condition": "state",
+                                "entity_id": [motion, light],
+                                "state": "unavailable",
+                            },
+                        ],
+                    },
+                    {
+                        "condition": "trigger",
+                        "id": ["motion", "timer"],
+                    },
+                ]
+            )
+    return conditions
+
+
+async def _automation_conditions_benchmark(hass, capture):
+    """Evaluate the conditions of 500 automations 20 times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import condition, trace
+    import homeassistant.helpers.config_validation as cv
+
+    entity_ids = await _async_setup_house(hass)
+    checks = []
+    for if_configs in _automation_conditions(entity_ids, 500):
+        checks.append(
+            [
+                await condition.async_from_config(
+                    hass, cv.CONDITION_SCHEMA(if_config), False
+                )
+                for if_config in if_configs
+            ]
+        )
+    variables = {"trigger": {"id": "motion"}}
+    token = trace.trace_capture_cv.set(capture)
+
+    def evaluate():
+        """Evaluate the conditions of all automations once."""
+        for if_checks in checks:
+            trace.trace_clear()
+            for check in if_checks:
+                if not check(hass, variables):
+                    break
+
+    # The first untraced evaluation compiles the conditions in the background
+    evaluate()
+    await hass.async_block_till_done()
+
+    start = timer()
+
+    for _ in range(20):
+        evaluate()
+
+    elapsed = timer() - start
+    trace.trace_capture_cv.reset(token)
+    return elapsed
+
+
+@benchmark
+async def automation_conditions(hass):
+    """Evaluate the conditions of 500 automations 20 times without tracing.
+
+    The conditions are evaluated by the compiled checkers.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.trace import TRACE_CAPTURE_OFF
+
+    return await _automation_conditions_benchmark(hass, TRACE_CAPTURE_OFF)
+
+
+@benchmark
+async def automation_conditions_traced(hass):
+    """Evaluate the conditions of 500 automations 20 times with full traces."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.trace import TRACE_CAPTURE_FULL
+
+    return await _automation_conditions_benchmark(hass, TRACE_CAPTURE_FULL)
+
+
+@benchmark
+async def state_triggers(hass):
+    """Fire 10000 state changes watched by 20 state triggers per entity.
+
+    The triggers with the same configuration share their listener.
+    """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.homeassistant.triggers import state
+
+    entity_ids = [f"binary_sensor.motion_{idx}" for idx in range(50)]
+    count = 0
+
+    @core.callback
+    def action(run_variables, context=None):
+        """Count the trigger."""
+        nonlocal count
+        count += 1
+
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, "off")
+        for idx in range(20):
+            config = state.TRIGGER_SCHEMA(
+                {
+                    "platform": "state",
+                    "entity_id": entity_id,
+                    "to": "on",
+                    "for": {"minutes": 5 + idx % 2},
+                }
+            )
+            await state.async_attach_trigger(
+                hass,
+                config,
+                action,
+                {"trigger_data": {"id": str(idx)}, "variables": None, "name": "b"},
+            )
+
+    start = timer()
+
+    for idx in range(10000):
+        hass.states.async_set(entity_ids[idx % 50], "on" if idx // 50 % 2 else "off")
+
+    await hass.async_block_till_done()
+
+    return timer() - start
+
+
+@benchmark
+async def script_runs(hass):
+    """Run a script of two static service calls and an event 10000 times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import config_validation as cv, script
+
+    @core.callback
+    def handle(call):
+        """Handle the service call."""
+
+    hass.services.async_register("test", "service", handle)
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"service": "test.service", "target": {"entity_id": "light.kitchen"}},
+            {"service": "test.service", "data": {"brightness": 100}},
+            {"event": "script_done"},
+        ]
+    )
+    script_obj = script.Script(
+        hass, sequence, "benchmark", "script", script_mode="parallel", max_runs=100
+    )
+    context = core.Context()
+
+    start = timer()
+
+    for _ in range(10000):
+        await script_obj.async_run(context=context)
+
+    return timer() - start
+
+
+@benchmark
+async def startup_time(hass):
+    """Set up the core integrations with 1000 input booleans and 200 automations."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import bootstrap
+
+    config = {
+        "homeassistant": {},
+        "input_boolean": {f"boolean_{idx}": {} for idx in range(1000)},
+        "automation": [
+            {
+                "id": str(idx),
+                "trigger": {
+                    "platform": "state",
+                    "entity_id": f"input_boolean.boolean_{idx}",
+                },
+                "action": {
+                    "service": "input_boolean.toggle",
+                    "target": {"entity_id": f"input_boolean.boolean_{idx + 1}"},
+                },
+            }
+            for idx in range(200)
+        ],
+    }
+
+    start = timer()
+
+    await bootstrap.async_from_config_dict(config, hass)
+    await hass.async_block_till_done()
+
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -426,6 +1334,7 @@ def _create_state_changed_event_from_old_new(
     row.domain = entity_id and core.split_entity_id(entity_id)[0]
     row.context_id = None
     row.context_user_id = None
+    row.context_parent_id = None
     row.old_state_id = old_state and 1
     row.state_id = new_state and 1
 
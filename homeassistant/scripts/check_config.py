@@ -161,10 +161,10 @@ def check(config_dir, secrets=False):
     }
 
     # pylint: disable=possibly-unused-variable
-    def mock_load(filename, secrets=None):
+    def mock_load(filename, secrets=None, parsed_cache=None):
         """Mock hass.util.load_yaml to save config file names."""
         res["yaml_files"][filename] = True
-        return MOCKS["load"][1](filename, secrets)
+        return MOCKS["load"][1](filename, secrets, parsed_cache)
 
     # pylint: disable=possibly-unused-variable
     def mock_secrets(ldr, node):
@@ -191,7 +191,7 @@ def check(config_dir, secrets=False):
 
     if secrets:
         # Ensure !secrets point to the patched function
-        yaml_loader.SafeLineLoader.add_constructor("!secret", yaml_loader.secret_yaml)
+        yaml_loader.add_constructor("!secret", yaml_loader.secret_yaml)
 
     def secrets_proxy(*args):
         secrets = Secrets(*args)
@@ -219,9 +219,7 @@ def check(config_dir, secrets=False):
             pat.stop()
         if secrets:
             # Ensure !secrets point to the original function
-            yaml_loader.SafeLineLoader.add_constructor(
-                "!secret", yaml_loader.secret_yaml
-            )
+            yaml_loader.add_constructor("!secret", yaml_loader.secret_yaml)
 
     return res
 
@@ -1,14 +1,19 @@
 """Executor util helpers."""
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 import contextlib
+from dataclasses import dataclass
+import functools
 import logging
 import queue
 import sys
-from threading import Thread
+from threading import Lock, Thread
 import time
 import traceback
+from types import FrameType
+from typing import Any, TypeVar
 
 from homeassistant.util.thread import async_raise
 
@@ -20,6 +25,13 @@ _JOIN_ATTEMPTS = 10
 
 EXECUTOR_SHUTDOWN_TIMEOUT = 10
 
+EXECUTOR_THREAD_NAME_PREFIX = "SyncWorker"
+
+# Module of the job helpers that submit jobs on behalf of their caller
+_JOB_HELPERS_MODULE = "homeassistant.core"
+
+_T = TypeVar("_T")
+
 
 def _log_thread_running_at_shutdown(name: str, ident: int) -> None:
     """Log the stack of a thread that was still running at shutdown."""
@@ -111,3 +123,198 @@ class InterruptibleThreadPoolExecutor(ThreadPoolExecutor):
             )
             if timeout_remaining <= 0:
                 return
+
+
+@dataclass
+class ExecutorStatistics:
+    """Statistics of the jobs of an executor."""
+
+    submitted: int = 0
+    completed: int = 0
+    max_queue_depth: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+    run_time_total: float = 0.0
+    run_time_max: float = 0.0
+
+
+class MeteredThreadPoolExecutor(InterruptibleThreadPoolExecutor):
+    """An InterruptibleThreadPoolExecutor that measures its jobs.
+
+    Every job records how long it waited in the queue for a worker and how
+    long it ran once it got one.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        thread_name_prefix: str | None = None,
+    ) -> None:
+        """Initialize the executor."""
+        super().__init__(
+            max_workers=max_workers,
+            thread_name_prefix=thread_name_prefix
+            or f"{EXECUTOR_THREAD_NAME_PREFIX}_{name}",
+        )
+        self.name = name
+        self.max_workers = max_workers
+        self.statistics = ExecutorStatistics()
+        self._statistics_lock = Lock()
+
+    def submit(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> Future[_T]:
+        """Submit a job that records its wait and run time."""
+        future: Future[_T] = super().submit(
+            self._run_job, fn, time.monotonic(), args, kwargs
+        )
+        queue_depth = self._work_queue.qsize()
+        with self._statistics_lock:
+            self.statistics.submitted += 1
+            if queue_depth > self.statistics.max_queue_depth:
+                self.statistics.max_queue_depth = queue_depth
+        return future
+
+    def _run_job(
+        self,
+        fn: Callable[..., Any],
+        queued: float,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Run a job and record its wait and run time."""
+        started = time.monotonic()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            finished = time.monotonic()
+            wait_time = started - queued
+            run_time = finished - started
+            with self._statistics_lock:
+                statistics = self.statistics
+                statistics.completed += 1
+                statistics.wait_time_total += wait_time
+                statistics.run_time_total += run_time
+                if wait_time > statistics.wait_time_max:
+                    statistics.wait_time_max = wait_time
+                if run_time > statistics.run_time_max:
+                    statistics.run_time_max = run_time
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Return the statistics of the executor as a dictionary."""
+        with self._statistics_lock:
+            statistics = self.statistics
+            completed = statistics.completed
+            queue_depth = self._work_queue.qsize()
+            return {
+                "name": self.name,
+                "max_workers": self.max_workers,
+                "queue_depth": queue_depth,
+                "max_queue_depth": statistics.max_queue_depth,
+                "active": statistics.submitted - completed - queue_depth,
+                "submitted": statistics.submitted,
+                "completed": completed,
+                "wait_time_avg": statistics.wait_time_total / completed
+                if completed
+                else None,
+                "wait_time_max": statistics.wait_time_max,
+                "run_time_avg": statistics.run_time_total / completed
+                if completed
+                else None,
+                "run_time_max": statistics.run_time_max,
+            }
+
+
+def integration_of_module(module: str) -> str | None:
+    """Return the domain of the integration a module belongs to."""
+    parts = module.split(".", 3)
+    if parts[0] == "homeassistant" and len(parts) > 2 and parts[1] == "components":
+        return parts[2]
+    if parts[0] == "custom_components" and len(parts) > 1:
+        return parts[1]
+    return None
+
+
+class ExecutorPools:
+    """Named executor pools that integrations are assigned to.
+
+    Jobs are routed to the pool of the integration that defines the job's
+    target. When the target is not defined by an integration, for example a
+    library function, the job is routed by the code that submits it through
+    the job helpers of Home Assistant.
+    Jobs of integrations without a pool return None so they run in the
+    default executor of the event loop.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the pools."""
+        self.pools: dict[str, MeteredThreadPoolExecutor] = {}
+        self._domain_pools: dict[str, MeteredThreadPoolExecutor] = {}
+        self._module_domains: dict[str, str | None] = {}
+
+    def configure(
+        self, pools: dict[str, tuple[int, Iterable[str]]]
+    ) -> list[MeteredThreadPoolExecutor]:
+        """Configure the pools by name as a maximum of workers and integrations.
+
+        Pools whose size did not change are kept. Returns the pools that were
+        replaced or removed, which the caller has to shut down.
+        """
+        removed = []
+        for name, pool in list(self.pools.items()):
+            if name not in pools or pools[name][0] != pool.max_workers:
+                removed.append(self.pools.pop(name))
+
+        self._domain_pools = {}
+        for name, (max_workers, domains) in pools.items():
+            if name not in self.pools:
+                self.pools[name] = MeteredThreadPoolExecutor(name, max_workers)
+            for domain in domains:
+                self._domain_pools[domain] = self.pools[name]
+
+        return removed
+
+    def executor_for(self, target: Callable[..., Any]) -> ThreadPoolExecutor | None:
+        """Return the executor of the integration a target belongs to.
+
+        Must be called by the code that submits the target, as the stack of
+        the caller is used when the target does not belong to an integration.
+        """
+        if not self._domain_pools:
+            return None
+
+        while isinstance(target, functools.partial):
+            target = target.func
+        domain = self._domain_of_module(getattr(target, "__module__", None))
+
+        if domain is None:
+            # Skip the frames of this method and of the job helper calling it
+            # pylint: disable=protected-access
+            frame: FrameType | None = sys._getframe(2)
+            # pylint: enable=protected-access
+            while (
+                frame is not None
+                and frame.f_globals.get("__name__") == _JOB_HELPERS_MODULE
+            ):
+                frame = frame.f_back
+            if frame is not None:
+                domain = self._domain_of_module(frame.f_globals.get("__name__"))
+
+        return self._domain_pools.get(domain) if domain is not None else None
+
+    def _domain_of_module(self, module: str | None) -> str | None:
+        """Return the integration a module belongs to."""
+        if module is None:
+            return None
+        try:
+            return self._module_domains[module]
+        except KeyError:
+            domain = self._module_domains[module] = integration_of_module(module)
+            return domain
+
+    def shutdown(self) -> None:
+        """Shut down all pools."""
+        pools = list(self.pools.values())
+        self.pools = {}
+        self._domain_pools = {}
+        for pool in pools:
+            pool.shutdown()
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import asyncio
-from importlib.metadata import PackageNotFoundError, version
+from functools import lru_cache
+from importlib.metadata import distributions
 import logging
 import os
 from pathlib import Path
@@ -10,7 +11,8 @@ from subprocess import PIPE, Popen
 import sys
 from urllib.parse import urlparse
 
-import pkg_resources
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.utils import canonicalize_name
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,6 +30,22 @@ def is_docker_env() -> bool:
     return Path("/.dockerenv").exists()
 
 
+@lru_cache(maxsize=None)
+def get_installed_versions() -> dict[str, str | None]:
+    """Return the versions of the installed distributions by normalized name.
+
+    The index is built once and cleared after installing packages or changing
+    the library path.
+    """
+    installed: dict[str, str | None] = {}
+    for dist in distributions():
+        if (name := dist.metadata["Name"]) is None:
+            continue
+        # The first distribution on the path is the one that will be imported
+        installed.setdefault(canonicalize_name(name), dist.version)
+    return installed
+
+
 def is_installed(package: str) -> bool:
     """Check if a package is installed and will be loaded when we import it.
 
@@ -35,26 +53,30 @@ def is_installed(package: str) -> bool:
     Returns False when the package is not installed or doesn't meet req.
     """
     try:
-        pkg_resources.get_distribution(package)
-        return True
-    except (pkg_resources.ResolutionError, pkg_resources.ExtractionError):
-        req = pkg_resources.Requirement.parse(package)
-    except ValueError:
+        req = Requirement(package)
+    except InvalidRequirement:
         # This is a zip file. We no longer use this in Home Assistant,
         # leaving it in for custom components.
-        req = pkg_resources.Requirement.parse(urlparse(package).fragment)
-
-    try:
-        installed_version = version(req.project_name)
-        # This will happen when an install failed or
-        # was aborted while in progress see
-        # https://github.com/home-assistant/core/issues/47699
-        if installed_version is None:
-            _LOGGER.error("Installed version for %s resolved to None", req.project_name)  # type: ignore
+        try:
+            req = Requirement(urlparse(package).fragment)
+        except InvalidRequirement:
             return False
-        return installed_version in req
-    except PackageNotFoundError:
+
+    if req.marker is not None and not req.marker.evaluate():
+        # The requirement does not apply to this environment
+        return True
+
+    installed = get_installed_versions()
+    if (name := canonicalize_name(req.name)) not in installed:
+        return False
+
+    # This will happen when an install failed or
+    # was aborted while in progress see
+    # https://github.com/home-assistant/core/issues/47699
+    if (installed_version := installed[name]) is None:
+        _LOGGER.error("Installed version for %s resolved to None", req.name)
         return False
+    return req.specifier.contains(installed_version, prereleases=True)
 
 
 def install_package(
@@ -95,6 +117,8 @@ def install_package(
             args += ["--prefix="]
     with Popen(args, stdin=PIPE, stdout=PIPE, stderr=PIPE, env=env) as process:
         _, stderr = process.communicate()
+        # Also a failed install may have changed the installed packages
+        get_installed_versions.cache_clear()
         if process.returncode != 0:
             _LOGGER.error(
                 "Unable to install package %s: %s",
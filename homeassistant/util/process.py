@@ -2,11 +2,29 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+import logging
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+import os
 import subprocess
-from typing import Any
+import threading
+from typing import Any, TypeVar
 
 # mypy: disallow-any-generics
 
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+MAX_PROCESS_WORKERS = 4
+# Byte buffers at least this large are passed through shared memory instead
+# of being pickled through the pipe to the worker
+SHARED_MEMORY_MIN_SIZE = 1024 * 1024
+
 
 def kill_subprocess(
     # pylint: disable=unsubscriptable-object # https://github.com/PyCQA/pylint/issues/4369
@@ -18,3 +36,137 @@ def kill_subprocess(
     process.wait()
 
     del process
+
+
+@dataclass(frozen=True)
+class SharedBytes:
+    """Reference to bytes in a shared memory block."""
+
+    name: str
+    size: int
+
+
+def _to_shared_memory(value: bytes) -> tuple[SharedBytes, SharedMemory]:
+    """Copy bytes to a new shared memory block."""
+    shm = SharedMemory(create=True, size=len(value))
+    shm.buf[: len(value)] = value
+    return SharedBytes(shm.name, len(value)), shm
+
+
+def _from_shared_memory(shared: SharedBytes, unlink: bool) -> bytes:
+    """Copy bytes out of a shared memory block."""
+    shm = SharedMemory(name=shared.name)
+    try:
+        return bytes(shm.buf[: shared.size])
+    finally:
+        shm.close()
+        if unlink:
+            shm.unlink()
+
+
+def _warm_up() -> int:
+    """Return the pid of a worker, which makes it start and import this module."""
+    return os.getpid()
+
+
+def _run_in_worker(target: Callable[..., Any], args: tuple[Any, ...]) -> Any:
+    """Run a job in a worker and pass large results back in shared memory."""
+    result = target(
+        *(
+            _from_shared_memory(arg, False) if isinstance(arg, SharedBytes) else arg
+            for arg in args
+        )
+    )
+    if isinstance(result, bytes) and len(result) >= SHARED_MEMORY_MIN_SIZE:
+        shared, shm = _to_shared_memory(result)
+        shm.close()
+        return shared
+    return result
+
+
+class ProcessPool:
+    """A pool of worker processes for CPU heavy jobs.
+
+    The worker processes are started on the first job. Jobs run outside of
+    the GIL of Home Assistant, so their target and arguments have to be
+    picklable. Large byte buffers are passed in shared memory.
+
+    When worker processes can not be used, jobs run in the calling thread.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """Initialize the pool."""
+        self.max_workers = max_workers or min(MAX_PROCESS_WORKERS, os.cpu_count() or 1)
+        self.use_processes = True
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def started(self) -> bool:
+        """Return if the worker processes are started."""
+        return self._executor is not None
+
+    def start(self) -> None:
+        """Start the worker processes if they are not running."""
+        with self._lock:
+            if self._executor is not None or not self.use_processes:
+                return
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context(
+                "forkserver" if "forkserver" in methods else "spawn"
+            )
+            try:
+                executor = ProcessPoolExecutor(self.max_workers, mp_context=context)
+                # Start all workers now instead of delaying the first job
+                for _ in range(self.max_workers):
+                    executor.submit(_warm_up)
+            except (ImportError, OSError) as err:
+                _LOGGER.warning(
+                    "Unable to start worker processes, jobs run on threads: %s", err
+                )
+                self.use_processes = False
+                return
+            self._executor = executor
+
+    def run(self, target: Callable[..., _T], *args: Any) -> _T:
+        """Run a job in a worker process and wait for its result."""
+        self.start()
+        if (executor := self._executor) is None:
+            return target(*args)
+
+        shared_blocks = []
+        worker_args = []
+        for arg in args:
+            if isinstance(arg, bytes) and len(arg) >= SHARED_MEMORY_MIN_SIZE:
+                shared, shm = _to_shared_memory(arg)
+                shared_blocks.append(shm)
+                worker_args.append(shared)
+            else:
+                worker_args.append(arg)
+
+        try:
+            result = executor.submit(
+                _run_in_worker, target, tuple(worker_args)
+            ).result()
+        except BrokenProcessPool:
+            # A worker died, start new workers for the next job
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False)
+            raise
+        finally:
+            for shm in shared_blocks:
+                shm.close()
+                shm.unlink()
+
+        if isinstance(result, SharedBytes):
+            return _from_shared_memory(result, True)  # type: ignore[return-value]
+        return result  # type: ignore[no-any-return]
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
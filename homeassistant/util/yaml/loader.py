@@ -2,15 +2,26 @@
 from __future__ import annotations
 
 from collections import OrderedDict
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 import fnmatch
+import hashlib
 import logging
 import os
 from pathlib import Path
-from typing import Any, TextIO, TypeVar, Union, overload
+import pickle
+import tempfile
+from typing import TYPE_CHECKING, Any, TextIO, TypeVar, Union, overload
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as FastestAvailableSafeLoader
+
+    HAS_C_LOADER = True
+except ImportError:
+    HAS_C_LOADER = False
+    from yaml import SafeLoader as FastestAvailableSafeLoader  # type: ignore[misc]
+
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import SECRET_YAML
@@ -21,6 +32,9 @@ from .objects import Input, NodeListClass, NodeStrClass
 JSON_TYPE = Union[list, dict, str]  # pylint: disable=invalid-name
 DICT_T = TypeVar("DICT_T", bound=dict)  # pylint: disable=invalid-name
 
+# Bump when the format of the parsed file cache changes
+PARSED_CACHE_VERSION = 2
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -88,13 +102,152 @@ class Secrets:
         return secrets
 
 
-class SafeLineLoader(yaml.SafeLoader):
+class ParsedYamlCache:
+    """Store parsed YAML files on disk.
+
+    A file is only cached when its parsed content depends on nothing but the
+    file itself, so it does not include other files, environment variables or
+    secrets. Entries are invalidated when the modification time or size of
+    the file change. The cache is only readable by the owner.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """Initialize the cache."""
+        self.cache_dir = cache_dir
+
+    def _cache_path(self, fname: str) -> Path:
+        """Return the path of the cache entry of a file."""
+        return self.cache_dir / f"{hashlib.sha1(fname.encode()).hexdigest()}.pickle"
+
+    def _key(self, fname: str) -> tuple:
+        """Return the key a parsed file is stored with."""
+        stat = os.stat(fname)
+        return (PARSED_CACHE_VERSION, fname, stat.st_mtime_ns, stat.st_size)
+
+    def get(self, fname: str) -> tuple[tuple | None, Any]:
+        """Return the key of a file and its parsed content if cached."""
+        try:
+            key = self._key(fname)
+        except OSError:
+            return None, None
+
+        try:
+            with open(self._cache_path(fname), "rb") as cache_file:
+                # The key is stored first, so the content of a stale entry
+                # is not read
+                if pickle.load(cache_file) != key:
+                    return key, None
+                return key, pickle.load(cache_file)
+        except FileNotFoundError:
+            return key, None
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Unable to read cached %s: %s", fname, err)
+            return key, None
+
+    def set(self, key: tuple, fname: str, content: Any) -> None:
+        """Store the parsed content of a file."""
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # Temporary files are created readable by the owner only
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=self.cache_dir, delete=False
+            ) as tmp_file:
+                tmp_path = tmp_file.name
+                pickle.dump(key, tmp_file, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(content, tmp_file, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._cache_path(fname))
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Unable to cache %s: %s", fname, err)
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def prune(self) -> None:
+        """Remove the entries of files that no longer exist."""
+        try:
+            cache_paths = list(self.cache_dir.glob("*.pickle"))
+        except OSError:
+            return
+
+        for cache_path in cache_paths:
+            try:
+                with open(cache_path, "rb") as cache_file:
+                    key = pickle.load(cache_file)
+                if key[0] == PARSED_CACHE_VERSION and os.path.exists(key[1]):
+                    continue
+            except Exception:  # pylint: disable=broad-except
+                pass
+
+            _LOGGER.debug("Removing stale cache entry %s", cache_path)
+            try:
+                cache_path.unlink()
+            except OSError:
+                pass
+
+
+class _LoaderMixin:
+    """Attributes and state shared by the YAML loaders."""
+
+    name: str
+    secrets: Secrets | None
+    parsed_cache: ParsedYamlCache | None
+    # False when the parsed content depends on more than the file itself
+    cacheable: bool
+
+    if TYPE_CHECKING:
+
+        def dispose(self) -> None:
+            """Dispose the parser, provided by the parser of the loader."""
+
+    def _init_loader(
+        self, secrets: Secrets | None, parsed_cache: ParsedYamlCache | None
+    ) -> None:
+        """Initialize the attributes shared by the loaders."""
+        self.secrets = secrets
+        self.parsed_cache = parsed_cache
+        self.cacheable = True
+
+
+class FastSafeLoader(FastestAvailableSafeLoader, _LoaderMixin):
+    """The fastest available safe loader.
+
+    Uses libyaml if available. File names and lines are taken from the marks
+    of the nodes, which the C parser records as well.
+    """
+
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        parsed_cache: ParsedYamlCache | None = None,
+    ) -> None:
+        """Initialize a fast safe loader."""
+        super().__init__(stream)
+        if isinstance(stream, str):
+            self.name = "<unicode string>"
+        elif isinstance(stream, bytes):
+            self.name = "<byte string>"
+        else:
+            self.name = getattr(stream, "name", "<file>")
+        self.stream = stream
+        self._init_loader(secrets, parsed_cache)
+
+
+class SafeLineLoader(yaml.SafeLoader, _LoaderMixin):
     """Loader class that keeps track of line numbers."""
 
-    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        parsed_cache: ParsedYamlCache | None = None,
+    ) -> None:
         """Initialize a safe line loader."""
         super().__init__(stream)
-        self.secrets = secrets
+        self._init_loader(secrets, parsed_cache)
 
     def compose_node(self, parent: yaml.nodes.Node, index: int) -> yaml.nodes.Node:  # type: ignore[override]
         """Annotate a node with the first line it was seen."""
@@ -104,52 +257,101 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
-def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
+LoaderType = Union[FastSafeLoader, SafeLineLoader]
+
+
+def load_yaml(
+    fname: str,
+    secrets: Secrets | None = None,
+    parsed_cache: ParsedYamlCache | None = None,
+) -> JSON_TYPE:
     """Load a YAML file."""
+    key = None
+    if parsed_cache is not None:
+        key, content = parsed_cache.get(fname)
+        if content is not None:
+            return content
+
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            content, cacheable = _parse_yaml_with_loader(
+                conf_file, secrets, parsed_cache
+            )
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
 
+    if key is not None and cacheable:
+        parsed_cache.set(key, fname, content)  # type: ignore[union-attr]
+    return content
+
 
 def parse_yaml(content: str | TextIO, secrets: Secrets | None = None) -> JSON_TYPE:
     """Load a YAML file."""
+    return _parse_yaml_with_loader(content, secrets)[0]
+
+
+def _parse_yaml_with_loader(
+    content: str | TextIO,
+    secrets: Secrets | None = None,
+    parsed_cache: ParsedYamlCache | None = None,
+) -> tuple[JSON_TYPE, bool]:
+    """Parse YAML with the fastest loader, falling back to the line loader.
+
+    Returns the parsed content and if it may be cached.
+    """
+    if HAS_C_LOADER:
+        try:
+            return _parse_yaml(FastSafeLoader, content, secrets, parsed_cache)
+        except yaml.YAMLError:
+            # Parse again with the pure Python loader for its more detailed
+            # error messages
+            if hasattr(content, "seek"):
+                content.seek(0)  # type: ignore[union-attr]
+
     try:
-        # If configuration file is empty YAML returns None
-        # We convert that to an empty dict
-        return (
-            yaml.load(content, Loader=lambda stream: SafeLineLoader(stream, secrets))
-            or OrderedDict()
-        )
+        return _parse_yaml(SafeLineLoader, content, secrets, parsed_cache)
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
 
 
+def _parse_yaml(
+    loader_class: type[FastSafeLoader] | type[SafeLineLoader],
+    content: str | TextIO,
+    secrets: Secrets | None,
+    parsed_cache: ParsedYamlCache | None,
+) -> tuple[JSON_TYPE, bool]:
+    """Parse YAML with a loader."""
+    loader = loader_class(content, secrets, parsed_cache)
+    try:
+        # If configuration file is empty YAML returns None
+        # We convert that to an empty dict
+        return loader.get_single_data() or OrderedDict(), loader.cacheable
+    finally:
+        loader.dispose()
+
+
 @overload
 def _add_reference(
-    obj: list | NodeListClass, loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: list | NodeListClass, loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeListClass:
     ...
 
 
 @overload
 def _add_reference(
-    obj: str | NodeStrClass, loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: str | NodeStrClass, loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeStrClass:
     ...
 
 
 @overload
-def _add_reference(
-    obj: DICT_T, loader: SafeLineLoader, node: yaml.nodes.Node
-) -> DICT_T:
+def _add_reference(obj: DICT_T, loader: LoaderType, node: yaml.nodes.Node) -> DICT_T:
     ...
 
 
-def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type: ignore
+def _add_reference(obj, loader: LoaderType, node: yaml.nodes.Node):  # type: ignore
     """Add file reference information to an object."""
     if isinstance(obj, list):
         obj = NodeListClass(obj)
@@ -160,16 +362,19 @@ def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type:
     return obj
 
 
-def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load another YAML file and embeds it using the !include tag.
 
     Example:
         device_tracker: !include device_tracker.yaml
 
     """
+    loader.cacheable = False
     fname = os.path.join(os.path.dirname(loader.name), node.value)
     try:
-        return _add_reference(load_yaml(fname, loader.secrets), loader, node)
+        return _add_reference(
+            load_yaml(fname, loader.secrets, loader.parsed_cache), loader, node
+        )
     except FileNotFoundError as exc:
         raise HomeAssistantError(
             f"{node.start_mark}: Unable to read file {fname}."
@@ -191,63 +396,65 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
-def _include_dir_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
-) -> OrderedDict:
+def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> OrderedDict:
     """Load multiple files from directory as a dictionary."""
+    loader.cacheable = False
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
     for fname in _find_files(loc, "*.yaml"):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        mapping[filename] = load_yaml(fname, loader.secrets)
+        mapping[filename] = load_yaml(fname, loader.secrets, loader.parsed_cache)
     return _add_reference(mapping, loader, node)
 
 
 def _include_dir_merge_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a merged dictionary."""
+    loader.cacheable = False
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.parsed_cache)
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
     return _add_reference(mapping, loader, node)
 
 
 def _include_dir_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> list[JSON_TYPE]:
     """Load multiple files from directory as a list."""
+    loader.cacheable = False
     loc = os.path.join(os.path.dirname(loader.name), node.value)
     return [
-        load_yaml(f, loader.secrets)
+        load_yaml(f, loader.secrets, loader.parsed_cache)
         for f in _find_files(loc, "*.yaml")
         if os.path.basename(f) != SECRET_YAML
     ]
 
 
 def _include_dir_merge_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
+    loader.cacheable = False
     loc: str = os.path.join(os.path.dirname(loader.name), node.value)
     merged_list: list[JSON_TYPE] = []
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.parsed_cache)
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
     return _add_reference(merged_list, loader, node)
 
 
-def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> OrderedDict:
+def _ordered_dict(loader: LoaderType, node: yaml.nodes.MappingNode) -> OrderedDict:
     """Load YAML mappings into an ordered dictionary to preserve key order."""
     loader.flatten_mapping(node)
     nodes = loader.construct_pairs(node)
@@ -279,14 +486,15 @@ def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> Order
     return _add_reference(OrderedDict(nodes), loader, node)
 
 
-def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _construct_seq(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Add line number and file name to Load YAML sequence."""
     (obj,) = loader.construct_yaml_seq(node)
     return _add_reference(obj, loader, node)
 
 
-def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
+def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
+    loader.cacheable = False
     args = node.value.split()
 
     # Check for a default value
@@ -298,27 +506,29 @@ def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     raise HomeAssistantError(node.value)
 
 
-def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
+    # Secrets are never stored in the parsed file cache
+    loader.cacheable = False
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
 
     return loader.secrets.get(loader.name, node.value)
 
 
-SafeLineLoader.add_constructor("!include", _include_yaml)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
-)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
-)
-SafeLineLoader.add_constructor("!env_var", _env_var_yaml)
-SafeLineLoader.add_constructor("!secret", secret_yaml)
-SafeLineLoader.add_constructor("!include_dir_list", _include_dir_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
-SafeLineLoader.add_constructor(
-    "!include_dir_merge_named", _include_dir_merge_named_yaml
-)
-SafeLineLoader.add_constructor("!input", Input.from_node)
+def add_constructor(tag: Any, constructor: Callable) -> None:
+    """Add a constructor to all loaders."""
+    for loader_class in (FastSafeLoader, SafeLineLoader):
+        loader_class.add_constructor(tag, constructor)
+
+
+add_constructor("!include", _include_yaml)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq)
+add_constructor("!env_var", _env_var_yaml)
+add_constructor("!secret", secret_yaml)
+add_constructor("!include_dir_list", _include_dir_list_yaml)
+add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
+add_constructor("!include_dir_named", _include_dir_named_yaml)
+add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
+add_constructor("!input", Input.from_node)
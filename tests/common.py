@@ -266,6 +266,8 @@ async def async_test_home_assistant(loop, load_registries=True):
 
     hass.async_add_job = async_add_job
     hass.async_add_executor_job = async_add_executor_job
+    # Run process jobs on threads so they see what the tests patch
+    hass.process_pool.use_processes = False
     hass.async_create_task = async_create_task
     hass.async_wait_for_task_count = types.MethodType(async_wait_for_task_count, hass)
     hass._await_count_and_log_pending = types.MethodType(
@@ -804,3 +804,28 @@ async def test_aiodiscover_finds_new_hosts_after_interval(hass):
         dhcp.HOSTNAME: "connect",
         dhcp.MAC_ADDRESS: "b8b7f16db533",
     }
+
+
+def test_integration_matchers():
+    """Test the compiled matchers keep the manifest order and cache matches."""
+    matchers = dhcp.IntegrationMatchers(
+        [
+            {"domain": "by-oui", "hostname": "connect*", "macaddress": "B8B7F1*"},
+            {"domain": "by-hostname", "hostname": "conn*"},
+            {"domain": "by-mac-glob", "macaddress": "B8B7F1?D*"},
+            {"domain": "other-oui", "macaddress": "AABBCC*"},
+        ]
+    )
+
+    assert [entry["domain"] for entry in matchers.match("B8B7F16DB533", "connect")] == [
+        "by-oui",
+        "by-hostname",
+        "by-mac-glob",
+    ]
+    assert [entry["domain"] for entry in matchers.match("B8B7F16DB533", "other")] == [
+        "by-mac-glob"
+    ]
+    assert matchers.match("001122334455", "unknown") == ()
+
+    matchers.match("001122334455", "unknown")
+    assert matchers.match.cache_info().hits == 1
@@ -3,6 +3,7 @@ from datetime import timedelta
 from os import path
 from unittest.mock import patch
 
+import pytest
 from pytest import fixture
 
 from homeassistant import config as hass_config
@@ -11,10 +12,12 @@ from homeassistant.components.filter.sensor import (
     LowPassFilter,
     OutlierFilter,
     RangeFilter,
+    RingBuffer,
     ThrottleFilter,
     TimeSMAFilter,
     TimeThrottleFilter,
 )
+from homeassistant.components.recorder import history
 from homeassistant.components.sensor import DEVICE_CLASS_TEMPERATURE
 from homeassistant.const import SERVICE_RELOAD, STATE_UNAVAILABLE, STATE_UNKNOWN
 import homeassistant.core as ha
@@ -22,6 +25,7 @@ from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
 from tests.common import assert_setup_component, async_init_recorder_component
+from tests.components.recorder.common import async_wait_recording_done_without_instance
 
 
 @fixture
@@ -112,10 +116,7 @@ async def test_chain_history(hass, values, missing=False):
         }
 
     with patch(
-        "homeassistant.components.recorder.history.state_changes_during_period",
-        return_value=fake_states,
-    ), patch(
-        "homeassistant.components.recorder.history.get_last_state_changes",
+        "homeassistant.components.recorder.history.get_last_state_changes_for_entities",
         return_value=fake_states,
     ):
         with assert_setup_component(1, "sensor"):
@@ -227,10 +228,7 @@ async def test_history_time(hass):
         ]
     }
     with patch(
-        "homeassistant.components.recorder.history.state_changes_during_period",
-        return_value=fake_states,
-    ), patch(
-        "homeassistant.components.recorder.history.get_last_state_changes",
+        "homeassistant.components.recorder.history.get_last_state_changes_for_entities",
         return_value=fake_states,
     ):
         with assert_setup_component(1, "sensor"):
@@ -242,6 +240,55 @@ async def test_history_time(hass):
         assert state.state == "18.0"
 
 
+async def test_history_batched(hass):
+    """Test the sensors set up together load their history in one batch."""
+    await async_init_recorder_component(hass)
+
+    for value in (20, 19, 18, 21):
+        hass.states.async_set("sensor.test_first", value)
+        hass.states.async_set("sensor.test_second", value * 2)
+        await hass.async_block_till_done()
+    await async_wait_recording_done_without_instance(hass)
+
+    config = {
+        "sensor": [
+            {
+                "platform": "filter",
+                "name": "first",
+                "entity_id": "sensor.test_first",
+                "filters": [
+                    {"filter": "lowpass", "window_size": 10, "time_constant": 2}
+                ],
+            },
+            {
+                "platform": "filter",
+                "name": "second",
+                "entity_id": "sensor.test_second",
+                "filters": [
+                    {"filter": "outlier", "window_size": 3},
+                    {"filter": "time_simple_moving_average", "window_size": "01:00"},
+                ],
+            },
+        ]
+    }
+    with patch(
+        "homeassistant.components.recorder.history.get_last_state_changes_for_entities",
+        wraps=history.get_last_state_changes_for_entities,
+    ) as load_history:
+        with assert_setup_component(2, "sensor"):
+            assert await async_setup_component(hass, "sensor", config)
+            await hass.async_block_till_done()
+
+    assert load_history.call_count == 1
+    assert sorted(load_history.call_args[0][2]) == [
+        "sensor.test_first",
+        "sensor.test_second",
+    ]
+    assert hass.states.get("sensor.first").state == "19.88"
+    # The first state covers nearly all of the time window of the average
+    assert hass.states.get("sensor.second").state == "40.0"
+
+
 async def test_setup(hass):
     """Test if filter attributes are inherited."""
     config = {
@@ -486,3 +533,48 @@ async def test_reload(hass):
 
 def _get_fixtures_base_path():
     return path.dirname(path.dirname(path.dirname(__file__)))
+
+
+def test_time_sma_long_window(values):
+    """Test the time_sma filter matches the average over the window."""
+    filt = TimeSMAFilter(
+        window_size=timedelta(minutes=10), precision=4, entity=None, type="last"
+    )
+    timestamp = values[0].last_updated
+    history = []
+    for index in range(200):
+        value = (index * 7) % 13
+        state = ha.State("sensor.test_monitored", value, last_updated=timestamp)
+        history.append((timestamp, value))
+        filtered = filt.filter_state(state)
+
+        start = timestamp - timedelta(minutes=10)
+        prev = [item for item in history if item[0] <= start]
+        window = [item for item in history if item[0] > start]
+        prev_value = prev[-1][1] if prev else window[0][1]
+        moving_sum = 0
+        for item_timestamp, item_value in window:
+            moving_sum += (item_timestamp - start).total_seconds() * prev_value
+            start, prev_value = item_timestamp, item_value
+        assert filtered.state == round(moving_sum / 600, 4)
+
+        timestamp += timedelta(seconds=(index % 5) * 30 + 10)
+
+
+def test_ring_buffer():
+    """Test the ring buffer keeps the last values."""
+    buffer = RingBuffer(3)
+    assert len(buffer) == 0
+    assert buffer.append(1) is None
+    assert buffer.append(2) is None
+    assert buffer.append(3) is None
+    assert buffer.append(4) == 1
+    assert list(buffer) == [2, 3, 4]
+    assert buffer[0] == 2
+    assert buffer[-1] == 4
+    with pytest.raises(IndexError):
+        buffer[3]
+
+    buffer.clear()
+    assert len(buffer) == 0
+    assert RingBuffer(0).append(1) is None
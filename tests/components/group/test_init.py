@@ -168,6 +168,45 @@ async def test_allgroup_turn_on_if_last_turns_on(hass):
     assert group_state.state == STATE_ON
 
 
+async def test_large_group_tracks_member_changes(hass):
+    """Test the on and assumed state of a large group follow single changes."""
+    entity_ids = [f"light.light_{idx}" for idx in range(1000)]
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, STATE_OFF)
+
+    assert await async_setup_component(hass, "group", {})
+
+    any_group = await group.Group.async_create_group(
+        hass, "any_lights", entity_ids, False
+    )
+    all_group = await group.Group.async_create_group(
+        hass, "all_lights", entity_ids, False, mode=True
+    )
+    assert any_group.state == STATE_OFF
+    assert all_group.state == STATE_OFF
+
+    hass.states.async_set(entity_ids[500], STATE_ON, {ATTR_ASSUMED_STATE: True})
+    await hass.async_block_till_done()
+
+    assert hass.states.get(any_group.entity_id).state == STATE_ON
+    assert hass.states.get(any_group.entity_id).attributes.get(ATTR_ASSUMED_STATE)
+    assert hass.states.get(all_group.entity_id).state == STATE_OFF
+
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, STATE_ON)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(all_group.entity_id).state == STATE_ON
+    assert not hass.states.get(any_group.entity_id).attributes.get(ATTR_ASSUMED_STATE)
+
+    for entity_id in entity_ids:
+        hass.states.async_set(entity_id, STATE_OFF)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(any_group.entity_id).state == STATE_OFF
+    assert hass.states.get(all_group.entity_id).state == STATE_OFF
+
+
 async def test_expand_entity_ids(hass):
     """Test expand_entity_ids method."""
     hass.states.async_set("light.Bowl", STATE_ON)
@@ -429,5 +429,62 @@ async def async_test_measure(hass):
     assert hass.states.get("sensor.sensor4").state == "50.0"
 
 
+async def test_measure_state_changes(hass):
+    """Test state changes are measured without reading the database again."""
+    await async_init_recorder_component(hass)
+
+    t0 = dt_util.utcnow() - timedelta(minutes=40)
+
+    # Start     t0                  now
+    # |--20min--|-------40min-------|
+    # |---off---|--------on---------|
+
+    fake_states = {
+        "binary_sensor.test_id": [
+            ha.State("binary_sensor.test_id", "on", last_changed=t0),
+        ]
+    }
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        return_value=fake_states,
+    ), patch("homeassistant.components.recorder.history.get_state", return_value=None):
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "sensor1",
+                        "state": "on",
+                        "start": "{{ as_timestamp(now()) - 3600 }}",
+                        "end": "{{ now() }}",
+                        "type": "count",
+                    },
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.sensor1").state == "1"
+
+    with patch(
+        "homeassistant.components.recorder.history.state_changes_during_period"
+    ) as mock_changes, patch(
+        "homeassistant.components.recorder.history.get_state"
+    ) as mock_get_state:
+        hass.states.async_set("binary_sensor.test_id", "off")
+        await hass.async_block_till_done()
+        hass.states.async_set("binary_sensor.test_id", "on")
+        await hass.async_block_till_done()
+        await hass.helpers.entity_component.async_update_entity("sensor.sensor1")
+
+    assert hass.states.get("sensor.sensor1").state == "2"
+    assert not mock_changes.called
+    assert not mock_get_state.called
+
+
 def _get_fixtures_base_path():
     return path.dirname(path.dirname(path.dirname(__file__)))
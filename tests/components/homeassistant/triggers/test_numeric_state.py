@@ -11,7 +11,8 @@ from homeassistant.components.homeassistant.triggers import (
     numeric_state as numeric_state_trigger,
 )
 from homeassistant.const import ATTR_ENTITY_ID, ENTITY_MATCH_ALL, SERVICE_TURN_OFF
-from homeassistant.core import Context
+from homeassistant.core import Context, callback
+from homeassistant.helpers.trigger import DATA_SHARED_TRIGGERS
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -1822,3 +1823,86 @@ async def test_template_variable(hass, calls, multiplier):
         assert len(calls) == 1
     else:
         assert len(calls) == 0
+
+
+async def test_shared_trigger(hass, calls):
+    """Test automations with the same trigger share its armed state."""
+    hass.states.async_set("test.entity", 11)
+    await hass.async_block_till_done()
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "trigger": {
+                        "platform": "numeric_state",
+                        "entity_id": "test.entity",
+                        "below": 10,
+                        "id": name,
+                    },
+                    "action": {
+                        "service": "test.automation",
+                        "data_template": {"some": "{{ trigger.id }}"},
+                    },
+                }
+                for name in ("first", "second")
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+    assert len(hass.data[DATA_SHARED_TRIGGERS]) == 1
+
+    hass.states.async_set("test.entity", 9)
+    await hass.async_block_till_done()
+    assert sorted(call.data["some"] for call in calls) == ["first", "second"]
+
+    # Not armed again until the value leaves the range
+    hass.states.async_set("test.entity", 8)
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
+async def test_shared_trigger_arming(hass):
+    """Test each subscriber of a shared trigger is armed on its own."""
+    calls = []
+
+    @callback
+    def action(run_variables, context=None):
+        calls.append(run_variables["trigger"]["id"])
+
+    config = numeric_state_trigger.TRIGGER_SCHEMA(
+        {"platform": "numeric_state", "entity_id": "test.entity", "below": 10}
+    )
+
+    async def async_attach(trigger_id):
+        return await numeric_state_trigger.async_attach_trigger(
+            hass,
+            config,
+            action,
+            {"trigger_data": {"id": trigger_id}, "variables": None, "name": trigger_id},
+        )
+
+    hass.states.async_set("test.entity", 11)
+    await async_attach("first")
+    hass.states.async_set("test.entity", 9)
+    await hass.async_block_till_done()
+    assert calls == ["first"]
+
+    # Subscribing inside the range does not arm the subscriber
+    unsub = await async_attach("second")
+    assert len(hass.data[DATA_SHARED_TRIGGERS]) == 1
+    hass.states.async_set("test.entity", 8)
+    await hass.async_block_till_done()
+    assert calls == ["first"]
+
+    hass.states.async_set("test.entity", 11)
+    hass.states.async_set("test.entity", 5)
+    await hass.async_block_till_done()
+    assert sorted(calls) == ["first", "first", "second"]
+
+    unsub()
+    hass.states.async_set("test.entity", 11)
+    hass.states.async_set("test.entity", 5)
+    await hass.async_block_till_done()
+    assert sorted(calls) == ["first", "first", "first", "second"]
@@ -8,6 +8,7 @@ import homeassistant.components.automation as automation
 from homeassistant.components.homeassistant.triggers import state as state_trigger
 from homeassistant.const import ATTR_ENTITY_ID, ENTITY_MATCH_ALL, SERVICE_TURN_OFF
 from homeassistant.core import Context
+from homeassistant.helpers.trigger import DATA_SHARED_TRIGGERS
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -1358,3 +1359,64 @@ async def test_variables_priority(hass, calls):
         await hass.async_block_till_done()
         assert len(calls) == 2
         assert calls[1].data["some"] == "test.entity_2 - 0:00:10"
+
+
+async def test_shared_trigger(hass, calls):
+    """Test automations with the same trigger share its listener and period."""
+    trigger = {
+        "platform": "state",
+        "entity_id": "test.entity",
+        "to": ["world", "planet"],
+        "for": {"seconds": 5},
+    }
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "alias": name,
+                    "trigger": {**trigger, "id": name},
+                    "action": {
+                        "service": "test.automation",
+                        "data_template": {
+                            "some": "{{ trigger.id }} - {{ trigger.for }}"
+                        },
+                    },
+                }
+                for name in ("first", "second")
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+    assert len(hass.data[DATA_SHARED_TRIGGERS]) == 1
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert sorted(call.data["some"] for call in calls) == [
+        "first - 0:00:05",
+        "second - 0:00:05",
+    ]
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: "automation.first"},
+        blocking=True,
+    )
+    hass.states.async_set("test.entity", "planet")
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+    assert calls[2].data["some"] == "second - 0:00:05"
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: "automation.second"},
+        blocking=True,
+    )
+    assert not hass.data[DATA_SHARED_TRIGGERS]
@@ -1,5 +1,6 @@
 """Test the Profiler config flow."""
 from datetime import timedelta
+import logging
 import os
 from unittest.mock import patch
 
@@ -16,9 +17,12 @@ from homeassistant.components.profiler import (
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
+from homeassistant.helpers.entity_component import EntityComponent
 import homeassistant.util.dt as dt_util
 
-from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.common import MockConfigEntry, MockEntity, async_fire_time_changed
+
+_LOGGER = logging.getLogger(__name__)
 
 
 async def test_basic_usage(hass, tmpdir):
@@ -192,3 +196,86 @@ async def test_log_scheduled(hass, caplog):
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_integration_load(hass, hass_ws_client):
+    """Test the sampled load is available over websocket and as sensors."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.event_loop_load") is not None
+    assert hass.states.get("sensor.busiest_integration") is not None
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "profiler/integration_load"})
+    response = await client.receive_json()
+
+    assert response["success"]
+    assert response["result"]["interval"] > 0
+    assert isinstance(response["result"]["integrations"], list)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 2, "type": "profiler/integration_load"})
+    response = await client.receive_json()
+
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+
+async def test_executor_pools(hass, hass_ws_client):
+    """Test the statistics of the executor pools are available over websocket."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    hass.executor_pools.configure({"io": (2, ["profiler"])})
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "profiler/executor_pools"})
+    response = await client.receive_json()
+
+    assert response["success"]
+    assert [pool["name"] for pool in response["result"]] == ["default", "io"]
+    assert response["result"][1]["max_workers"] == 2
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_polling(hass, hass_ws_client):
+    """Test the statistics of the polling platforms are available over websocket."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    component = EntityComponent(_LOGGER, "test_domain", hass, timedelta(seconds=20))
+    await component.async_add_entities([MockEntity(should_poll=True)])
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "profiler/polling"})
+    response = await client.receive_json()
+
+    assert response["success"]
+    polled = [
+        platform
+        for platform in response["result"]
+        if platform["domain"] == "test_domain"
+    ]
+    assert len(polled) == 1
+    assert polled[0]["scan_interval"] == 20
+    assert polled[0]["cycles"] == 1
+    assert polled[0]["overruns"] == 0
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,40 @@
+"""Test the event loop sampler of the profiler."""
+import sys
+import threading
+import time
+
+from homeassistant.components.profiler.sampler import KIND_TASK, LoopSampler
+
+
+def _call_from_module(module, func):
+    """Call a function from code that belongs to a module."""
+    namespace = {"__name__": module, "func": func}
+    code = compile("def call():\n    return func()\n", f"<{module}>", "exec")
+    exec(code, namespace)  # pylint: disable=exec-used
+    return namespace["call"]()
+
+
+async def test_samples_attributed_to_outermost_integration(hass):
+    """Test samples are attributed to the integration running the job."""
+    sampler = LoopSampler(hass, threading.get_ident())
+    start = time.monotonic()
+
+    def _sample(offset):
+        sampler.sample({threading.get_ident(): sys._getframe()}, start + offset)
+
+    def _sample_in_sensor_code(offset):
+        _call_from_module("homeassistant.components.sensor", lambda: _sample(offset))
+
+    _call_from_module("custom_components.slow", lambda: _sample_in_sensor_code(0.01))
+    _call_from_module("custom_components.slow", lambda: _sample_in_sensor_code(0.02))
+    # The event loop thread is gone, which ends the job
+    sampler.sample({}, start + 0.03)
+
+    statistics = await sampler.async_get_statistics()
+    assert [item["domain"] for item in statistics["integrations"]] == ["slow"]
+
+    slow = statistics["integrations"][0]
+    assert slow["loop_share"] > 0.5
+    assert slow["executor_share"] == 0
+    assert list(slow["kinds"]) == [KIND_TASK]
+    assert slow["duration_max"] >= 0.01
@@ -130,6 +130,46 @@ def test_get_last_state_changes(hass_recorder):
     assert states == hist[entity_id]
 
 
+def test_get_last_state_changes_for_entities(hass_recorder):
+    """Test the state changes of several entities are returned together."""
+    hass = hass_recorder()
+
+    def set_state(entity_id, state):
+        """Set the state."""
+        hass.states.set(entity_id, state)
+        wait_recording_done(hass)
+        return hass.states.get(entity_id)
+
+    start = dt_util.utcnow()
+    states = {"sensor.one": [], "sensor.two": []}
+    for minutes in range(3):
+        point = start + timedelta(minutes=minutes)
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow", return_value=point
+        ):
+            states["sensor.one"].append(set_state("sensor.one", str(minutes)))
+            states["sensor.two"].append(set_state("sensor.two", str(minutes * 2)))
+
+    hist = history.get_last_state_changes_for_entities(
+        hass, 1, ["sensor.one", "sensor.two"]
+    )
+    assert hist == {
+        "sensor.one": states["sensor.one"][-1:],
+        "sensor.two": states["sensor.two"][-1:],
+    }
+
+    window_start = start + timedelta(seconds=90)
+    hist = history.get_last_state_changes_for_entities(
+        hass, 1, ["sensor.one", "sensor.two"], start_time=window_start
+    )
+    # The state at the start of the window comes first
+    assert [(state.state, state.last_updated) for state in hist["sensor.one"]] == [
+        ("1", window_start),
+        ("2", states["sensor.one"][2].last_updated),
+    ]
+    assert hist["sensor.two"][1:] == states["sensor.two"][2:]
+
+
 def test_ensure_state_can_be_copied(hass_recorder):
     """Ensure a state can pass though copy().
 
@@ -1,21 +1,27 @@
 """The tests for sensor recorder platform."""
 # pylint: disable=protected-access,invalid-name
-from datetime import timedelta
+from datetime import date, timedelta
 from unittest.mock import patch, sentinel
 
 import pytest
 from pytest import approx
 
-from homeassistant.components.recorder import history
+from homeassistant.components.recorder import StatisticsRollupBackfillTask, history
 from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
+    Statistics,
+    StatisticsMeta,
     StatisticsShortTerm,
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.statistics import (
+    _update_or_add_metadata,
+    compile_rollup_statistics,
     get_last_statistics,
+    get_metadata,
     statistics_during_period,
 )
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import TEMP_CELSIUS
 from homeassistant.setup import setup_component
 import homeassistant.util.dt as dt_util
@@ -108,6 +114,136 @@ def test_compile_hourly_statistics(hass_recorder):
     assert stats == {}
 
 
+def test_statistics_meta_cache(hass_recorder):
+    """Test the statistics metadata is read from the cache."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    metadata = {
+        "statistic_id": "sensor.test1",
+        "unit_of_measurement": "kWh",
+        "has_mean": False,
+        "has_sum": True,
+    }
+
+    with session_scope(hass=hass) as session:
+        session.add(
+            StatisticsMeta.from_meta("recorder", "sensor.test1", "kWh", False, True)
+        )
+    assert get_metadata(hass, "sensor.test1") == metadata
+
+    with patch("homeassistant.components.recorder.statistics.execute") as mock_execute:
+        assert get_metadata(hass, "sensor.test1") == metadata
+        assert get_metadata(hass, "sensor.test2") is None
+    mock_execute.assert_not_called()
+
+    # Added and updated metadata is written to the cache
+    with session_scope(hass=hass) as session:
+        _update_or_add_metadata(
+            hass, session, {**metadata, "unit_of_measurement": "Wh"}
+        )
+        _update_or_add_metadata(
+            hass, session, {**metadata, "statistic_id": "sensor.test2"}
+        )
+
+    with patch("homeassistant.components.recorder.statistics.execute") as mock_execute:
+        assert get_metadata(hass, "sensor.test1") == {
+            **metadata,
+            "unit_of_measurement": "Wh",
+        }
+        assert get_metadata(hass, "sensor.test2") == {
+            **metadata,
+            "statistic_id": "sensor.test2",
+        }
+    mock_execute.assert_not_called()
+
+    # The table is read again after the cache is cleared
+    recorder.statistics_meta_cache.clear()
+    assert get_metadata(hass, "sensor.test1") == {
+        **metadata,
+        "unit_of_measurement": "Wh",
+    }
+
+
+@pytest.fixture
+def set_time_zone():
+    """Set the time zone for the tests."""
+    # Set our timezone to CST/Regina so local days don't start at midnight UTC
+    dt_util.set_default_time_zone(dt_util.get_time_zone("America/Regina"))
+    yield
+    dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
+
+
+def test_rollup_statistics(hass_recorder, set_time_zone):
+    """Test rolling up hourly statistics into local days and months."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    sept_30 = dt_util.as_utc(dt_util.start_of_local_day(date(2021, 9, 30)))
+    oct_1 = dt_util.as_utc(dt_util.start_of_local_day(date(2021, 10, 1)))
+    oct_2 = dt_util.as_utc(dt_util.start_of_local_day(date(2021, 10, 2)))
+
+    def add_hours(session, metadata_id, start, hours):
+        for hour in hours:
+            session.add(
+                Statistics.from_stats(
+                    metadata_id,
+                    {
+                        "start": start + timedelta(hours=hour),
+                        "mean": hour,
+                        "min": hour - 1,
+                        "max": hour + 1,
+                        "state": hour,
+                        "sum": hour,
+                    },
+                )
+            )
+
+    with session_scope(hass=hass) as session:
+        session.add(
+            StatisticsMeta.from_meta("recorder", "sensor.test1", "kWh", True, True)
+        )
+    with session_scope(hass=hass) as session:
+        metadata_id = session.query(StatisticsMeta.id).scalar()
+        add_hours(session, metadata_id, sept_30, range(47))
+
+    # Existing statistics are rolled up once all hours of a period were compiled
+    recorder.queue.put(StatisticsRollupBackfillTask())
+    wait_recording_done(hass)
+
+    def expected(start, end, hours):
+        return {
+            "statistic_id": "sensor.test1",
+            "start": process_timestamp_to_utc_isoformat(start),
+            "end": process_timestamp_to_utc_isoformat(end),
+            "mean": approx(sum(hours) / len(hours)),
+            "min": approx(hours[0] - 1),
+            "max": approx(hours[-1] + 1),
+            "last_reset": None,
+            "state": approx(hours[-1]),
+            "sum": approx(hours[-1]),
+            "sum_decrease": None,
+            "sum_increase": None,
+        }
+
+    sept_30_stats = expected(sept_30, oct_1, list(range(24)))
+    assert statistics_during_period(hass, sept_30, period="day") == {
+        "sensor.test1": [sept_30_stats]
+    }
+    sept_1 = dt_util.as_utc(dt_util.start_of_local_day(date(2021, 9, 1)))
+    assert statistics_during_period(hass, sept_1, period="month") == {
+        "sensor.test1": [
+            {**sept_30_stats, "start": process_timestamp_to_utc_isoformat(sept_1)}
+        ]
+    }
+
+    # The day is rolled up when its last hour is compiled
+    with session_scope(hass=hass) as session:
+        add_hours(session, metadata_id, sept_30, [47])
+        compile_rollup_statistics(session, sept_30 + timedelta(hours=47))
+
+    stats = statistics_during_period(hass, oct_1, period="day")
+    assert stats == {"sensor.test1": [expected(oct_1, oct_2, list(range(24, 48)))]}
+
+
 @pytest.fixture
 def mock_sensor_statistics():
     """Generate some fake statistics."""
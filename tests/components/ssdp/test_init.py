@@ -567,3 +567,31 @@ async def test_ipv4_does_additional_search_for_sonos(
         ),
     )
     assert ssdp_listener.async_search.call_args[1] == {}
+
+
+async def test_integration_matchers(hass):
+    """Test the indexed matchers match like comparing every matcher."""
+    matchers = ssdp.IntegrationMatchers(
+        {
+            "by_st": [{"st": "mock-st"}],
+            "by_device_type": [
+                {"deviceType": "Paulus", "manufacturer": "Paulus"},
+                {"manufacturer": "Other"},
+            ],
+            "by_model": [{"modelName": "Model"}],
+        }
+    )
+
+    assert matchers.async_matching_domains(
+        CaseInsensitiveDict(st="mock-st", devicetype="Paulus", manufacturer="Paulus")
+    ) == {"by_st", "by_device_type"}
+    assert matchers.async_matching_domains(
+        CaseInsensitiveDict(
+            deviceType="Paulus", manufacturer="Other", modelName="Model"
+        )
+    ) == {"by_device_type", "by_model"}
+    assert matchers.async_matching_domains(CaseInsensitiveDict(st="other")) == set()
+    # Nested values of the description are compared without the cache
+    assert matchers.async_matching_domains(
+        CaseInsensitiveDict(st="mock-st", manufacturer={"nested": "value"})
+    ) == {"by_st"}
@@ -0,0 +1,54 @@
+"""The tests for the rolling statistics of the statistics sensor."""
+import random
+import statistics
+
+import pytest
+from pytest import approx
+
+from homeassistant.components.statistics.rolling import RollingStatistics
+
+
+@pytest.mark.parametrize("method", ["exclusive", "inclusive"])
+def test_rolling_statistics_match_stdlib(method):
+    """Test the incremental statistics match the statistics module."""
+    rnd = random.Random(42)
+    window = RollingStatistics(50)
+    values = []
+
+    for step in range(500):
+        value = round(rnd.uniform(-100, 100), rnd.randint(0, 3))
+        window.append(value)
+        values = (values + [value])[-50:]
+        # Values also expire before the window is full
+        if step % 7 == 0 and len(window) > 2:
+            assert window.popleft() == values.pop(0)
+
+        assert list(window) == values
+        assert window.total == approx(sum(values))
+        assert window.mean == approx(statistics.mean(values))
+        assert window.median == statistics.median(values)
+        assert window.min == min(values)
+        assert window.max == max(values)
+        if len(values) > 1:
+            assert window.variance == approx(statistics.variance(values))
+            assert window.stdev == approx(statistics.stdev(values))
+            assert window.quantiles(4, method) == approx(
+                statistics.quantiles(values, n=4, method=method)
+            )
+
+
+def test_rolling_statistics_empty_window():
+    """Test the running sums start over when the window is emptied."""
+    window = RollingStatistics(3)
+    window.append(1e9)
+    window.append(1e9 + 1)
+    window.popleft()
+    window.popleft()
+    assert len(window) == 0
+
+    window.append(2.0)
+    window.append(4.0)
+    assert window.mean == 3.0
+    assert window.variance == 2.0
+    assert window[0] == 2.0
+    assert window[-1] == 4.0
@@ -30,7 +30,7 @@ def _find_traces(traces, trace_type, item_id):
 
 
 async def _setup_automation_or_script(
-    hass, domain, configs, script_config=None, stored_traces=None
+    hass, domain, configs, script_config=None, stored_traces=None, capture=None
 ):
     """Set up automations or scripts from automation config."""
     if domain == "script":
@@ -54,6 +54,10 @@ async def _setup_automation_or_script(
                 config["trace"] = {}
                 config["trace"]["stored_traces"] = stored_traces
 
+    if capture is not None:
+        for config in configs.values() if domain == "script" else configs:
+            config.setdefault("trace", {})["capture"] = capture
+
     assert await async_setup_component(hass, domain, {domain: configs})
 
 
@@ -460,6 +464,105 @@ async def test_trace_no_traces(hass, hass_ws_client, domain):
     assert len(_find_traces(response["result"], domain, "sun")) == 0
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+@pytest.mark.parametrize(
+    "global_capture, capture, stored, changed_variables",
+    [
+        (None, "off", False, False),
+        (None, "summary", True, False),
+        ("summary", None, True, False),
+        ("off", "full", True, True),
+    ],
+)
+async def test_trace_capture(
+    hass, hass_ws_client, domain, global_capture, capture, stored, changed_variables
+):
+    """Test the level of detail traces are captured with."""
+    id = 1
+
+    def next_id():
+        nonlocal id
+        id += 1
+        return id
+
+    if global_capture is not None:
+        assert await async_setup_component(
+            hass, "trace", {"trace": {"capture": global_capture}}
+        )
+
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [{"variables": {"brightness": 100}}, {"event": "some_event"}],
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config], capture=capture)
+
+    client = await hass_ws_client()
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    traces = _find_traces(response["result"], domain, "sun")
+    if not stored:
+        assert traces == []
+        return
+    assert len(traces) == 1
+
+    await client.send_json(
+        {
+            "id": next_id(),
+            "type": "trace/get",
+            "domain": domain,
+            "item_id": "sun",
+            "run_id": traces[0]["run_id"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    trace = response["result"]["trace"]
+    prefix = "action" if domain == "automation" else "sequence"
+    assert set(trace) >= {f"{prefix}/0", f"{prefix}/1"}
+    assert ("changed_variables" in trace[f"{prefix}/1"][0]) == changed_variables
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_run_statistics(hass, hass_ws_client, domain):
+    """Test the run statistics of scripts and automations."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(hass, domain, [sun_config])
+
+    client = await hass_ws_client()
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/run_statistics", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(response["result"]) == 1
+    statistics = response["result"][0]
+    assert statistics["domain"] == domain
+    assert statistics["runs"] == 2
+    assert statistics["running"] == 0
+    assert statistics["run_time_max"] >= statistics["run_time_avg"] > 0
+
+    other_domain = "script" if domain == "automation" else "automation"
+    await client.send_json(
+        {"id": 2, "type": "trace/run_statistics", "domain": other_domain}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == []
+
+
 @pytest.mark.parametrize(
     "domain, prefix, trigger, last_step, script_execution",
     [
@@ -882,3 +882,17 @@ async def test_no_name(hass, mock_async_zeroconf):
     register_call = mock_async_zeroconf.async_register_service.mock_calls[-1]
     info = register_call.args[0]
     assert info.name == "Home._home-assistant._tcp.local."
+
+
+def test_homekit_models():
+    """Test the first matching HomeKit model wins."""
+    models = zeroconf.HomeKitModels(
+        {"LIFX": "lifx", "LIFX Z": "lifx_z", "tado*": "tado", "Rachio": "rachio"}
+    )
+
+    assert models.async_get_domain("LIFX Z") == "lifx"
+    assert models.async_get_domain("LIFX-bulb") == "lifx"
+    assert models.async_get_domain("tado Internet Bridge") == "tado"
+    assert models.async_get_domain("Rachio") == "rachio"
+    assert models.async_get_domain("Rachio3") is None
+    assert models.async_get_domain.cache_info().currsize == 5
@@ -16,7 +16,7 @@ from homeassistant.const import (
     SUN_EVENT_SUNSET,
 )
 from homeassistant.exceptions import ConditionError, HomeAssistantError
-from homeassistant.helpers import condition, trace
+from homeassistant.helpers import condition, config_validation as cv, trace
 from homeassistant.helpers.template import Template
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -2863,3 +2863,146 @@ async def test_platform_async_validate_condition_config(hass):
         platform.async_validate_condition_config.return_value = config
         await condition.async_validate_condition_config(hass, config)
         platform.async_validate_condition_config.assert_awaited()
+
+
+@pytest.fixture
+def trace_off():
+    """Disable tracing."""
+    token = trace.trace_capture_cv.set(trace.TRACE_CAPTURE_OFF)
+    yield
+    trace.trace_capture_cv.reset(token)
+
+
+async def test_compiled_condition(hass):
+    """Test compiled conditions give the results of the traced conditions."""
+    config = cv.CONDITION_SCHEMA(
+        {
+            "condition": "or",
+            "conditions": [
+                {
+                    "condition": "and",
+                    "conditions": [
+                        {
+                            "condition": "template",
+                            "value_template": "{{ is_state('light.kitchen', 'on') }}",
+                        },
+                        {
+                            "condition": "and",
+                            "conditions": [
+                                {
+                                    "condition": "numeric_state",
+                                    "entity_id": "sensor.temperature",
+                                    "above": "input_number.low",
+                                    "below": 30,
+                                },
+                                {
+                                    "condition": "state",
+                                    "entity_id": "binary_sensor.motion",
+                                    "state": ["on", "input_select.mode"],
+                                },
+                            ],
+                        },
+                    ],
+                },
+                {
+                    "condition": "not",
+                    "conditions": [
+                        {
+                            "condition": "or",
+                            "conditions": [
+                                {
+                                    "condition": "state",
+                                    "entity_id": "light.kitchen",
+                                    "state": "on",
+                                },
+                                {
+                                    "condition": "numeric_state",
+                                    "entity_id": "sensor.temperature",
+                                    "value_template": "{{ state.state | float * 2 }}",
+                                    "below": 10,
+                                },
+                            ],
+                        }
+                    ],
+                },
+            ],
+        }
+    )
+    traced = await condition.async_from_config(hass, config, False)
+    compiled = await condition.async_compile(hass, config)
+
+    hass.states.async_set("input_number.low", "10")
+    hass.states.async_set("input_select.mode", "away")
+    for light in ("on", "off"):
+        for temperature in ("2", "20", "40", "unknown"):
+            for motion in ("on", "off", "away"):
+                hass.states.async_set("light.kitchen", light)
+                hass.states.async_set("sensor.temperature", temperature)
+                hass.states.async_set("binary_sensor.motion", motion)
+                assert compiled(hass, {}) == traced(hass, {})
+
+
+async def test_compiled_condition_errors(hass, trace_off):
+    """Test errors of compiled conditions are raised in full."""
+    config = cv.CONDITION_SCHEMA(
+        {
+            "condition": "and",
+            "conditions": [
+                {
+                    "condition": "state",
+                    "entity_id": "sensor.missing",
+                    "state": "on",
+                },
+                {
+                    "condition": "state",
+                    "entity_id": "light.kitchen",
+                    "state": "on",
+                },
+            ],
+        }
+    )
+    test = await condition.async_from_config(hass, config, False)
+
+    hass.states.async_set("light.kitchen", "off")
+    assert not test(hass)
+    # Compile the condition
+    await hass.async_block_till_done()
+    assert not test(hass)
+
+    hass.states.async_set("light.kitchen", "on")
+    with pytest.raises(ConditionError, match="In 'and' \\(item 1 of 2\\)"):
+        test(hass)
+
+    # No trace is recorded while tracing is disabled
+    assert trace.trace_get(clear=False) == {}
+
+
+async def test_condition_compiled_lazily(hass):
+    """Test conditions are compiled the first time they are tested untraced."""
+    config = cv.CONDITION_SCHEMA(
+        {"condition": "state", "entity_id": "light.kitchen", "state": "on"}
+    )
+    hass.states.async_set("light.kitchen", "on")
+
+    with patch(
+        "homeassistant.helpers.condition.async_compile",
+        wraps=condition.async_compile,
+    ) as mock_compile:
+        test = await condition.async_from_config(hass, config, False)
+        assert test(hass)
+        await hass.async_block_till_done()
+        assert not mock_compile.called
+
+        token = trace.trace_capture_cv.set(trace.TRACE_CAPTURE_OFF)
+        try:
+            assert test(hass)
+            assert test(hass)
+            await hass.async_block_till_done()
+            assert mock_compile.call_count == 1
+
+            hass.states.async_set("light.kitchen", "off")
+            assert not test(hass)
+        finally:
+            trace.trace_capture_cv.reset(token)
+
+    assert mock_compile.call_count == 1
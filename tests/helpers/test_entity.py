@@ -7,7 +7,14 @@ from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
-from homeassistant.const import ATTR_DEVICE_CLASS, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_UNIT_OF_MEASUREMENT,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+    TEMP_CELSIUS,
+    TEMP_FAHRENHEIT,
+)
 from homeassistant.core import Context, HomeAssistantError
 from homeassistant.helpers import entity, entity_registry
 
@@ -788,3 +795,64 @@ async def test_float_conversion(hass):
     state = hass.states.get("hello.world")
     assert state is not None
     assert state.state == "3.6"
+
+
+async def test_attributes_fingerprint(hass):
+    """Test attributes are reused while the fingerprint is unchanged."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+    fingerprint = 1
+    attributes = {"level": 1}
+
+    with patch.object(
+        entity.Entity,
+        "attributes_fingerprint",
+        PropertyMock(side_effect=lambda: fingerprint),
+    ), patch.object(
+        entity.Entity,
+        "extra_state_attributes",
+        PropertyMock(side_effect=lambda: attributes),
+    ) as mock_attributes:
+        ent.async_write_ha_state()
+        state = hass.states.get("hello.world")
+        assert state.attributes == {"level": 1}
+        assert mock_attributes.call_count == 1
+
+        # Attributes are not rebuilt and the write is suppressed
+        attributes = {"level": 2}
+        ent.async_write_ha_state()
+        assert mock_attributes.call_count == 1
+        assert hass.states.get("hello.world") is state
+
+        fingerprint = 2
+        ent.async_write_ha_state()
+        assert mock_attributes.call_count == 2
+        assert hass.states.get("hello.world").attributes == {"level": 2}
+
+    assert hass.states.async_write_statistics()["hello"] == {
+        "written": 2,
+        "suppressed": 1,
+    }
+
+
+async def test_attributes_fingerprint_temperature_conversion(hass):
+    """Test attributes of converted temperatures are rebuilt on every write."""
+    ent = entity.Entity()
+    ent.hass = hass
+    ent.entity_id = "sensor.temperature"
+
+    with patch.object(
+        entity.Entity, "attributes_fingerprint", PropertyMock(return_value=1)
+    ), patch.object(
+        entity.Entity, "unit_of_measurement", PropertyMock(return_value=TEMP_FAHRENHEIT)
+    ), patch.object(
+        entity.Entity, "state", PropertyMock(side_effect=["212", "32"])
+    ):
+        ent.async_write_ha_state()
+        assert hass.states.get("sensor.temperature").state == "100"
+        ent.async_write_ha_state()
+
+    state = hass.states.get("sensor.temperature")
+    assert state.state == "0"
+    assert state.attributes[ATTR_UNIT_OF_MEASUREMENT] == TEMP_CELSIUS
@@ -150,7 +150,7 @@ async def test_update_state_adds_entities_with_update_before_add_false(hass):
     assert not ent.update.called
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
+@patch("homeassistant.helpers.polling.async_track_polling_interval")
 async def test_set_scan_interval_via_platform(mock_track, hass):
     """Test the setting of the scan interval via platform."""
 
@@ -390,6 +390,27 @@ async def test_async_remove_with_platform(hass):
     assert len(hass.states.async_entity_ids()) == 0
 
 
+async def test_domain_entities_index(hass):
+    """Test the domain entity indexes follow added and removed entities."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    entity1 = MockEntity(name="test_1")
+    entity2 = MockEntity(name="test_2")
+    await component.async_add_entities([entity1, entity2])
+
+    platform = entity1.platform
+    assert platform.domain_entities == {
+        entity1.entity_id: entity1,
+        entity2.entity_id: entity2,
+    }
+    assert platform.domain_platform_entities == platform.domain_entities
+    assert component.get_entity(entity1.entity_id) is entity1
+
+    await entity1.async_remove()
+    assert platform.domain_entities == {entity2.entity_id: entity2}
+    assert platform.domain_platform_entities == {entity2.entity_id: entity2}
+    assert component.get_entity(entity1.entity_id) is None
+
+
 async def test_not_adding_duplicate_entities_with_unique_id(hass, caplog):
     """Test for not adding duplicate entities."""
     caplog.set_level(logging.ERROR)
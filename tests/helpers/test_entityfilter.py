@@ -54,6 +54,21 @@ def test_includes_only_with_glob_case_2():
     assert testfilter("cover.garage_door") is False
 
 
+def test_many_globs_cached_case_2():
+    """Test many globs are combined and results are cached per entity id."""
+    incl_glob = {f"sensor.*_{idx}" for idx in range(200)}
+    testfilter = generate_filter([], [], [], [], incl_glob, [])
+
+    assert testfilter("sensor.kitchen_199")
+    assert testfilter("sensor.kitchen_199")
+    assert testfilter("sensor.kitchen_200") is False
+    assert testfilter("light.kitchen_1") is False
+
+    cache_info = testfilter.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.currsize == 3
+
+
 def test_excludes_only_case_3():
     """If exclude specified, pass all but specified (Case 3)."""
     incl_dom = {}
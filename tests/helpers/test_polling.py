@@ -0,0 +1,195 @@
+"""Tests for the polling scheduler helper."""
+import asyncio
+from datetime import timedelta
+import logging
+from unittest.mock import Mock, patch
+
+from homeassistant.helpers import polling
+from homeassistant.helpers.entity_component import EntityComponent
+import homeassistant.util.dt as dt_util
+
+from tests.common import MockEntity, async_fire_time_changed
+
+_LOGGER = logging.getLogger(__name__)
+DOMAIN = "test_domain"
+
+
+async def test_polling_spreads_batches(hass):
+    """Test polling entities are updated in batches over the interval."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    entities = [MockEntity(should_poll=True) for _ in range(25)]
+    for entity in entities:
+        entity.async_update = Mock()
+
+    with patch.object(polling, "POLL_BATCH_SIZE", 10):
+        await component.async_add_entities(entities)
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+        await hass.async_block_till_done()
+
+        assert sum(entity.async_update.called for entity in entities) == 10
+
+        # Batches are spread over the first half of the interval
+        start = dt_util.utcnow()
+        async_fire_time_changed(hass, start + timedelta(seconds=4))
+        await hass.async_block_till_done()
+
+        assert sum(entity.async_update.called for entity in entities) == 20
+
+        async_fire_time_changed(hass, start + timedelta(seconds=7))
+        await hass.async_block_till_done()
+
+        assert all(entity.async_update.called for entity in entities)
+
+    statistics = entities[0].platform.poll_statistics
+    assert statistics.cycles == 1
+    assert statistics.updates == 25
+    assert statistics.as_dict()["last_cycle_duration"] is not None
+
+
+async def test_polling_backs_off_failing_entities(hass):
+    """Test entities whose updates keep failing are skipped."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    failing = MockEntity(should_poll=True)
+    failing.async_update = Mock(side_effect=ValueError("Fake error"))
+    working = MockEntity(should_poll=True)
+    working.async_update = Mock()
+
+    await component.async_add_entities([failing, working])
+
+    now = dt_util.utcnow()
+    for _ in range(polling.BACKOFF_AFTER_FAILURES + 1):
+        now += timedelta(seconds=20)
+        async_fire_time_changed(hass, now)
+        await hass.async_block_till_done()
+
+    # The failing entity is skipped for a cycle after the third failure
+    assert failing.async_update.call_count == polling.BACKOFF_AFTER_FAILURES
+    assert working.async_update.call_count == polling.BACKOFF_AFTER_FAILURES + 1
+
+    statistics = failing.platform.poll_statistics
+    assert statistics.failures == polling.BACKOFF_AFTER_FAILURES
+    assert statistics.skipped == 1
+
+    # The failing entity is polled again after the back off
+    now += timedelta(seconds=20)
+    async_fire_time_changed(hass, now)
+    await hass.async_block_till_done()
+
+    assert failing.async_update.call_count == polling.BACKOFF_AFTER_FAILURES + 1
+
+
+async def test_polling_counts_overruns(hass, caplog):
+    """Test a cycle is dropped when the previous one is still running."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    event = asyncio.Event()
+
+    async def slow_update():
+        await event.wait()
+
+    entity = MockEntity(should_poll=True)
+    entity.async_update = slow_update
+
+    await component.async_add_entities([entity])
+
+    now = dt_util.utcnow()
+    async_fire_time_changed(hass, now + timedelta(seconds=20))
+    await asyncio.sleep(0)
+    async_fire_time_changed(hass, now + timedelta(seconds=40))
+    await asyncio.sleep(0)
+
+    event.set()
+    await hass.async_block_till_done()
+
+    assert entity.platform.poll_statistics.overruns == 1
+    assert "took longer than the scheduled update interval" in caplog.text
+
+
+async def test_polling_latency_excludes_parallel_updates_wait(hass):
+    """Test waiting for other entities to update does not count as latency."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    entity = MockEntity(should_poll=True)
+    entity.async_update = Mock()
+    await component.async_add_entities([entity])
+
+    entity.parallel_updates = asyncio.Semaphore(1)
+    await entity.parallel_updates.acquire()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await asyncio.sleep(0)
+    assert not entity.async_update.called
+
+    with patch(
+        "homeassistant.helpers.entity.timer", side_effect=[100.0, 100.5, 0.0, 0.0]
+    ):
+        entity.parallel_updates.release()
+        await hass.async_block_till_done()
+
+    assert entity.async_update.called
+    assert list(entity.platform.poll_statistics.latencies) == [0.5]
+
+
+async def test_platform_start_offsets(hass):
+    """Test platforms start polling at different offsets in the interval."""
+    scheduler = polling.async_get_scheduler(hass)
+    interval = timedelta(seconds=100)
+
+    offsets = [scheduler.async_next_start_offset(interval) for _ in range(4)]
+
+    assert offsets[0] == interval
+    assert all(timedelta(0) < offset <= interval for offset in offsets)
+    assert len({round(offset.total_seconds()) for offset in offsets}) == 4
+
+
+async def test_platforms_poll_at_offsets(hass):
+    """Test a second platform polls before its first full interval."""
+    first = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    second = EntityComponent(_LOGGER, "other_domain", hass, timedelta(seconds=20))
+
+    first_entity = MockEntity(should_poll=True)
+    first_entity.async_update = Mock()
+    second_entity = MockEntity(should_poll=True)
+    second_entity.async_update = Mock()
+
+    await first.async_add_entities([first_entity])
+    await second.async_add_entities([second_entity])
+
+    now = dt_util.utcnow()
+    async_fire_time_changed(hass, now + timedelta(seconds=10))
+    await hass.async_block_till_done()
+
+    assert not first_entity.async_update.called
+    assert second_entity.async_update.call_count == 1
+
+    async_fire_time_changed(hass, now + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    assert first_entity.async_update.call_count == 1
+    assert second_entity.async_update.call_count == 1
+
+
+async def test_scheduler_statistics(hass):
+    """Test the scheduler reports the statistics of all polling platforms."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    entity = MockEntity(should_poll=True)
+    entity.async_update = Mock()
+    await component.async_add_entities([entity])
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    statistics = polling.async_get_scheduler(hass).async_get_statistics()
+    assert len(statistics) == 1
+    assert statistics[0]["domain"] == DOMAIN
+    assert statistics[0]["scan_interval"] == 20
+    assert statistics[0]["cycles"] == 1
+    assert statistics[0]["updates"] == 1
+    assert statistics[0]["latency_p50"] is not None
+
+    await entity.platform.async_reset()
+    assert polling.async_get_scheduler(hass).async_get_statistics() == []
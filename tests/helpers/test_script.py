@@ -258,6 +258,57 @@ async def test_calling_service_basic(hass, caplog):
     )
 
 
+async def test_calling_static_service_validated_once(hass):
+    """Test the data of a service call without templates is validated once."""
+    schema = mock.Mock(side_effect=dict)
+    calls = async_mock_service(hass, "test", "script", schema)
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"service": "test.script", "data": {"hello": "world"}},
+            {"service": "test.script", "data": {"hello": "{{ name }}"}},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    for name in ("first", "second", "third"):
+        await script_obj.async_run({"name": name}, context=Context())
+    await hass.async_block_till_done()
+
+    assert schema.call_count == 4
+    assert [call.data["hello"] for call in calls] == [
+        "world",
+        "first",
+        "world",
+        "second",
+        "world",
+        "third",
+    ]
+    # The prepared data is not shared between the calls
+    assert calls[0].data is not calls[2].data
+
+    statistics = script_obj.get_run_statistics()
+    assert statistics["runs"] == 3
+    assert statistics["running"] == 0
+    assert statistics["run_time_max"] >= statistics["run_time_last"] > 0
+    assert script.async_get_run_statistics(hass) == [statistics]
+
+
+async def test_wait_free_script_runs_in_caller_task(hass):
+    """Test a script without waits runs in the task of its caller."""
+    tasks = []
+    sequence = cv.SCRIPT_SCHEMA({"event": "test_event"})
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    with patch.object(
+        hass.bus,
+        "async_fire",
+        side_effect=lambda *args, **kwargs: tasks.append(asyncio.current_task()),
+    ):
+        await script_obj.async_run(context=Context())
+
+    assert tasks == [asyncio.current_task()]
+
+
 async def test_calling_service_template(hass):
     """Test the calling of a service."""
     context = Context()
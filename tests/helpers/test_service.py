@@ -351,6 +351,81 @@ class TestServiceHelpers(unittest.TestCase):
         assert mock_log.call_count == 3
 
 
+@pytest.mark.parametrize(
+    "config, static",
+    [
+        (
+            {
+                "service": "test_domain.test_service",
+                "entity_id": "hello.world",
+                "data": {"hello": "world", "list": ["1", "2"]},
+                "target": {"area_id": "test-area-id"},
+            },
+            True,
+        ),
+        (
+            {
+                "service": "{{ 'test_domain.test_service' }}",
+                "data": {"hello": "{{ name }}", "effect": {"simple": "simple"}},
+                "data_template": {"list": ["{{ name }}", "2"], "hello": "override"},
+                "target": {"entity_id": ["light.static", "{{ entity }}"]},
+            },
+            False,
+        ),
+        (
+            {
+                "service": "test_domain.test_service",
+                "data": {"hello": "{{ name }}"},
+                "target": "{{ {'entity_id': entity} }}",
+            },
+            False,
+        ),
+    ],
+)
+async def test_compiled_service_call(hass, config, static):
+    """Test a compiled service call prepares the same call as its config."""
+    config = cv.SERVICE_SCHEMA(config)
+    compiled = service.CompiledServiceCall(hass, config)
+    assert compiled.static is static
+    assert (compiled.schema_cache is not None) is static
+
+    for name, entity in (("first", "light.first"), ("second", "light.second")):
+        variables = {"name": name, "entity": entity}
+        params = compiled.async_prepare(variables)
+        assert params == service.async_prepare_call_from_config(hass, config, variables)
+        # Each call gets its own data
+        assert (
+            params["service_data"]
+            is not compiled.async_prepare(variables)["service_data"]
+        )
+
+
+async def test_compiled_service_call_copies_static_data(hass):
+    """Test changing the data of a compiled call does not change later calls."""
+    config = cv.SERVICE_SCHEMA(
+        {
+            "service": "test_domain.test_service",
+            "data": {"rgb_color": [255, 0, 0]},
+            "target": {"entity_id": ["light.kitchen"]},
+        }
+    )
+    compiled = service.CompiledServiceCall(hass, config)
+
+    params = compiled.async_prepare()
+    params["service_data"]["rgb_color"][0] = 0
+    params["target"]["entity_id"].append("light.added")
+
+    params = compiled.async_prepare()
+    assert params["service_data"] == {"rgb_color": [255, 0, 0]}
+    assert params["target"] == {"entity_id": ["light.kitchen"]}
+
+
+async def test_compiled_service_call_invalid(hass):
+    """Test compiling an invalid service call config."""
+    with pytest.raises(exceptions.HomeAssistantError):
+        service.CompiledServiceCall(hass, {"service": "invalid"}, True)
+
+
 async def test_extract_entity_ids(hass):
     """Test extract_entity_ids method."""
     hass.states.async_set("light.Bowl", STATE_ON)
@@ -682,6 +757,49 @@ async def test_call_no_context_target_specific(
     assert mock_handle_entity_call.mock_calls[0][1][1].entity_id == "light.kitchen"
 
 
+async def test_call_with_registered_entities(
+    hass, mock_handle_entity_call, mock_entities
+):
+    """Check we can target entities from a registered entities index."""
+    await service.entity_service_call(
+        hass,
+        mock_entities,
+        Mock(),
+        ha.ServiceCall(
+            "test_domain",
+            "test_service",
+            {"entity_id": ["light.kitchen", "light.non-existing"]},
+        ),
+    )
+
+    assert len(mock_handle_entity_call.mock_calls) == 1
+    assert mock_handle_entity_call.mock_calls[0][1][1].entity_id == "light.kitchen"
+
+
+async def test_call_with_registered_entities_no_auth(
+    hass, mock_handle_entity_call, mock_entities
+):
+    """Check permissions are checked for a registered entities index."""
+    with pytest.raises(exceptions.Unauthorized) as err, patch(
+        "homeassistant.auth.AuthManager.async_get_user",
+        return_value=Mock(permissions=PolicyPermissions({}, None)),
+    ):
+        await service.entity_service_call(
+            hass,
+            mock_entities,
+            Mock(),
+            ha.ServiceCall(
+                "test_domain",
+                "test_service",
+                {"entity_id": "light.kitchen"},
+                context=ha.Context(user_id="mock-id"),
+            ),
+        )
+
+    assert err.value.entity_id == "light.kitchen"
+    assert len(mock_handle_entity_call.mock_calls) == 0
+
+
 async def test_call_with_match_all(
     hass, mock_handle_entity_call, mock_entities, caplog
 ):
@@ -1,10 +1,15 @@
 """Test significant change helper."""
+from datetime import timedelta
+
 import pytest
 
 from homeassistant.components.sensor import DEVICE_CLASS_BATTERY
 from homeassistant.const import ATTR_DEVICE_CLASS, STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import State
 from homeassistant.helpers import significant_change
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed
 
 
 @pytest.fixture(name="checker")
@@ -72,3 +77,80 @@ async def test_significant_change_extra(hass, checker):
         State(ent_id, "200", attrs), extra_arg=1
     )
     assert checker.async_is_significant_change(State(ent_id, "200", attrs), extra_arg=2)
+
+
+async def test_state_write_filter_deadband(hass):
+    """Test numeric states within the deadband are held back."""
+    state_filter = significant_change.StateWriteFilter(
+        hass,
+        "sensor.power",
+        {"absolute_change": 5, "max_silence": timedelta(seconds=60)},
+    )
+    attrs = {"unit_of_measurement": "W"}
+
+    assert state_filter.async_filter_write("100", attrs, False, None)
+    assert not state_filter.async_filter_write("103", attrs, False, None)
+    assert not state_filter.async_filter_write("97", attrs, False, None)
+    assert state_filter.async_filter_write("106", attrs, False, None)
+    assert state_filter.suppressed == 2
+    assert state_filter.written == 2
+
+    # Attribute and availability changes are always significant
+    assert state_filter.async_filter_write("107", {}, False, None)
+    assert state_filter.async_filter_write(STATE_UNAVAILABLE, {}, False, None)
+    assert state_filter.async_filter_write("107", {}, False, None)
+
+
+async def test_state_write_filter_writes_latest_after_max_silence(hass):
+    """Test the latest held back state is written after the maximum silence."""
+    state_filter = significant_change.StateWriteFilter(
+        hass,
+        "sensor.power",
+        {"percentage_change": 10, "max_silence": timedelta(seconds=60)},
+    )
+
+    assert state_filter.async_filter_write("100", {}, False, None)
+    hass.states.async_set("sensor.power", "100")
+    assert not state_filter.async_filter_write("101", {}, False, None)
+    assert not state_filter.async_filter_write("102", {}, False, None)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.power").state == "102"
+    assert state_filter.written == 2
+
+
+async def test_state_write_filter_min_interval(hass):
+    """Test significant states are deferred until the minimum interval passed."""
+    state_filter = significant_change.StateWriteFilter(
+        hass, "sensor.power", {"min_interval": timedelta(seconds=10)}
+    )
+
+    assert state_filter.async_filter_write("100", {}, False, None)
+    assert not state_filter.async_filter_write("200", {}, False, None)
+    assert not state_filter.async_filter_write("300", {}, False, None)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.power").state == "300"
+
+    state_filter.async_filter_write("400", {}, False, None)
+    state_filter.async_cancel()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.power").state == "300"
+
+
+async def test_state_write_filter_uses_platform(hass, checker):
+    """Test non numeric filters consult the significant change platform."""
+    state_filter = significant_change.StateWriteFilter(
+        hass, "test_domain.test_entity", {}
+    )
+
+    assert state_filter.async_filter_write("100", {}, False, None)
+    assert not state_filter.async_filter_write("97", {}, False, None)
+    assert state_filter.async_filter_write("95", {}, False, None)
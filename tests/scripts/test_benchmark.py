@@ -0,0 +1,90 @@
+"""Test the benchmark script."""
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.scripts import benchmark
+from homeassistant.util.json import load_json, save_json
+
+
+@pytest.fixture
+def restore_log_levels():
+    """Restore the log levels the benchmark script changes."""
+    loggers = [
+        logging.getLogger("homeassistant.core"),
+        logging.getLogger("homeassistant.helpers"),
+    ]
+    levels = [logger.level for logger in loggers]
+    yield
+    for logger, level in zip(loggers, levels):
+        logger.setLevel(level)
+
+
+def test_results_as_dict():
+    """Test the runtimes of the benchmarks are summarized."""
+    results = benchmark.results_as_dict({"fast": [3.0, 1.0, 2.0], "skipped": []})
+
+    assert results["benchmarks"] == {
+        "fast": {"runs": [3.0, 1.0, 2.0], "min": 1.0, "median": 2.0}
+    }
+    assert "version" in results
+    assert "python" in results
+
+
+def test_compare_results(tmp_path, capsys):
+    """Test comparing two runs reports regressions above the threshold."""
+    baseline = tmp_path / "baseline.json"
+    results = tmp_path / "results.json"
+    save_json(
+        str(baseline),
+        benchmark.results_as_dict({"same": [1.0], "slower": [1.0], "removed": [1.0]}),
+    )
+    save_json(
+        str(results),
+        benchmark.results_as_dict({"same": [1.05], "slower": [1.5], "added": [1.0]}),
+    )
+
+    assert benchmark.compare_results(str(baseline), str(results), 0.1) == 1
+
+    captured = capsys.readouterr()
+    assert "same: 1.0000s -> 1.0500s (+5.0%)\n" in captured.out
+    assert "slower: 1.0000s -> 1.5000s (+50.0%)  REGRESSION" in captured.out
+    assert "added: 1.0000s (new)" in captured.out
+    assert "removed: missing from" in captured.out
+
+    assert benchmark.compare_results(str(baseline), str(results), 0.6) == 0
+
+
+def test_run_writes_results(tmp_path, restore_log_levels):
+    """Test running a benchmark writes its results as JSON."""
+    output = tmp_path / "results.json"
+
+    assert (
+        benchmark.run(["valid_entity_id", "--runs", "2", "--output", str(output)]) == 0
+    )
+
+    results = load_json(str(output))
+    assert len(results["benchmarks"]["valid_entity_id"]["runs"]) == 2
+
+
+def test_run_returns_error_when_benchmark_fails(restore_log_levels):
+    """Test running a benchmark that raises returns a non-zero exit code."""
+
+    async def failing(hass):
+        """Fail the benchmark."""
+        raise ValueError("Fake error")
+
+    with patch.dict(benchmark.BENCHMARKS, {"failing": failing}):
+        assert benchmark.run(["failing", "--runs", "1"]) == 1
+
+
+def test_compare_invalid_results(tmp_path, capsys):
+    """Test comparing files without benchmark results fails."""
+    results = tmp_path / "results.json"
+    save_json(str(results), benchmark.results_as_dict({"same": [1.0]}))
+    invalid = tmp_path / "invalid.json"
+    save_json(str(invalid), [])
+
+    assert benchmark.compare_results(str(invalid), str(results), 0.1) == 1
+    assert "does not contain benchmark results" in capsys.readouterr().out
@@ -121,6 +121,20 @@ async def test_setting_up_config(hass):
     assert "group" in hass.config.components
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_startup_report_saved(hass, hass_storage):
+    """Test the setup and import times are stored after startup."""
+    mock_integration(hass, MockModule(domain="root"))
+
+    await bootstrap._async_set_up_integrations(hass, {"root": {}})
+    await hass.async_block_till_done()
+
+    report = hass_storage[bootstrap.STARTUP_REPORT_STORAGE_KEY]["data"]
+    assert report["total_time"] > 0
+    assert "root" in report["setup_times"]
+    assert isinstance(report["import_times"], dict)
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_all_present(hass):
     """Test after_dependencies when all present."""
@@ -3,6 +3,7 @@
 from collections import OrderedDict
 import copy
 import os
+import threading
 from unittest import mock
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -18,9 +19,14 @@ from homeassistant.const import (
     CONF_AUTH_MFA_MODULES,
     CONF_AUTH_PROVIDERS,
     CONF_CUSTOMIZE,
+    CONF_EXECUTOR_POOLS,
+    CONF_INTEGRATIONS,
     CONF_LATITUDE,
     CONF_LONGITUDE,
+    CONF_MAX_WORKERS,
     CONF_NAME,
+    CONF_STATE_FILTER_DOMAIN,
+    CONF_STATE_FILTER_GLOB,
     CONF_TEMPERATURE_UNIT,
     CONF_UNIT_SYSTEM,
     CONF_UNIT_SYSTEM_IMPERIAL,
@@ -274,6 +280,76 @@ async def test_entity_customization(hass):
     assert state.attributes["hidden"]
 
 
+async def test_entity_state_filter(hass):
+    """Test state write filters through configuration."""
+    config = {
+        CONF_LATITUDE: 50,
+        CONF_LONGITUDE: 50,
+        CONF_NAME: "Test",
+        CONF_STATE_FILTER_DOMAIN: {"test": {"absolute_change": 5}},
+        CONF_STATE_FILTER_GLOB: {"other.*": {"min_interval": 10}},
+    }
+    await config_util.async_process_ha_core_config(hass, config)
+
+    entity = Entity()
+    entity.entity_id = "test.test"
+    entity.hass = hass
+
+    with patch.object(Entity, "state", "100"):
+        entity.async_write_ha_state()
+    with patch.object(Entity, "state", "102"):
+        entity.async_write_ha_state()
+
+    assert hass.states.get("test.test").state == "100"
+
+    await config_util.async_process_ha_core_config(hass, {})
+    assert config_util.DATA_STATE_FILTER not in hass.data
+
+    with patch.object(Entity, "state", "102"):
+        entity.async_write_ha_state()
+
+    assert hass.states.get("test.test").state == "102"
+
+
+async def test_executor_pools(hass):
+    """Test integrations are assigned to executor pools through configuration."""
+    config = {
+        CONF_EXECUTOR_POOLS: {
+            "db": {CONF_MAX_WORKERS: 2, CONF_INTEGRATIONS: ["recorder", "history"]}
+        }
+    }
+    await config_util.async_process_ha_core_config(hass, config)
+
+    def job():
+        return threading.current_thread().name
+
+    job.__module__ = "homeassistant.components.recorder.util"
+    assert (await hass.async_add_executor_job(job)).startswith("SyncWorker_db_")
+
+    job.__module__ = "homeassistant.components.light"
+    assert not (await hass.async_add_executor_job(job)).startswith("SyncWorker_db_")
+
+    await config_util.async_process_ha_core_config(hass, {})
+    await hass.async_block_till_done()
+    assert hass.executor_pools.pools == {}
+
+    job.__module__ = "homeassistant.components.recorder.util"
+    assert not (await hass.async_add_executor_job(job)).startswith("SyncWorker_db_")
+
+
+def test_executor_pools_integration_assigned_once():
+    """Test an integration can not be assigned to two executor pools."""
+    with pytest.raises(vol.Invalid):
+        config_util.CORE_CONFIG_SCHEMA(
+            {
+                CONF_EXECUTOR_POOLS: {
+                    "io": {CONF_MAX_WORKERS: 2, CONF_INTEGRATIONS: ["hue"]},
+                    "cpu": {CONF_MAX_WORKERS: 2, CONF_INTEGRATIONS: "hue"},
+                }
+            }
+        )
+
+
 @patch("homeassistant.config.shutil")
 @patch("homeassistant.config.os")
 @patch("homeassistant.config.is_docker_env", return_value=False)
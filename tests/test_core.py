@@ -279,6 +279,23 @@ async def test_async_add_job_pending_tasks_executor(hass):
     assert len(call_count) == 2
 
 
+async def test_async_add_process_job(hass):
+    """Test process jobs are tracked as pending tasks."""
+    call_count = []
+
+    def test_job(value):
+        """Test job."""
+        call_count.append(value)
+        return value * 2
+
+    task = hass.async_add_process_job(test_job, 21)
+
+    assert len(hass._pending_tasks) == 1
+    await hass.async_block_till_done()
+    assert call_count == [21]
+    assert await task == 42
+
+
 async def test_async_add_job_pending_tasks_callback(hass):
     """Run a callback in pending tasks."""
     call_count = []
@@ -728,6 +745,24 @@ async def test_statemachine_force_update(hass):
     assert len(events) == 1
 
 
+async def test_statemachine_write_statistics(hass):
+    """Test written and suppressed state writes are counted per domain."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+
+    # Passing back the attributes of the current state is a duplicate write
+    hass.states.async_set("light.bowl", "on", state.attributes)
+    assert hass.states.get("light.bowl") is state
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("light.bowl", "on", {"brightness": 50})
+    hass.states.async_set("switch.kitchen", "off")
+
+    assert hass.states.async_write_statistics() == {
+        "light": {"written": 2, "suppressed": 2},
+        "switch": {"written": 1, "suppressed": 0},
+    }
+
+
 def test_service_call_repr():
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -823,6 +858,76 @@ async def test_serviceregistry_callback_service(hass):
     assert len(calls) == 1
 
 
+async def test_serviceregistry_schema_cache(hass):
+    """Test the validated data of a call is reused until the schema changes."""
+    calls = []
+
+    @ha.callback
+    def service_handler(call):
+        """Service handler callback."""
+        calls.append(call)
+
+    schema = MagicMock(side_effect=lambda data: {**data, "validated": True})
+    hass.services.async_register(
+        "test_domain", "register_calls", service_handler, schema
+    )
+    cache = ha.ServiceSchemaCache()
+
+    for _ in range(3):
+        assert await hass.services.async_call(
+            "test_domain",
+            "register_calls",
+            {"hello": "world"},
+            blocking=True,
+            schema_cache=cache,
+        )
+    assert schema.call_count == 1
+    assert [dict(call.data) for call in calls] == [
+        {"hello": "world", "validated": True}
+    ] * 3
+
+    hass.services.async_register(
+        "test_domain", "register_calls", service_handler, MagicMock()
+    )
+    assert await hass.services.async_call(
+        "test_domain",
+        "register_calls",
+        {"hello": "world"},
+        blocking=True,
+        schema_cache=cache,
+    )
+    assert cache.schema is not schema
+
+
+async def test_serviceregistry_schema_cache_copies_data(hass):
+    """Test handlers changing cached data do not change the data of later calls."""
+    calls = []
+
+    @ha.callback
+    def service_handler(call):
+        """Service handler callback changing the nested data."""
+        calls.append(call)
+        call.data["entity_id"].append("light.added")
+        call.data["data"]["changed"] = True
+
+    hass.services.async_register(
+        "test_domain", "register_calls", service_handler, lambda data: data
+    )
+    cache = ha.ServiceSchemaCache()
+
+    for _ in range(2):
+        assert await hass.services.async_call(
+            "test_domain",
+            "register_calls",
+            {"entity_id": ["light.kitchen"], "data": {"hello": "world"}},
+            blocking=True,
+            schema_cache=cache,
+        )
+    assert cache.data == {"entity_id": ["light.kitchen"], "data": {"hello": "world"}}
+    assert calls[1].data["entity_id"] == ["light.kitchen", "light.added"]
+    assert calls[1].data["data"] == {"hello": "world", "changed": True}
+
+
 async def test_serviceregistry_remove_service(hass):
     """Test remove service."""
     calls_remove = async_capture_events(hass, EVENT_SERVICE_REMOVED)
@@ -1,4 +1,6 @@
 """Test to verify that we can load components."""
+import pathlib
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -6,6 +8,7 @@ import pytest
 from homeassistant import core, loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, __version__
 
 from tests.common import MockModule, async_mock_service, mock_integration
 
@@ -167,6 +170,27 @@ async def test_get_integration_legacy(hass, enable_custom_integrations):
     assert integration.get_platform("switch") is not None
 
 
+async def test_platform_exists(hass, enable_custom_integrations):
+    """Test checking for a platform without importing it."""
+    integration = await loader.async_get_integration(hass, "test_embedded")
+    assert await integration.async_platform_exists("switch") is True
+    assert await integration.async_platform_exists("light") is False
+
+    mocked = mock_integration(hass, MockModule("mocked"))
+    assert await mocked.async_platform_exists("light") is None
+
+
+async def test_import_times_recorded(hass, enable_custom_integrations):
+    """Test the time it takes to import an integration is recorded."""
+    integration = await loader.async_get_integration(hass, "test_embedded")
+
+    with patch.dict(sys.modules):
+        sys.modules.pop("custom_components.test_embedded", None)
+        integration.get_component()
+
+    assert "custom_components.test_embedded" in hass.data[loader.DATA_IMPORT_TIMES]
+
+
 async def test_get_integration_custom_component(hass, enable_custom_integrations):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_package")
@@ -518,6 +542,75 @@ async def test_get_mqtt(hass):
         assert mqtt["test_2"] == ["test_2/discovery"]
 
 
+async def test_manifest_index(hass, hass_storage, enable_custom_integrations):
+    """Test manifests are stored in an index and read from it on the next run."""
+
+    async def restart():
+        hass.data.pop(loader.DATA_INTEGRATIONS, None)
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+        await loader.async_load_manifest_index(hass)
+
+    def read_domains(mock_read):
+        return {call[0][0].parent.name for call in mock_read.call_args_list}
+
+    await loader.async_load_manifest_index(hass)
+    with patch(
+        "homeassistant.loader._read_manifest", wraps=loader._read_manifest
+    ) as mock_read:
+        await loader.async_get_integration(hass, "http")
+        await loader.async_get_integration(hass, "test_package")
+
+    assert {"http", "test_package"} <= read_domains(mock_read)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    assert (
+        hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]["core_version"]
+        == __version__
+    )
+
+    await restart()
+    with patch(
+        "homeassistant.loader._read_manifest", wraps=loader._read_manifest
+    ) as mock_read:
+        http_integration = await loader.async_get_integration(hass, "http")
+        package_integration = await loader.async_get_integration(hass, "test_package")
+
+    assert http_integration.name == "HTTP"
+    assert package_integration.name == "Test Package"
+    assert not {"http", "test_package"} & read_domains(mock_read)
+
+    # The index of another version is not used
+    hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]["core_version"] = "0.1"
+    await restart()
+    with patch(
+        "homeassistant.loader._read_manifest", wraps=loader._read_manifest
+    ) as mock_read:
+        await loader.async_get_integration(hass, "http")
+
+    assert "http" in read_domains(mock_read)
+
+
+async def test_manifest_index_checks_built_in_in_development(hass, hass_storage):
+    """Test edited built-in manifests are read again in a development version."""
+    await loader.async_load_manifest_index(hass)
+    await loader.async_get_integration(hass, "http")
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+    manifests = hass_storage[loader.MANIFEST_INDEX_STORAGE_KEY]["data"]["manifests"]
+    manifests[str(pathlib.Path(http.__file__).parent / "manifest.json")]["mtime"] -= 1
+
+    hass.data.pop(loader.DATA_INTEGRATIONS)
+    await loader.async_load_manifest_index(hass)
+    with patch(
+        "homeassistant.loader._read_manifest", wraps=loader._read_manifest
+    ) as mock_read:
+        await loader.async_get_integration(hass, "http")
+
+    assert mock_read.call_count == 1
+
+
 async def test_get_custom_components_safe_mode(hass):
     """Test that we get empty custom components in safe mode."""
     hass.config.safe_mode = True
@@ -1,5 +1,7 @@
 """Test requirements module."""
+import asyncio
 import os
+import time
 from unittest.mock import call, patch
 
 import pytest
@@ -9,6 +11,7 @@ from homeassistant.requirements import (
     CONSTRAINT_FILE,
     RequirementsNotFound,
     async_get_integration_with_requirements,
+    async_get_timings,
     async_process_requirements,
 )
 
@@ -92,6 +95,43 @@ async def test_install_missing_package(hass):
     assert len(mock_inst.mock_calls) == 1
 
 
+async def test_install_requirements_serialized(hass):
+    """Test pip runs one install at a time and shared requirements install once."""
+    running = []
+    installed = set()
+
+    def mock_install(req, **kwargs):
+        """Track the installs that run at the same time."""
+        running.append(req)
+        assert len(running) == 1
+        time.sleep(0.01)
+        running.remove(req)
+        installed.add(req)
+        return True
+
+    with patch(
+        "homeassistant.util.package.is_installed",
+        side_effect=lambda req: req in installed,
+    ), patch(
+        "homeassistant.util.package.install_package", side_effect=mock_install
+    ) as mock_inst:
+        await asyncio.gather(
+            async_process_requirements(hass, "comp_1", ["hello==1.0.0"]),
+            async_process_requirements(hass, "comp_2", ["world==1.0.0"]),
+            async_process_requirements(hass, "comp_3", ["hello==1.0.0"]),
+        )
+
+    # The shared requirement is installed once
+    assert sorted(mock_call[1][0] for mock_call in mock_inst.mock_calls) == [
+        "hello==1.0.0",
+        "world==1.0.0",
+    ]
+
+    timings = async_get_timings(hass)
+    assert timings.checked == 3
+    assert set(timings.install_times) == {"hello==1.0.0", "world==1.0.0"}
+
+
 async def test_get_integration_with_requirements(hass):
     """Check getting an integration with loaded requirements."""
     hass.config.skip_pip = False
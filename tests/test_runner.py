@@ -67,7 +67,7 @@ def test_run_executor_shutdown_throws(hass, tmpdir):
     ), patch("homeassistant.bootstrap.async_setup_hass", return_value=hass), patch(
         "threading._shutdown"
     ), patch(
-        "homeassistant.runner.InterruptibleThreadPoolExecutor.shutdown",
+        "homeassistant.runner.MeteredThreadPoolExecutor.shutdown",
         side_effect=RuntimeError,
     ) as mock_shutdown, patch(
         "homeassistant.core.HomeAssistant.async_run"
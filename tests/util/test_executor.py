@@ -1,13 +1,18 @@
 """Test Home Assistant executor util."""
 
 import concurrent.futures
+import functools
 import time
 from unittest.mock import patch
 
 import pytest
 
 from homeassistant.util import executor
-from homeassistant.util.executor import InterruptibleThreadPoolExecutor
+from homeassistant.util.executor import (
+    ExecutorPools,
+    InterruptibleThreadPoolExecutor,
+    MeteredThreadPoolExecutor,
+)
 
 
 async def test_executor_shutdown_can_interrupt_threads(caplog):
@@ -89,3 +94,92 @@ async def test_overall_timeout_reached(caplog):
     assert finish - start < 1
 
     iexecutor.shutdown()
+
+
+async def test_metered_executor_statistics():
+    """Test the metered executor records the wait and run time of jobs."""
+    mexecutor = MeteredThreadPoolExecutor("test", max_workers=1)
+    futures = [mexecutor.submit(time.sleep, 0.05) for _ in range(3)]
+    concurrent.futures.wait(futures)
+
+    statistics = mexecutor.get_statistics()
+    mexecutor.shutdown()
+
+    assert statistics["name"] == "test"
+    assert statistics["max_workers"] == 1
+    assert statistics["submitted"] == 3
+    assert statistics["completed"] == 3
+    assert statistics["queue_depth"] == 0
+    assert statistics["active"] == 0
+    assert statistics["max_queue_depth"] >= 1
+    assert statistics["run_time_max"] >= 0.05
+    # The last job waited for the two before it
+    assert statistics["wait_time_max"] >= 0.1
+
+
+async def test_executor_pools_route_by_integration():
+    """Test jobs are routed to the pool of the integration defining them."""
+    pools = ExecutorPools()
+
+    def job():
+        """Do nothing."""
+
+    job.__module__ = "custom_components.slow.sensor"
+    assert pools.executor_for(job) is None
+
+    assert pools.configure({"io": (2, ["slow"]), "db": (1, ["recorder"])}) == []
+    io_pool = pools.pools["io"]
+    assert pools.executor_for(job) is io_pool
+    assert pools.executor_for(functools.partial(job)) is io_pool
+
+    job.__module__ = "homeassistant.components.light"
+    assert pools.executor_for(job) is None
+
+    # Pools that keep their size are kept
+    removed = pools.configure({"io": (2, ["light"])})
+    assert [pool.name for pool in removed] == ["db"]
+    assert pools.executor_for(job) is io_pool
+
+    removed[0].shutdown()
+    pools.shutdown()
+    assert pools.pools == {}
+    assert pools.executor_for(job) is None
+
+
+async def test_executor_pools_route_by_caller():
+    """Test jobs with a target outside integrations are routed by their caller."""
+    pools = ExecutorPools()
+    pools.configure({"io": (2, ["slow"])})
+    io_pool = pools.pools["io"]
+
+    def submit(target):
+        """Submit a job like the job helpers of Home Assistant do."""
+        return pools.executor_for(target)
+
+    def define(module, source, submit):
+        """Define a function in the namespace of a module."""
+        namespace = {"__name__": module, "submit": submit, "target": time.sleep}
+        exec(  # pylint: disable=exec-used
+            compile(source, module, "exec"),
+            namespace,
+        )
+        return namespace["call"]
+
+    def submit_from(module, submit=submit):
+        """Submit a library function from code that belongs to a module."""
+        return define(module, "def call():\n    return submit(target)\n", submit)()
+
+    def submit_through_helper_from(module):
+        """Submit a library function through a job helper of the core."""
+        helper = define(
+            "homeassistant.core", "def call(job):\n    return submit(job)\n", submit
+        )
+        return submit_from(module, helper)
+
+    assert submit(time.sleep) is None
+    assert submit_from("custom_components.slow.sensor") is io_pool
+    assert submit_from("homeassistant.components.light") is None
+    assert submit_through_helper_from("custom_components.slow.sensor") is io_pool
+    assert submit_through_helper_from("homeassistant.components.light") is None
+
+    pools.shutdown()
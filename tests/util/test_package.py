@@ -6,6 +6,7 @@ from subprocess import PIPE
 import sys
 from unittest.mock import MagicMock, call, patch
 
+from packaging.utils import canonicalize_name
 import pkg_resources
 import pytest
 
@@ -263,21 +264,32 @@ def test_check_package_zip():
     assert not package.is_installed(TEST_ZIP_REQ)
 
 
-def test_get_distribution_falls_back_to_version():
-    """Test for get_distribution failing and fallback to version."""
+def test_check_package_uses_installed_versions_index(mock_popen, mock_venv):
+    """Test installed versions are read once and cleared after an install."""
     first_package = list(pkg_resources.working_set)[0]
     installed_package = first_package.project_name
     installed_version = first_package.version
 
+    package.get_installed_versions.cache_clear()
     with patch(
-        "homeassistant.util.package.pkg_resources.get_distribution",
-        side_effect=pkg_resources.ExtractionError,
-    ):
+        "homeassistant.util.package.distributions",
+        wraps=package.distributions,
+    ) as mock_distributions:
         assert package.is_installed(installed_package)
         assert package.is_installed(f"{installed_package}=={installed_version}")
-        assert package.is_installed(f"{installed_package}>={installed_version}")
-        assert package.is_installed(f"{installed_package}<={installed_version}")
         assert not package.is_installed(f"{installed_package}<{installed_version}")
+        assert not package.is_installed("not-installed-package")
+        assert len(mock_distributions.mock_calls) == 1
+
+        assert package.install_package(TEST_NEW_REQ, False)
+        assert package.is_installed(installed_package)
+        assert len(mock_distributions.mock_calls) == 2
+
+
+def test_check_package_marker():
+    """Test a requirement not applying to the environment is met."""
+    assert package.is_installed('not-installed-package;python_version<"3"')
+    assert not package.is_installed('not-installed-package;python_version>="3"')
 
 
 def test_check_package_previous_failed_install():
@@ -287,8 +299,8 @@ def test_check_package_previous_failed_install():
     installed_version = first_package.version
 
     with patch(
-        "homeassistant.util.package.pkg_resources.get_distribution",
-        side_effect=pkg_resources.ExtractionError,
-    ), patch("homeassistant.util.package.version", return_value=None):
+        "homeassistant.util.package.get_installed_versions",
+        return_value={canonicalize_name(installed_package): None},
+    ):
         assert not package.is_installed(installed_package)
         assert not package.is_installed(f"{installed_package}=={installed_version}")
@@ -24,3 +24,44 @@ async def test_kill_process():
 
     with pytest.raises(OSError):
         os.kill(pid, 0)
+
+
+def _reverse(value):
+    """Reverse a value in a worker and return the worker's pid."""
+    return value[::-1], os.getpid()
+
+
+def _repeat(value, count):
+    """Repeat bytes in a worker."""
+    return value * count
+
+
+def test_process_pool_runs_jobs_in_workers():
+    """Test jobs run in worker processes and large buffers are shared."""
+    pool = process.ProcessPool(max_workers=1)
+    large = bytes(range(256)) * (process.SHARED_MEMORY_MIN_SIZE // 256)
+
+    try:
+        assert not pool.started
+        reversed_value, pid = pool.run(_reverse, b"abc")
+        assert pool.started
+        assert reversed_value == b"cba"
+        assert pid != os.getpid()
+
+        reversed_value, _ = pool.run(_reverse, large)
+        assert reversed_value == large[::-1]
+
+        assert pool.run(_repeat, large, 2) == large * 2
+    finally:
+        pool.shutdown()
+
+    assert not pool.started
+
+
+def test_process_pool_without_processes():
+    """Test jobs run in the calling thread when processes are not used."""
+    pool = process.ProcessPool()
+    pool.use_processes = False
+
+    assert pool.run(_reverse, b"abc") == (b"cba", os.getpid())
+    assert not pool.started
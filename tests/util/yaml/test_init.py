@@ -1,6 +1,7 @@
 """Test Home Assistant yaml loader."""
 import io
 import os
+import stat
 import unittest
 from unittest.mock import patch
 
@@ -445,3 +446,94 @@ def test_input():
     """Test loading inputs."""
     data = {"hello": yaml.Input("test_name")}
     assert yaml.parse_yaml(yaml.dump(data)) == data
+
+
+@pytest.mark.skipif(not yaml_loader.HAS_C_LOADER, reason="libyaml not available")
+def test_fast_loader_line_numbers():
+    """Test the fast loader records the same file and lines as the line loader."""
+    conf = "key:\n  - item\n  - nested:\n      value: 1\n"
+    fast = yaml_loader.FastSafeLoader(io.StringIO(conf))
+    slow = yaml_loader.SafeLineLoader(io.StringIO(conf))
+    fast_doc = fast.get_single_data()
+    slow_doc = slow.get_single_data()
+
+    assert fast_doc == slow_doc
+    assert fast_doc["key"].__line__ == slow_doc["key"].__line__ == 1
+    assert fast_doc["key"][1].__line__ == slow_doc["key"][1].__line__ == 2
+    assert fast_doc["key"][1]["nested"].__line__ == 3
+
+
+def test_parsed_cache(tmp_path):
+    """Test unchanged files are loaded from the parsed file cache."""
+    config_path = tmp_path / "sensors.yaml"
+    config_path.write_text("- name: Kitchen\n  unit: C\n")
+    cache_dir = tmp_path / "yaml_cache"
+
+    def load():
+        return yaml.load_yaml(str(config_path), None, yaml.ParsedYamlCache(cache_dir))
+
+    doc = load()
+    assert doc == [{"name": "Kitchen", "unit": "C"}]
+    (cache_path,) = cache_dir.iterdir()
+    assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+    assert stat.S_IMODE(cache_path.stat().st_mode) == 0o600
+
+    with patch.object(
+        yaml_loader, "_parse_yaml_with_loader", side_effect=AssertionError
+    ):
+        cached = load()
+    assert cached == doc
+    assert cached[0].__config_file__ == str(config_path)
+    assert cached[0].__line__ == 0
+
+    # Changed files invalidate the cache
+    config_path.write_text("- name: Kitchen\n  unit: F\n")
+    assert load() == [{"name": "Kitchen", "unit": "F"}]
+
+
+def test_parsed_cache_skips_includes_env_vars_and_secrets(tmp_path):
+    """Test files that include other files, environment variables or secrets are not cached."""
+    (tmp_path / "configuration.yaml").write_text(
+        "sensor: !include sensors.yaml\nhome: !env_var HOME\n"
+    )
+    (tmp_path / "sensors.yaml").write_text("- platform: template\n")
+    (tmp_path / "secret.yaml").write_text("name: !secret name\n")
+    (tmp_path / yaml.SECRET_YAML).write_text("name: Kitchen\n")
+    cache_dir = tmp_path / "yaml_cache"
+    parsed_cache = yaml.ParsedYamlCache(cache_dir)
+
+    doc = yaml.load_yaml(str(tmp_path / "configuration.yaml"), None, parsed_cache)
+    assert doc["sensor"] == [{"platform": "template"}]
+
+    doc = yaml.load_yaml(
+        str(tmp_path / "secret.yaml"), yaml.Secrets(tmp_path), parsed_cache
+    )
+    assert doc == {"name": "Kitchen"}
+
+    # Only the included file is cached
+    assert len(list(cache_dir.iterdir())) == 1
+    assert b"Kitchen" not in next(cache_dir.iterdir()).read_bytes()
+
+
+def test_parsed_cache_prune(tmp_path):
+    """Test the entries of removed files are pruned."""
+    kept_path = tmp_path / "kept.yaml"
+    kept_path.write_text("key: value\n")
+    removed_path = tmp_path / "removed.yaml"
+    removed_path.write_text("key: value\n")
+    cache_dir = tmp_path / "yaml_cache"
+    parsed_cache = yaml.ParsedYamlCache(cache_dir)
+
+    yaml.load_yaml(str(kept_path), None, parsed_cache)
+    yaml.load_yaml(str(removed_path), None, parsed_cache)
+    (cache_dir / "corrupt.pickle").write_bytes(b"not a pickle")
+    assert len(list(cache_dir.iterdir())) == 3
+
+    removed_path.unlink()
+    parsed_cache.prune()
+
+    assert len(list(cache_dir.iterdir())) == 1
+    with patch.object(
+        yaml_loader, "_parse_yaml_with_loader", side_effect=AssertionError
+    ):
+        assert yaml.load_yaml(str(kept_path), None, parsed_cache) == {"key": "value"}